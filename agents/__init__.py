@@ -0,0 +1,15 @@
+"""
+LangGraph Agent 팩토리
+
+"""
+
+from agents.checkpointer import load_thread
+from agents.factory import AGENT_RECURSION_LIMIT, clear_agent_cache, get_agent, get_checkpointer
+
+__all__ = [
+    "AGENT_RECURSION_LIMIT",
+    "get_agent",
+    "get_checkpointer",
+    "clear_agent_cache",
+    "load_thread",
+]
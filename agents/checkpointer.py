@@ -0,0 +1,332 @@
+"""SQLite 영속 체크포인터 (압축 직렬화 + 오래된 / 큰 스레드 정리).
+
+InMemorySaver는 Streamlit 프로세스가 재시작되면 모든 대화를 잃습니다. 이 체크포인터는
+대화 상태를 SQLite 파일 하나에 저장하므로, 같은 thread_id로 다시 접속하면 모델에 히스토리를
+다시 보내지 않고 이어서 대화할 수 있습니다.
+
+- SqliteSaver(동기 전용)에 비동기 메서드를 스레드 실행으로 추가 (agent.astream 에서 사용)
+- 체크포인트 / 쓰기 값은 1KB 이상이면 zlib으로 압축 (타입 태그에 "+zlib" 표시, 기존 행과 호환)
+- thread_activity 테이블에 스레드별 마지막 갱신 시각을 기록하고,
+  CHECKPOINT_PRUNE_EVERY 번 저장할 때마다 백그라운드에서 정리:
+    1. 스레드별 최근 CHECKPOINT_KEEP_PER_THREAD 개 체크포인트만 유지 (각 체크포인트가 전체 상태를 가짐)
+    2. CHECKPOINT_MAX_AGE_DAYS 동안 갱신되지 않은 스레드 삭제
+    3. 전체 크기가 CHECKPOINT_MAX_MB 를 넘으면 오래된 스레드부터 삭제
+
+환경 변수:
+    CHECKPOINT_BACKEND: sqlite (기본) | memory
+    CHECKPOINT_DB_PATH: SQLite 파일 경로 (기본 .cache/checkpoints.sqlite3)
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+from typing import Any
+
+from langchain_core.messages import AnyMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from utils.cache import DEFAULT_CACHE_DIR
+
+CHECKPOINT_BACKEND = os.getenv("CHECKPOINT_BACKEND", "sqlite")
+CHECKPOINT_DB_PATH = os.getenv("CHECKPOINT_DB_PATH", str(DEFAULT_CACHE_DIR / "checkpoints.sqlite3"))
+# 0이면 해당 정리 비활성화
+CHECKPOINT_MAX_AGE_DAYS = float(os.getenv("CHECKPOINT_MAX_AGE_DAYS", "30")) or None
+CHECKPOINT_MAX_MB = float(os.getenv("CHECKPOINT_MAX_MB", "200")) or None
+CHECKPOINT_KEEP_PER_THREAD = int(os.getenv("CHECKPOINT_KEEP_PER_THREAD", "2"))
+CHECKPOINT_PRUNE_EVERY = int(os.getenv("CHECKPOINT_PRUNE_EVERY", "200"))
+
+COMPRESSED_SUFFIX = "+zlib"
+
+_ACTIVITY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS thread_activity (
+    thread_id TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS thread_activity_updated_at ON thread_activity (updated_at);
+"""
+
+
+class CompressedSerializer(SerializerProtocol):
+    """JsonPlusSerializer + zlib (min_size 바이트 이상인 값만 압축)"""
+
+    def __init__(self, serde: SerializerProtocol | None = None, min_size: int = 1024, level: int = 6):
+        self.serde = serde or JsonPlusSerializer()
+        self.min_size = min_size
+        self.level = level
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(obj)
+        if len(data) < self.min_size:
+            return type_, data
+
+        compressed = zlib.compress(data, self.level)
+        if len(compressed) >= len(data):
+            return type_, data
+        return type_ + COMPRESSED_SUFFIX, compressed
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_.endswith(COMPRESSED_SUFFIX):
+            return self.serde.loads_typed((type_.removesuffix(COMPRESSED_SUFFIX), zlib.decompress(payload)))
+        return self.serde.loads_typed(data)
+
+
+class SqliteCheckpointer(SqliteSaver):
+    """비동기 메서드 + 스레드 활동 기록 + 정리 기능을 가진 SqliteSaver"""
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        serde: SerializerProtocol | None = None,
+        max_age_days: float | None = CHECKPOINT_MAX_AGE_DAYS,
+        max_bytes: int | None = int(CHECKPOINT_MAX_MB * 1024 * 1024) if CHECKPOINT_MAX_MB else None,
+        keep_per_thread: int = CHECKPOINT_KEEP_PER_THREAD,
+        prune_every: int = CHECKPOINT_PRUNE_EVERY,
+    ):
+        """
+        Args:
+            conn: SQLite 연결 (check_same_thread=False)
+            serde: 직렬화기 (기본: CompressedSerializer)
+            max_age_days: 이 기간 동안 갱신되지 않은 스레드 삭제 (None이면 비활성화)
+            max_bytes: 체크포인트 / 쓰기 총 크기 상한 (None이면 비활성화)
+            keep_per_thread: 스레드별로 유지할 최근 체크포인트 수
+            prune_every: 저장 N번마다 백그라운드 정리 (0이면 자동 정리 안 함)
+        """
+        super().__init__(conn, serde=serde or CompressedSerializer())
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+        self.keep_per_thread = max(1, keep_per_thread)
+        self.prune_every = prune_every
+
+        self._puts = 0
+        self._prune_lock = threading.Lock()
+
+    @classmethod
+    def from_path(cls, path: str | Path, **kwargs: Any) -> "SqliteCheckpointer":
+        """파일 경로로 생성 (상위 디렉터리 자동 생성, 프로세스 수명 동안 연결 유지)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        return cls(conn, **kwargs)
+
+    def setup(self) -> None:
+        # cursor()가 self.lock을 잡은 상태에서 호출하므로 여기서는 잠그지 않음
+        if self.is_setup:
+            return
+        # 새 파일에서만 적용됨 (정리 후 incremental_vacuum으로 파일 크기 반환)
+        self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        super().setup()
+        self.conn.executescript(_ACTIVITY_SCHEMA)
+
+    # ---------- 동기 ----------
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        with self.cursor() as cur:
+            cur.execute(
+                "INSERT INTO thread_activity (thread_id, updated_at) VALUES (?, ?) "
+                "ON CONFLICT(thread_id) DO UPDATE SET updated_at = excluded.updated_at",
+                (str(config["configurable"]["thread_id"]), time.time()),
+            )
+        self._maybe_prune()
+        return next_config
+
+    def delete_thread(self, thread_id: str) -> None:
+        super().delete_thread(thread_id)
+        with self.cursor() as cur:
+            cur.execute("DELETE FROM thread_activity WHERE thread_id = ?", (str(thread_id),))
+
+    # ---------- 비동기 (agent.astream) ----------
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(lambda: list(self.list(config, filter=filter, before=before, limit=limit)))
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    # ---------- 정리 ----------
+
+    def _maybe_prune(self) -> None:
+        if self.prune_every <= 0:
+            return
+        with self._prune_lock:
+            self._puts += 1
+            if self._puts % self.prune_every:
+                return
+        threading.Thread(target=self.prune, name="checkpoint-prune", daemon=True).start()
+
+    def size_bytes(self) -> int:
+        """체크포인트 + 쓰기 값의 총 크기 (바이트)"""
+        with self.cursor(transaction=False) as cur:
+            cur.execute(
+                "SELECT (SELECT COALESCE(SUM(LENGTH(checkpoint) + LENGTH(metadata)), 0) FROM checkpoints)"
+                " + (SELECT COALESCE(SUM(LENGTH(value)), 0) FROM writes)"
+            )
+            return int(cur.fetchone()[0])
+
+    def _trim_history(self) -> int:
+        """스레드별 최근 keep_per_thread 개를 제외한 체크포인트와 그 쓰기 삭제"""
+        with self.cursor() as cur:
+            cur.execute(
+                """
+                DELETE FROM checkpoints WHERE rowid IN (
+                    SELECT rowid FROM (
+                        SELECT rowid, ROW_NUMBER() OVER (
+                            PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+                        ) AS position
+                        FROM checkpoints
+                    ) WHERE position > ?
+                )
+                """,
+                (self.keep_per_thread,),
+            )
+            deleted = cur.rowcount
+            cur.execute(
+                """
+                DELETE FROM writes WHERE NOT EXISTS (
+                    SELECT 1 FROM checkpoints c
+                    WHERE c.thread_id = writes.thread_id
+                      AND c.checkpoint_ns = writes.checkpoint_ns
+                      AND c.checkpoint_id = writes.checkpoint_id
+                )
+                """
+            )
+        return deleted
+
+    def _expired_threads(self) -> list[str]:
+        if self.max_age_days is None:
+            return []
+        cutoff = time.time() - self.max_age_days * 86400
+        with self.cursor(transaction=False) as cur:
+            cur.execute("SELECT thread_id FROM thread_activity WHERE updated_at < ?", (cutoff,))
+            return [row[0] for row in cur.fetchall()]
+
+    def _threads_over_budget(self) -> list[str]:
+        """크기 상한을 넘으면 오래된 스레드부터, 상한 아래로 내려갈 때까지의 목록"""
+        if self.max_bytes is None:
+            return []
+        total = self.size_bytes()
+        if total <= self.max_bytes:
+            return []
+
+        with self.cursor(transaction=False) as cur:
+            cur.execute(
+                """
+                SELECT a.thread_id,
+                       COALESCE((SELECT SUM(LENGTH(checkpoint) + LENGTH(metadata))
+                                 FROM checkpoints c WHERE c.thread_id = a.thread_id), 0)
+                     + COALESCE((SELECT SUM(LENGTH(value)) FROM writes w WHERE w.thread_id = a.thread_id), 0)
+                FROM thread_activity a
+                ORDER BY a.updated_at
+                """
+            )
+            rows = cur.fetchall()
+
+        victims = []
+        for thread_id, size in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append(thread_id)
+            total -= size
+        return victims
+
+    def prune(self) -> dict[str, int]:
+        """오래된 체크포인트 / 스레드 정리
+
+        Returns:
+            {"checkpoints": 삭제된 이전 체크포인트 수, "threads": 삭제된 스레드 수, "bytes": 정리 후 크기}
+        """
+        try:
+            trimmed = self._trim_history()
+            threads = list(dict.fromkeys(self._expired_threads()))
+            for thread_id in threads:
+                self.delete_thread(thread_id)
+
+            over_budget = [t for t in self._threads_over_budget() if t not in threads]
+            for thread_id in over_budget:
+                self.delete_thread(thread_id)
+            threads.extend(over_budget)
+
+            with self.cursor() as cur:
+                cur.execute("PRAGMA incremental_vacuum")
+
+            size = self.size_bytes()
+            if trimmed or threads:
+                print(f"🧹 체크포인트 정리: 이전 체크포인트 {trimmed}개, 스레드 {len(threads)}개 삭제 ({size / 1024:.0f}KB)")
+            return {"checkpoints": trimmed, "threads": len(threads), "bytes": size}
+        except sqlite3.Error as e:
+            print(f"⚠️ 체크포인트 정리 실패: {e}")
+            return {"checkpoints": 0, "threads": 0, "bytes": -1}
+
+
+def create_checkpointer() -> SqliteCheckpointer | None:
+    """CHECKPOINT_BACKEND 설정에 따른 SQLite 체크포인터 (memory면 None → InMemorySaver 사용)"""
+    if CHECKPOINT_BACKEND == "memory":
+        return None
+
+    checkpointer = SqliteCheckpointer.from_path(CHECKPOINT_DB_PATH)
+    # 시작 시 한 번 정리 (지난 실행에서 쌓인 오래된 스레드)
+    checkpointer.prune()
+    print(f"💾 체크포인터: {CHECKPOINT_DB_PATH}")
+    return checkpointer
+
+
+def load_thread(checkpointer: BaseCheckpointSaver, thread_id: str) -> tuple[list[AnyMessage], dict[str, Any]]:
+    """스레드의 최신 체크포인트에서 (메시지 목록, 체크포인트 메타데이터) 조회 (없으면 빈 값)"""
+    checkpoint_tuple = checkpointer.get_tuple({"configurable": {"thread_id": thread_id}})
+    if checkpoint_tuple is None:
+        return [], {}
+    messages = checkpoint_tuple.checkpoint.get("channel_values", {}).get("messages", [])
+    return list(messages), dict(checkpoint_tuple.metadata or {})
@@ -0,0 +1,123 @@
+"""Agent 팩토리: (모델, 툴 세트, 미들웨어 스택, 컨텍스트 스키마, 체크포인터) 조합별로 한 번만 컴파일.
+
+Streamlit은 메시지마다 페이지 스크립트를 재실행하지만, 이 모듈은 프로세스에 한 번만
+import 되므로 모듈 레벨 캐시가 rerun 및 세션 간에 공유됩니다.
+세션별 상태는 체크포인터의 thread_id로만 구분합니다.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+
+from langchain.agents import create_agent
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+from agents.checkpointer import create_checkpointer
+
+# 조합 수가 많지 않으므로 작은 LRU로 충분
+MAX_CACHED_AGENTS = 8
+
+# 턴당 최대 슈퍼스텝 수 (astream config의 recursion_limit)
+# 미들웨어 노드가 모델 호출마다 스텝을 더하므로 LangGraph 기본값 25로는 도구 스텝 4번이면 초과
+AGENT_RECURSION_LIMIT = int(os.getenv("AGENT_RECURSION_LIMIT", "100"))
+
+_agents: OrderedDict[tuple, Any] = OrderedDict()
+_lock = threading.Lock()
+_checkpointer: BaseCheckpointSaver | None = None
+
+
+def get_checkpointer() -> BaseCheckpointSaver:
+    """프로세스 전역 체크포인터 (세션은 thread_id로 구분)
+
+    기본은 SQLite 파일(agents.checkpointer)이라 프로세스 재시작 후에도 대화가 유지됩니다.
+    CHECKPOINT_BACKEND=memory 이면 InMemorySaver를 사용합니다.
+    """
+    global _checkpointer
+    with _lock:
+        if _checkpointer is None:
+            _checkpointer = create_checkpointer() or InMemorySaver()
+        return _checkpointer
+
+
+def _model_key(model: Any) -> str:
+    name = getattr(model, "model", None) or getattr(model, "model_name", None)
+    return f"{type(model).__name__}:{name}" if name else f"{type(model).__name__}@{id(model)}"
+
+
+def _middleware_key(middleware: Any) -> tuple[str, int]:
+    # 같은 클래스라도 설정이 다른 인스턴스는 다른 Agent이므로 인스턴스 식별자 포함
+    # (캐시된 Agent가 인스턴스를 참조하므로 캐시에 있는 동안 id가 재사용되지 않음)
+    return (getattr(middleware, "name", type(middleware).__name__), id(middleware))
+
+
+def build_agent_key(
+    model: Any,
+    tools: Sequence[Any],
+    middleware: Sequence[Any],
+    context_schema: type | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
+) -> tuple:
+    """캐시 키: (모델, 툴 이름 목록, 미들웨어 (이름, 인스턴스) 목록, 컨텍스트 스키마, 체크포인터)
+
+    툴 세트는 순서와 무관하고, 미들웨어는 실행 순서가 의미를 가지므로 순서를 유지합니다.
+    컴파일된 그래프는 체크포인터와 컨텍스트 스키마에 묶이므로 둘 다 키에 포함합니다.
+    """
+    tool_names = tuple(sorted(getattr(t, "name", repr(t)) for t in tools))
+    middleware_keys = tuple(_middleware_key(m) for m in middleware)
+    checkpointer_key = id(checkpointer) if checkpointer is not None else None
+    return (_model_key(model), tool_names, middleware_keys, context_schema, checkpointer_key)
+
+
+def get_agent(
+    model: Any,
+    tools: Sequence[Any],
+    middleware: Sequence[Any] = (),
+    context_schema: type | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
+) -> Any:
+    """컴파일된 Agent 반환 (조합별 캐싱)
+
+    Args:
+        model: LangChain 채팅 모델
+        tools: 툴 목록
+        middleware: 미들웨어 목록 (순서 유지)
+        context_schema: 런타임 컨텍스트 스키마
+        checkpointer: 체크포인터 (기본: get_checkpointer())
+
+    Returns:
+        컴파일된 LangGraph Agent
+    """
+    checkpointer = checkpointer or get_checkpointer()
+    key = build_agent_key(model, tools, middleware, context_schema, checkpointer)
+
+    with _lock:
+        agent = _agents.get(key)
+        if agent is not None:
+            _agents.move_to_end(key)
+            return agent
+
+    agent = create_agent(
+        model=model,
+        tools=list(tools),
+        middleware=list(middleware),
+        checkpointer=checkpointer,
+        context_schema=context_schema,
+    )
+    print(f"🔨 Agent 컴파일 완료: tools={list(key[1])}")
+
+    with _lock:
+        # 동시에 컴파일된 경우 먼저 등록된 인스턴스를 사용
+        agent = _agents.setdefault(key, agent)
+        _agents.move_to_end(key)
+        while len(_agents) > MAX_CACHED_AGENTS:
+            _agents.popitem(last=False)
+    return agent
+
+
+def clear_agent_cache() -> None:
+    """컴파일된 Agent 캐시 초기화 (툴/미들웨어 코드 변경 후 재컴파일용)"""
+    with _lock:
+        _agents.clear()
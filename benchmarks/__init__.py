@@ -0,0 +1,6 @@
+"""
+오프라인 엔드투엔드 벤치마크
+
+외부 서비스 없이 도구 / 에이전트 스텝 / 전체 턴의 지연 시간과 처리량을 측정합니다.
+실행: python -m benchmarks
+"""
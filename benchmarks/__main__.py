@@ -0,0 +1,82 @@
+"""오프라인 엔드투엔드 벤치마크 실행.
+
+실행:
+    python -m benchmarks                                   # .benchmarks/report.json
+    python -m benchmarks --iterations 50 --concurrency 16
+    python -m benchmarks --model-latency 0.8 --embed-latency 0.15   # 실제 서비스 왕복 시간 흉내
+    python -m benchmarks --tools hybrid_search --scenarios multi_step
+    python -m benchmarks --compare .benchmarks/baseline.json  # p50 / p95 비교, 회귀 시 종료 코드 1
+
+외부 서비스(Upstage, Pinecone, FalkorDB, DDGS, Gemini)는 모두 프로세스 안의 대역으로 대체됩니다.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.environment import Latencies, install
+from benchmarks.report import compare_reports, write_report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="오프라인 엔드투엔드 벤치마크")
+    parser.add_argument("--output", type=Path, default=Path(".benchmarks/report.json"), help="리포트 경로")
+    parser.add_argument("--iterations", type=int, default=20, help="측정 반복 횟수")
+    parser.add_argument("--concurrency", type=int, default=8, help="처리량 측정 시 동시 실행 수")
+    parser.add_argument("--warm-turns", action="store_true", help="턴 측정 사이에 캐시를 비우지 않음")
+    parser.add_argument("--corpus-size", type=int, default=3000, help="합성 문서 수")
+    parser.add_argument("--dimension", type=int, default=4096, help="임베딩 차원")
+    parser.add_argument("--tools", nargs="*", default=None, help="측정할 도구 (기본: 전체)")
+    parser.add_argument("--scenarios", nargs="*", default=None, help="측정할 턴 시나리오 (기본: 전체)")
+    parser.add_argument("--compare", type=Path, default=None, help="비교할 기준 리포트")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀로 판단할 지연 증가 비율")
+    for name in ("embed", "vector", "graph", "web", "model"):
+        parser.add_argument(f"--{name}-latency", type=float, default=0.0, help=f"{name} 대역 지연 시간 (초)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    latencies = Latencies(
+        embed=args.embed_latency,
+        vector=args.vector_latency,
+        graph=args.graph_latency,
+        web=args.web_latency,
+        model=args.model_latency,
+    )
+    env = install(corpus_size=args.corpus_size, dimension=args.dimension, latencies=latencies)
+
+    # 대역 설치 후에 도구 / 에이전트 모듈 import
+    from benchmarks.runner import run_benchmarks
+
+    report = run_benchmarks(
+        env,
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        cold=not args.warm_turns,
+        tool_filter=args.tools,
+        scenario_filter=args.scenarios,
+    )
+    path = write_report(report, args.output)
+    print(f"✅ 리포트 저장: {path}")
+
+    for name, entry in report["turns"].items():
+        turn = entry["turn"]
+        print(f"  🔁 {name}: p50 {turn['p50_ms']}ms / p95 {turn['p95_ms']}ms, {entry['throughput']['per_second']} turns/s")
+
+    if args.compare is None:
+        return 0
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    rows = compare_reports(baseline, report, args.threshold)
+    regressions = [row for row in rows if row["regression"]]
+    for row in rows:
+        marker = "🔴" if row["regression"] else "  "
+        print(f"{marker} {row['key']}: {row['before']} → {row['after']} ({row['change']:+.1%})")
+    print(f"📊 비교 {len(rows)}개 항목, 회귀 {len(regressions)}개 (기준 +{args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
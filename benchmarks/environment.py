@@ -0,0 +1,147 @@
+"""벤치마크 실행 환경: 외부 서비스 대역 설치.
+
+도구 모듈은 import 시점에 `from main import get_upstage, ...` 로 Streamlit 캐시 리소스를 가져오므로,
+install()은 도구 / 미들웨어를 import 하기 전에 호출해야 합니다.
+
+1. 디스크 캐시 / 로그 설정을 임시 디렉터리와 벤치마크용 값으로 지정 (환경 변수)
+2. sys.modules["main"]에 대역 리소스를 가진 모듈을 등록 (Streamlit 페이지 실행 없음)
+3. utils.graph_db의 공유 클라이언트 자리에 FalkorDB 대역 설치
+4. tools.web_search의 DDGS를 대역으로 교체
+"""
+
+import os
+import sys
+import tempfile
+import types
+from dataclasses import dataclass, field
+from typing import Any
+
+from benchmarks.fakes import (
+    Corpus,
+    FakeAsyncFalkorDB,
+    FakeAsyncPineconeIndex,
+    FakeAsyncUpstage,
+    FakeDDGS,
+    FakeFalkorDB,
+    FakeGraph,
+    FakePineconeIndex,
+    FakeUpstage,
+    ScriptedChatModel,
+    build_corpus,
+)
+
+
+@dataclass
+class Latencies:
+    """대역별 인위적 지연 시간 (초) - 실제 서비스 왕복 시간을 흉내 낼 때 사용"""
+
+    embed: float = 0.0
+    vector: float = 0.0
+    graph: float = 0.0
+    web: float = 0.0
+    model: float = 0.0
+
+
+@dataclass
+class BenchmarkEnvironment:
+    """설치된 대역 (호출 수 확인 / 캐시 초기화용)"""
+
+    corpus: Corpus
+    latencies: Latencies
+    upstage: FakeUpstage
+    async_upstage: FakeAsyncUpstage
+    index: FakePineconeIndex
+    graph: FakeGraph
+    cache_dir: str
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def clear_caches(self) -> None:
+        """임베딩 / 웹 검색 / 그래프 쿼리 캐시 초기화 (콜드 측정용)"""
+        from tools.pinecone_search import embedding_cache
+        from tools.web_search import web_search_cache
+        from utils.graph_cache import clear_graph_cache
+
+        embedding_cache.clear()
+        web_search_cache.clear()
+        clear_graph_cache()
+
+    def backend_calls(self) -> dict[str, Any]:
+        """대역별 호출 수"""
+        return {
+            "upstage": self.upstage.embeddings.calls + self.async_upstage.embeddings.calls,
+            "pinecone": self.index.calls + self.extra["async_index"].calls,
+            "falkordb": dict(self.graph.calls),
+            "ddgs": FakeDDGS.calls,
+        }
+
+
+_installed: BenchmarkEnvironment | None = None
+
+
+def install(
+    corpus_size: int = 3000,
+    dimension: int = 4096,
+    latencies: Latencies | None = None,
+    cache_dir: str | None = None,
+) -> BenchmarkEnvironment:
+    """대역 설치 (프로세스당 한 번, 두 번째 호출부터는 설치된 환경 반환)"""
+    global _installed
+    if _installed is not None:
+        return _installed
+
+    latencies = latencies or Latencies()
+    cache_dir = cache_dir or tempfile.mkdtemp(prefix="mid_level_bench_")
+
+    # 1. 디스크 캐시는 임시 디렉터리로, 스텝 로그는 경고만, 외부 서비스를 쓰는 기능은 끔
+    os.environ["EMBEDDING_CACHE_PATH"] = os.path.join(cache_dir, "embeddings.sqlite3")
+    os.environ["DDGS_CACHE_PATH"] = os.path.join(cache_dir, "web_search.sqlite3")
+    os.environ["CHECKPOINT_DB_PATH"] = os.path.join(cache_dir, "checkpoints.sqlite3")
+    os.environ["VECTOR_STORE_BACKEND"] = "pinecone"
+    os.environ["GEMINI_CONTEXT_CACHE"] = "0"
+    os.environ["PROMPT_HOT_RELOAD"] = "0"
+    os.environ.setdefault("AGENT_LOG_LEVEL", "WARNING")
+    os.environ.pop("METRICS_PORT", None)
+
+    from utils import graph_db
+    from utils.vector_store import PineconeVectorStore
+
+    corpus = build_corpus(corpus_size, dimension)
+    upstage = FakeUpstage(dimension, latencies.embed)
+    async_upstage = FakeAsyncUpstage(dimension, latencies.embed)
+    index = FakePineconeIndex(corpus, latencies.vector)
+    async_index = FakeAsyncPineconeIndex(corpus, latencies.vector)
+    graph = FakeGraph(corpus, latencies.graph)
+
+    # 2. main 모듈 대역: 요약 미들웨어는 get_gemini() 모델을 사용하므로 요약문만 내는 모델을 반환
+    summary_model = ScriptedChatModel(model="scripted-summary", final_text="이전 대화 요약", latency=latencies.model)
+    fake_main = types.ModuleType("main")
+    fake_main.__dict__.update(
+        get_pinecone=index,
+        get_vector_store=PineconeVectorStore(index, "benchmark", async_index_factory=lambda: async_index),
+        get_upstage=upstage,
+        get_async_upstage=async_upstage,
+        get_gemini=lambda: summary_model,
+    )
+    sys.modules["main"] = fake_main
+
+    # 3. FalkorDB 공유 클라이언트 자리에 대역 설치 (get_graph / get_async_graph / 버전 스탬프가 그대로 동작)
+    graph_db._client = FakeFalkorDB(graph)  # type: ignore[assignment]
+    graph_db._async_client = FakeAsyncFalkorDB(graph)  # type: ignore[assignment]
+
+    # 4. DDGS 대역
+    from tools import web_search
+
+    FakeDDGS.latency = latencies.web
+    web_search.DDGS = FakeDDGS  # type: ignore[misc]
+
+    _installed = BenchmarkEnvironment(
+        corpus=corpus,
+        latencies=latencies,
+        upstage=upstage,
+        async_upstage=async_upstage,
+        index=index,
+        graph=graph,
+        cache_dir=cache_dir,
+        extra={"async_index": async_index, "summary_model": summary_model},
+    )
+    return _installed
@@ -0,0 +1,419 @@
+"""외부 서비스 대역 (Upstage / Pinecone / FalkorDB / DDGS / Gemini).
+
+모든 대역은 프로세스 안에서 결정적으로 동작하며, latency 인자로 네트워크 왕복 시간을
+흉내 낼 수 있습니다 (기본 0 → 순수 애플리케이션 오버헤드만 측정).
+
+- FakeUpstage / FakeAsyncUpstage: 텍스트 해시 시드 기반 결정적 임베딩 (embeddings.create)
+- FakePineconeIndex / FakeAsyncPineconeIndex: NumPy 행렬 정확 검색 (index.query)
+- FakeGraph / FakeFalkorDB: 합성 코퍼스 위에서 utils.graph_queries / utils.keyword_graph 쿼리에 응답
+- FakeDDGS: 쿼리별 고정 검색 결과 (DDGS().text)
+- ScriptedChatModel: 정해진 순서로 도구 호출 → 최종 답변을 내는 채팅 모델
+"""
+
+import asyncio
+import hashlib
+import itertools
+import time
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import Field
+
+from utils import graph_queries, keyword_graph
+
+CATEGORIES = ("성장통", "이직", "번아웃", "커리어", "기술 부채", "협업", "리더십", "연봉")
+KEYWORDS = (
+    "성장통", "이직", "번아웃", "재택근무", "코드 리뷰", "기술 부채", "연봉 협상", "사이드 프로젝트",
+    "레거시", "리팩토링", "테스트", "온보딩", "멘토링", "스타트업", "대기업", "팀 리드",
+    "면접", "포트폴리오", "클라우드", "쿠버네티스", "마이크로서비스", "데이터 파이프라인", "프론트엔드", "백엔드",
+    "야근", "슬럼프", "자기계발", "컨퍼런스", "오픈소스", "알고리즘", "시스템 설계", "커뮤니케이션",
+)  # fmt: skip
+SOURCES = ("okky", "career.ly", "velog", "blind")
+
+
+def _sleep(seconds: float) -> None:
+    if seconds > 0:
+        time.sleep(seconds)
+
+
+async def _asleep(seconds: float) -> None:
+    if seconds > 0:
+        await asyncio.sleep(seconds)
+
+
+# ---------- 코퍼스 ----------
+
+
+@dataclass
+class Corpus:
+    """합성 문서 코퍼스 (벡터 인덱스와 그래프가 같은 문서를 공유)"""
+
+    documents: list[dict[str, Any]]
+    vectors: np.ndarray  # float32[N, dim], 행 단위 정규화
+
+    @property
+    def dimension(self) -> int:
+        return int(self.vectors.shape[1])
+
+
+def deterministic_embedding(text: str, dimension: int) -> np.ndarray:
+    """텍스트 → 정규화된 float32 벡터 (같은 텍스트는 항상 같은 벡터)"""
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+    vector = np.random.default_rng(seed).standard_normal(dimension).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def build_corpus(size: int = 3000, dimension: int = 4096, seed: int = 42) -> Corpus:
+    """키워드 2~4개씩 가진 합성 문서 코퍼스
+
+    문서 벡터는 키워드 벡터의 합 + 잡음이므로 같은 키워드를 가진 쿼리가 실제로 가까운 문서를 찾습니다.
+    """
+    rng = np.random.default_rng(seed)
+    keyword_vectors = {keyword: deterministic_embedding(keyword, dimension) for keyword in KEYWORDS}
+
+    documents = []
+    vectors = np.empty((size, dimension), dtype=np.float32)
+    for i in range(size):
+        keywords = [str(k) for k in rng.choice(KEYWORDS, size=int(rng.integers(2, 5)), replace=False)]
+        category = CATEGORIES[i % len(CATEGORIES)]
+        documents.append(
+            {
+                "id": f"doc-{i:05d}",
+                "title": f"{keywords[0]} 고민 #{i}",
+                "category": category,
+                "problem_summary": f"{', '.join(keywords)} 관련 중니어 개발자 고민 사례 {i}",
+                "keywords": ", ".join(keywords),
+                "source": SOURCES[i % len(SOURCES)],
+            }
+        )
+        vector = sum(keyword_vectors[k] for k in keywords) + 0.5 * rng.standard_normal(dimension).astype(np.float32)
+        vectors[i] = vector / np.linalg.norm(vector)
+
+    return Corpus(documents=documents, vectors=vectors)
+
+
+# ---------- Upstage (OpenAI 호환 임베딩) ----------
+
+
+class _FakeEmbeddings:
+    def __init__(self, dimension: int, latency: float):
+        self.dimension = dimension
+        self.latency = latency
+        self.calls = 0
+
+    def _response(self, input: Sequence[str]) -> SimpleNamespace:
+        self.calls += 1
+        data = [SimpleNamespace(embedding=deterministic_embedding(text, self.dimension).tolist()) for text in input]
+        return SimpleNamespace(data=data)
+
+    def create(self, input: Sequence[str], model: str = "") -> SimpleNamespace:
+        _sleep(self.latency)
+        return self._response(input)
+
+
+class _FakeAsyncEmbeddings(_FakeEmbeddings):
+    async def create(self, input: Sequence[str], model: str = "") -> SimpleNamespace:  # type: ignore[override]
+        await _asleep(self.latency)
+        return self._response(input)
+
+
+class FakeUpstage:
+    """OpenAI(base_url=upstage) 대역: client.embeddings.create(input=[...], model=...)"""
+
+    def __init__(self, dimension: int = 4096, latency: float = 0.0):
+        self.embeddings = _FakeEmbeddings(dimension, latency)
+
+
+class FakeAsyncUpstage:
+    """AsyncOpenAI 대역"""
+
+    def __init__(self, dimension: int = 4096, latency: float = 0.0):
+        self.embeddings = _FakeAsyncEmbeddings(dimension, latency)
+
+
+# ---------- Pinecone ----------
+
+
+class FakePineconeIndex:
+    """Pinecone Index 대역 (NumPy 내적 정확 검색, metadata 필터는 등호 조건만 지원)"""
+
+    def __init__(self, corpus: Corpus, latency: float = 0.0):
+        self.corpus = corpus
+        self.latency = latency
+        self.calls = 0
+
+    def _query(self, vector: list[float], top_k: int, filter: dict[str, Any] | None) -> SimpleNamespace:
+        self.calls += 1
+        scores = self.corpus.vectors @ np.asarray(vector, dtype=np.float32)
+        if filter:
+            mask = np.array([all(doc.get(k) == v for k, v in filter.items()) for doc in self.corpus.documents], dtype=bool)
+            scores = np.where(mask, scores, -np.inf)
+
+        top_k = min(top_k, len(scores))
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top])]
+        matches = [
+            SimpleNamespace(id=self.corpus.documents[i]["id"], score=float(scores[i]), metadata=self.corpus.documents[i])
+            for i in top
+            if np.isfinite(scores[i])
+        ]
+        return SimpleNamespace(matches=matches)
+
+    def query(
+        self,
+        namespace: str = "",
+        vector: list[float] | None = None,
+        top_k: int = 5,
+        include_metadata: bool = True,
+        filter: dict[str, Any] | None = None,
+    ) -> SimpleNamespace:
+        _sleep(self.latency)
+        return self._query(vector or [], top_k, filter)
+
+
+class FakeAsyncPineconeIndex(FakePineconeIndex):
+    """PineconeAsyncio IndexAsyncio 대역"""
+
+    async def query(  # type: ignore[override]
+        self,
+        namespace: str = "",
+        vector: list[float] | None = None,
+        top_k: int = 5,
+        include_metadata: bool = True,
+        filter: dict[str, Any] | None = None,
+    ) -> SimpleNamespace:
+        await _asleep(self.latency)
+        return self._query(vector or [], top_k, filter)
+
+
+# ---------- FalkorDB ----------
+
+
+class FakeGraph:
+    """FalkorDB Graph 대역.
+
+    utils.graph_queries / utils.keyword_graph 가 사용하는 쿼리 문자열에 코퍼스로 직접 응답하고,
+    알 수 없는 쿼리는 빈 결과를 반환합니다.
+    """
+
+    def __init__(self, corpus: Corpus, latency: float = 0.0):
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+        self.documents = corpus.documents
+
+        self.keyword_documents: dict[str, list[int]] = defaultdict(list)
+        weights: Counter[tuple[str, str]] = Counter()
+        for i, doc in enumerate(self.documents):
+            keywords = sorted({k.strip() for k in doc["keywords"].split(",")})
+            for keyword in keywords:
+                self.keyword_documents[keyword].append(i)
+            for a, b in itertools.combinations(keywords, 2):
+                weights[(a, b)] += 1
+
+        # 관계 id 순서의 엣지 목록 (스냅샷 페이지네이션용)과 무방향 인접 리스트
+        self.edges = [(rid, a, b, w) for rid, ((a, b), w) in enumerate(sorted(weights.items()))]
+        self.adjacency: dict[str, list[tuple[str, int]]] = defaultdict(list)
+        for _, a, b, w in self.edges:
+            self.adjacency[a].append((b, w))
+            self.adjacency[b].append((a, w))
+        for neighbors in self.adjacency.values():
+            neighbors.sort(key=lambda item: (-item[1], item[0]))
+
+        self._handlers = {
+            graph_queries.SEARCH_DOCUMENTS_QUERY: self._search_documents,
+            graph_queries.RELATED_KEYWORDS_QUERY: self._related_keywords,
+            graph_queries.NETWORK_HOP_QUERY: self._network_hop,
+            keyword_graph._KEYWORD_QUERY: self._keywords,
+            keyword_graph._EDGE_PAGE_QUERY: self._edge_page,
+        }
+
+    def _search_documents(self, params: dict[str, Any]) -> list[list[Any]]:
+        matched: dict[int, list[str]] = defaultdict(list)
+        for keyword in dict.fromkeys(params["keywords"]):
+            for i in self.keyword_documents.get(keyword, []):
+                matched[i].append(keyword)
+
+        ranked = sorted(matched.items(), key=lambda item: (-len(item[1]), item[0]))[: params["limit"]]
+        rows = []
+        for i, keywords in ranked:
+            doc = self.documents[i]
+            rows.append(
+                [doc["id"], doc["title"], doc["category"], doc["problem_summary"], doc["source"], keywords, len(keywords)]
+            )
+        return rows
+
+    def _related_keywords(self, params: dict[str, Any]) -> list[list[Any]]:
+        neighbors = self.adjacency.get(params["keyword"], [])[: params["limit"]]
+        return [[name, weight, len(self.keyword_documents.get(name, []))] for name, weight in neighbors]
+
+    def _network_hop(self, params: dict[str, Any]) -> list[list[Any]]:
+        rows = []
+        visited = set(params["visited"])
+        for name in params["frontier"]:
+            neighbors = [(n, w) for n, w in self.adjacency.get(name, []) if w >= params["min_weight"] and n not in visited]
+            rows.extend([name, n, w] for n, w in neighbors[: params["top_k"]])
+        return rows
+
+    def _keywords(self, params: dict[str, Any]) -> list[list[Any]]:
+        return [[name, len(docs)] for name, docs in self.keyword_documents.items()]
+
+    def _edge_page(self, params: dict[str, Any]) -> list[list[Any]]:
+        rows = [[rid, a, b, w] for rid, a, b, w in self.edges if rid > params["after"]]
+        return rows[: params["limit"]]
+
+    def _execute(self, query: str, params: dict[str, Any] | None) -> SimpleNamespace:
+        handler = self._handlers.get(query)
+        self.calls[handler.__name__ if handler else "unknown"] += 1
+        return SimpleNamespace(result_set=handler(params or {}) if handler else [])
+
+    def query(self, query: str, params: dict[str, Any] | None = None) -> SimpleNamespace:
+        _sleep(self.latency)
+        return self._execute(query, params)
+
+
+class FakeAsyncGraph:
+    """falkordb.asyncio Graph 대역 (같은 FakeGraph 데이터 공유)"""
+
+    def __init__(self, graph: FakeGraph):
+        self.graph = graph
+
+    async def query(self, query: str, params: dict[str, Any] | None = None) -> SimpleNamespace:
+        await _asleep(self.graph.latency)
+        return self.graph._execute(query, params)
+
+
+class FakeConnection:
+    """Redis 커넥션 대역 (그래프 버전 스탬프용 get / incr / ping)"""
+
+    def __init__(self):
+        self.values: dict[str, int] = {}
+
+    def ping(self) -> bool:
+        return True
+
+    def get(self, key: str) -> bytes | None:
+        value = self.values.get(key)
+        return str(value).encode() if value is not None else None
+
+    def incr(self, key: str) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+
+class FakeFalkorDB:
+    """FalkorDB 클라이언트 대역 (utils.graph_db._client 자리에 설치)"""
+
+    def __init__(self, graph: FakeGraph):
+        self.graph = graph
+        self.connection = FakeConnection()
+
+    def select_graph(self, graph_name: str) -> FakeGraph:
+        return self.graph
+
+
+class FakeAsyncFalkorDB:
+    """비동기 FalkorDB 클라이언트 대역 (utils.graph_db._async_client 자리에 설치)"""
+
+    def __init__(self, graph: FakeGraph):
+        self.graph = FakeAsyncGraph(graph)
+
+    def select_graph(self, graph_name: str) -> FakeAsyncGraph:
+        return self.graph
+
+
+# ---------- DDGS ----------
+
+
+class FakeDDGS:
+    """DDGS 대역: 쿼리 / 페이지별 고정 결과 10건 (tools.web_search.DDGS 자리에 설치)"""
+
+    latency: float = 0.0
+    calls: int = 0
+
+    def text(
+        self,
+        query: str,
+        region: str = "kr-kr",
+        max_results: int = 10,
+        page: int = 1,
+        backend: str = "auto",
+    ) -> list[dict[str, str]]:
+        _sleep(FakeDDGS.latency)
+        FakeDDGS.calls += 1
+        return [
+            {
+                "title": f"{query} - 검색 결과 {page}-{i}",
+                "body": f"{query}에 대한 글 요약입니다. " * 5,
+                "href": f"https://example.com/{page}/{i}",
+            }
+            for i in range(max_results)
+        ]
+
+
+# ---------- Gemini ----------
+
+
+class ScriptedChatModel(BaseChatModel):
+    """정해진 스텝대로 도구를 호출하고 마지막에 최종 답변을 내는 채팅 모델.
+
+    script[i]는 현재 사용자 턴의 i번째 모델 호출이 낼 도구 호출 목록입니다
+    ({"name", "args"}, 한 스텝에 여러 개면 병렬 도구 호출). 스텝을 모두 쓰면 final_text로 답합니다.
+    """
+
+    model: str = "scripted"
+    script: list[list[dict[str, Any]]] = Field(default_factory=list)
+    final_text: str = "상담 답변입니다."
+    latency: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-fake"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "ScriptedChatModel":
+        # 도구 호출은 script가 결정하므로 도구 스키마는 필요 없음
+        return self
+
+    def _next_message(self, messages: list[AnyMessage]) -> AIMessage:
+        step = 0
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                break
+            if isinstance(message, AIMessage):
+                step += 1
+
+        input_tokens = sum(len(str(m.content)) for m in messages) // 4
+        if step < len(self.script):
+            tool_calls = [
+                {"name": call["name"], "args": call["args"], "id": f"call_{step}_{i}"} for i, call in enumerate(self.script[step])
+            ]
+            content, output_tokens = "", 20 * len(tool_calls)
+        else:
+            tool_calls = []
+            content, output_tokens = self.final_text, len(self.final_text) // 4
+
+        return AIMessage(
+            content=content,
+            tool_calls=tool_calls,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
+
+    def _generate(self, messages: list[AnyMessage], stop: Any = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        _sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._next_message(messages))])
+
+    async def _agenerate(
+        self, messages: list[AnyMessage], stop: Any = None, run_manager: Any = None, **kwargs: Any
+    ) -> ChatResult:
+        await _asleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._next_message(messages))])
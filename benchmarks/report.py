@@ -0,0 +1,65 @@
+"""벤치마크 리포트: 표본 통계, JSON 저장, 커밋 간 비교"""
+
+import json
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from utils.metrics import percentile
+
+REPORT_VERSION = 1
+
+
+def summarize(samples: Sequence[float]) -> dict[str, Any]:
+    """초 단위 표본 → 밀리초 통계 (count, mean, min, p50, p95, p99, max)"""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0}
+
+    def ms(value: float) -> float:
+        return round(value * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": ms(sum(ordered) / len(ordered)),
+        "min_ms": ms(ordered[0]),
+        "p50_ms": ms(percentile(ordered, 0.50)),
+        "p95_ms": ms(percentile(ordered, 0.95)),
+        "p99_ms": ms(percentile(ordered, 0.99)),
+        "max_ms": ms(ordered[-1]),
+    }
+
+
+def write_report(report: dict[str, Any], path: str | Path) -> Path:
+    """커밋 간 diff가 쉽도록 키 정렬 + 들여쓰기 JSON으로 저장"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def _latency_rows(report: dict[str, Any]) -> dict[str, float]:
+    """비교 대상 값: {"tools.hybrid_search.sync_cold.p50_ms": 1.2, ...}"""
+    rows = {}
+    for section in ("tools", "turns"):
+        for name, entry in report.get(section, {}).items():
+            for kind, stats in entry.items():
+                groups = stats.items() if kind == "steps" else [(kind, stats)]
+                for label, values in groups:
+                    if not isinstance(values, dict):
+                        continue
+                    for metric in ("p50_ms", "p95_ms"):
+                        if metric in values:
+                            rows[f"{section}.{name}.{label}.{metric}"] = values[metric]
+    return rows
+
+
+def compare_reports(baseline: dict[str, Any], current: dict[str, Any], threshold: float = 0.10) -> list[dict[str, Any]]:
+    """두 리포트의 p50 / p95 비교 (threshold 이상 느려진 항목은 regression=True)"""
+    before, after = _latency_rows(baseline), _latency_rows(current)
+    rows = []
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        change = (new - old) / old if old else 0.0
+        rows.append({"key": key, "before": old, "after": new, "change": round(change, 4), "regression": change >= threshold})
+    return rows
@@ -0,0 +1,248 @@
+"""벤치마크 측정 (도구 단독 / 에이전트 스텝 / 전체 턴).
+
+install()로 대역을 설치한 뒤에 import 해야 합니다 (도구 모듈이 main 리소스를 import 시점에 가져옴).
+"""
+
+import asyncio
+import platform
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, ModelResponse
+
+from agents import AGENT_RECURSION_LIMIT, get_agent
+from benchmarks.environment import BenchmarkEnvironment
+from benchmarks.fakes import ScriptedChatModel
+from benchmarks.report import REPORT_VERSION, summarize
+from benchmarks.scenarios import TOOL_CASES, TURN_SCENARIOS, ToolCase, TurnScenario
+from middleware.middleware import common_middlewares, dynamic_system_prompt
+from schemas import CareerLevel, JobRole, UserProfile
+from tools import chat_tools, ddgs_search, expert_search, hybrid_search, sementic_search
+from tools.graph_search import graph_keyword_search, graph_related_keywords
+from utils.aio import run_sync
+from utils.metrics import metrics
+
+TOOLS = {
+    tool.name: tool
+    for tool in (hybrid_search, sementic_search, graph_keyword_search, graph_related_keywords, ddgs_search, expert_search)
+}
+
+# pages/chatbot.py 와 같은 도구 구성
+AGENT_TOOLS = chat_tools
+
+BENCHMARK_PROFILE = UserProfile(
+    name="벤치마크",
+    career_level=CareerLevel.MID,
+    years_of_experience=4,
+    job_role=JobRole.BACKEND,
+    tech_stack=["python", "fastapi", "aws"],
+)
+
+
+class StepTimer(AgentMiddleware):
+    """에이전트 안에서 모델 스텝 / 도구 실행 시간을 표본으로 수집하는 미들웨어 (가장 바깥에 배치)"""
+
+    def __init__(self):
+        super().__init__()
+        self.samples: dict[str, list[float]] = defaultdict(list)
+
+    def reset(self) -> None:
+        self.samples = defaultdict(list)
+
+    def wrap_model_call(self, request: ModelRequest, handler: Any) -> ModelResponse:
+        start = time.perf_counter()
+        try:
+            return handler(request)
+        finally:
+            self.samples["model"].append(time.perf_counter() - start)
+
+    async def awrap_model_call(self, request: ModelRequest, handler: Any) -> ModelResponse:
+        start = time.perf_counter()
+        try:
+            return await handler(request)
+        finally:
+            self.samples["model"].append(time.perf_counter() - start)
+
+    def wrap_tool_call(self, request: Any, handler: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return handler(request)
+        finally:
+            self.samples[f"tool:{request.tool_call['name']}"].append(time.perf_counter() - start)
+
+    async def awrap_tool_call(self, request: Any, handler: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await handler(request)
+        finally:
+            self.samples[f"tool:{request.tool_call['name']}"].append(time.perf_counter() - start)
+
+
+# ---------- 도구 단독 ----------
+
+
+def _time_calls(call: Callable[[], Any], iterations: int, before: Callable[[], None] | None = None) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _throughput(make_call: Callable[[], Any], concurrency: int, rounds: int) -> dict[str, Any]:
+    """concurrency개 코루틴을 동시에 실행하는 라운드를 반복해 초당 처리량 측정"""
+
+    async def run_round() -> None:
+        await asyncio.gather(*(make_call() for _ in range(concurrency)))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        run_sync(run_round())
+    elapsed = time.perf_counter() - start
+    total = concurrency * rounds
+    return {"concurrency": concurrency, "calls": total, "seconds": round(elapsed, 4), "per_second": round(total / elapsed, 2)}
+
+
+def bench_tool(env: BenchmarkEnvironment, case: ToolCase, iterations: int, concurrency: int) -> dict[str, Any]:
+    """도구 하나의 콜드(캐시 비움) / 웜 지연 시간, 동기 / 비동기, 동시 호출 처리량"""
+    tool = TOOLS[case.tool]
+
+    def invoke() -> Any:
+        return tool.invoke(case.args)
+
+    def ainvoke() -> Any:
+        return run_sync(tool.ainvoke(case.args))
+
+    result = {
+        "args": case.args,
+        "sync_cold": summarize(_time_calls(invoke, iterations, env.clear_caches)),
+        "async_cold": summarize(_time_calls(ainvoke, iterations, env.clear_caches)),
+    }
+
+    invoke()  # 캐시 채우기
+    result["sync_warm"] = summarize(_time_calls(invoke, iterations))
+    result["async_warm"] = summarize(_time_calls(ainvoke, iterations))
+    result["throughput_warm"] = _throughput(lambda: tool.ainvoke(case.args), concurrency, max(1, iterations // 2))
+    return result
+
+
+# ---------- 에이전트 턴 ----------
+
+
+def build_agent(env: BenchmarkEnvironment, scenario: TurnScenario, timer: StepTimer) -> Any:
+    """시나리오 스크립트를 따르는 모델로 chatbot과 같은 미들웨어 / 도구 구성의 에이전트 생성"""
+    model = ScriptedChatModel(
+        model=f"scripted:{scenario.name}",
+        script=scenario.steps,
+        final_text=f"{scenario.name} 시나리오에 대한 상담 답변입니다. " * 4,
+        latency=env.latencies.model,
+    )
+    return get_agent(
+        model=model,
+        tools=AGENT_TOOLS,
+        middleware=[timer, dynamic_system_prompt, *common_middlewares],  # type: ignore[list-item]
+        context_schema=UserProfile,
+    )
+
+
+async def _run_turn(agent: Any, message: str) -> int:
+    """chatbot과 같은 스트림 모드로 턴 하나를 끝까지 소비 (이벤트 수 반환)"""
+    events = 0
+    config = {"configurable": {"thread_id": uuid.uuid4().hex}, "recursion_limit": AGENT_RECURSION_LIMIT}
+    async for _ in agent.astream(
+        {"messages": [{"role": "user", "content": message}]},
+        config,
+        context=BENCHMARK_PROFILE,
+        stream_mode=["messages", "updates", "custom"],
+    ):
+        events += 1
+    return events
+
+
+def bench_turn(
+    env: BenchmarkEnvironment, scenario: TurnScenario, iterations: int, concurrency: int, cold: bool
+) -> dict[str, Any]:
+    """시나리오 하나의 전체 턴 지연 시간 + 스텝별 지연 시간 + 동시 턴 처리량"""
+    timer = StepTimer()
+    agent = build_agent(env, scenario, timer)
+    run_sync(_run_turn(agent, scenario.message))  # 컴파일 / 프롬프트 로드 등 최초 비용 제외
+    timer.reset()
+
+    before = env.clear_caches if cold else None
+    turns = _time_calls(lambda: run_sync(_run_turn(agent, scenario.message)), iterations, before)
+    steps = {name: summarize(samples) for name, samples in sorted(timer.samples.items())}
+
+    return {
+        "model_steps": len(scenario.steps) + 1,
+        "tool_calls": sum(len(step) for step in scenario.steps),
+        "turn": summarize(turns),
+        "steps": steps,
+        "throughput": _throughput(lambda: _run_turn(agent, scenario.message), concurrency, max(1, iterations // 2)),
+    }
+
+
+# ---------- 전체 실행 ----------
+
+
+def _git_revision() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True).stdout.strip())
+        return {"commit": commit, "dirty": dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def run_benchmarks(
+    env: BenchmarkEnvironment,
+    iterations: int = 20,
+    concurrency: int = 8,
+    cold: bool = True,
+    tool_filter: Sequence[str] | None = None,
+    scenario_filter: Sequence[str] | None = None,
+) -> dict[str, Any]:
+    """전체 벤치마크 실행 → 리포트 딕셔너리"""
+    tool_cases = [c for c in TOOL_CASES if not tool_filter or c.tool in tool_filter]
+    scenarios = [s for s in TURN_SCENARIOS if not scenario_filter or s.name in scenario_filter]
+
+    tools = {}
+    for case in tool_cases:
+        print(f"⏱️ 도구: {case.tool}")
+        tools[case.tool] = bench_tool(env, case, iterations, concurrency)
+
+    turns = {}
+    for scenario in scenarios:
+        print(f"⏱️ 턴: {scenario.name}")
+        turns[scenario.name] = bench_turn(env, scenario, iterations, concurrency, cold)
+
+    snapshot = metrics.snapshot()["metrics"]
+    return {
+        "version": REPORT_VERSION,
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "git": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "config": {
+                "iterations": iterations,
+                "concurrency": concurrency,
+                "cold_turns": cold,
+                "corpus_size": len(env.corpus.documents),
+                "dimension": env.corpus.dimension,
+                "latencies": vars(env.latencies),
+            },
+        },
+        "tools": tools,
+        "turns": turns,
+        "backend_calls": env.backend_calls(),
+        "metrics": {name: snapshot[name] for name in ("backend_latency_seconds", "tool_latency_seconds") if name in snapshot},
+    }
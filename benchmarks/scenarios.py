@@ -0,0 +1,64 @@
+"""벤치마크 시나리오 (도구 단독 호출 + 스크립트된 에이전트 턴)"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ToolCase:
+    """도구 단독 호출 한 종류"""
+
+    tool: str
+    args: dict[str, Any]
+
+
+@dataclass(frozen=True)
+class TurnScenario:
+    """사용자 턴 하나: 모델이 steps 순서대로 도구를 호출한 뒤 답변
+
+    steps[i]는 i번째 모델 스텝의 도구 호출 목록 ({"name", "args"}), 여러 개면 병렬 도구 호출입니다.
+    """
+
+    name: str
+    message: str
+    steps: list[list[dict[str, Any]]] = field(default_factory=list)
+
+
+TOOL_CASES = [
+    ToolCase("hybrid_search", {"query": "성장 슬럼프가 와서 이직을 고민 중", "keywords": "성장통, 이직, 슬럼프"}),
+    ToolCase("pinecone_search", {"query": "코드 리뷰에서 계속 지적받아요"}),
+    ToolCase("graph_keyword_search", {"keywords": "번아웃, 야근"}),
+    ToolCase("graph_related_keywords", {"keyword": "기술 부채"}),
+    ToolCase("websearch", {"query": "중니어 개발자 연봉 협상", "page": 1}),
+    ToolCase("expert", {"job_role": "백엔드"}),
+]
+
+TURN_SCENARIOS = [
+    TurnScenario("answer_only", "안녕하세요, 상담 받고 싶어요"),
+    TurnScenario(
+        "single_search",
+        "3년차인데 성장이 멈춘 것 같아요",
+        [[{"name": "hybrid_search", "args": {"query": "성장 정체", "keywords": "성장통, 슬럼프"}}]],
+    ),
+    TurnScenario(
+        "parallel_tools",
+        "이직을 해야 할지 남아야 할지 모르겠어요",
+        [
+            [
+                {"name": "hybrid_search", "args": {"query": "이직 고민", "keywords": "이직, 커리어"}},
+                {"name": "graph_related_keywords", "args": {"keyword": "이직"}},
+                {"name": "websearch", "args": {"query": "개발자 이직 시기", "page": 1}},
+            ]
+        ],
+    ),
+    TurnScenario(
+        "multi_step",
+        "레거시 코드 때문에 번아웃이 왔어요",
+        [
+            [{"name": "hybrid_search", "args": {"query": "레거시 번아웃", "keywords": "레거시, 번아웃"}}],
+            [{"name": "graph_related_keywords", "args": {"keyword": "번아웃"}}],
+            [{"name": "expert", "args": {"job_role": "백엔드"}}],
+            [{"name": "websearch", "args": {"query": "레거시 리팩토링 전략", "page": 1}}],
+        ],
+    ),
+]
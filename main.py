@@ -3,9 +3,11 @@ from datetime import datetime
 
 import streamlit as st
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from schemas import UserConcern, UserProfile
+from utils.metrics import start_metrics_server
+from utils.vector_store import get_backend_name
 
 load_dotenv()
 # ====================================
@@ -14,6 +16,8 @@ load_dotenv()
 # 2. Upstage Client
 # 3. Google Gemini LLM
 # 4. RAG Chain
+# 5. Vector Store (Pinecone / Local)
+# 6. Async Clients (Upstage, Pinecone) - 백그라운드 이벤트 루프 전용
 # ====================================
 
 
@@ -42,6 +46,42 @@ def _get_pinecone():
         st.stop()
 
 
+@st.cache_resource(ttl=3600)
+def _get_pinecone_host() -> str:
+    """Cache: Pinecone 인덱스 호스트 (IndexAsyncio 생성용)"""
+    from pinecone import Pinecone
+
+    pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+    return pc.describe_index(os.getenv("PINECONE_INDEX_NAME", "mid-level-helper")).host
+
+
+def _create_async_pinecone_index():
+    """Pinecone 비동기 인덱스 생성 - 백그라운드 이벤트 루프(utils.aio)에서 한 번 호출되어 재사용"""
+    from pinecone import PineconeAsyncio
+
+    pc = PineconeAsyncio(api_key=os.getenv("PINECONE_API_KEY"))
+    return pc.IndexAsyncio(host=_get_pinecone_host())
+
+
+@st.cache_resource(show_spinner="🔄 벡터 스토어 로드 중...", ttl=3600)
+def _get_vector_store():
+    """Cache: Vector Store (VECTOR_STORE_BACKEND=pinecone|local)"""
+    from utils.vector_store import LocalVectorStore, PineconeVectorStore
+
+    backend = get_backend_name()
+    try:
+        if backend == "local":
+            store = LocalVectorStore()
+            print(f"✅ 로컬 벡터 스토어 로드: {store.directory} ({len(store):,}개)")
+            return store
+        return PineconeVectorStore(
+            _get_pinecone(), namespace="20251029_crawling", async_index_factory=_create_async_pinecone_index
+        )
+    except Exception as e:
+        st.error(f"☠️ 벡터 스토어({backend}) 초기화 실패: {e}")
+        st.stop()
+
+
 @st.cache_resource(show_spinner="🔄 Upstage 로드 중...", ttl=3600)
 def _get_upstage():
     """Cache: For embedding client - OpenAI wrapper"""
@@ -52,6 +92,12 @@ def _get_upstage():
         st.stop()
 
 
+@st.cache_resource(ttl=3600)
+def _get_async_upstage():
+    """Cache: 비동기 임베딩 클라이언트 - 백그라운드 이벤트 루프(utils.aio) 전용"""
+    return AsyncOpenAI(api_key=os.getenv("UPSTAGE_API_KEY"), base_url="https://api.upstage.ai/v1/solar")
+
+
 @st.cache_resource(show_spinner="🔄 Gemini 로드 중...", ttl=3600)
 def get_gemini():
     """
@@ -81,8 +127,13 @@ def get_gemini():
 
 
 # 모듈 레벨에서 인스턴스 생성 (하위 호환성 유지)
-get_pinecone = _get_pinecone()
+# 로컬 백엔드에서는 Pinecone에 연결하지 않음 (오프라인 실행 가능)
+get_pinecone = _get_pinecone() if get_backend_name() == "pinecone" else None
+get_vector_store = _get_vector_store()
 get_upstage = _get_upstage()
+get_async_upstage = _get_async_upstage()
+# METRICS_PORT 지정 시 /metrics 엔드포인트 시작 (프로세스당 한 번)
+start_metrics_server()
 # get_gemini는 함수로 유지 - 호출 시점에 캐시된 인스턴스 반환
 # ====================================
 # Main Pages: 소개 -> 프로필 -> 고민 등록
@@ -0,0 +1,157 @@
+"""도구 결과 압축 미들웨어 (LLM 호출 없는 결정적 히스토리 축소).
+
+대화 히스토리 증가는 대부분 도구 결과에서 나옵니다 (검색 결과 전체 덤프, 웹 검색 10건,
+수 KB의 전문가 프롬프트). 요약 미들웨어 앞에서 실행되어, 지난 턴의 도구 결과를
+
+- 스텁으로 축소: 결과의 id / 제목 / 점수만 남김 ("[compacted <tool>] ...")
+- 대체된 결과 제거: 이후 같은 도구를 같은 인자로 다시 호출했거나 (expert는 인자와 무관하게)
+  더 최근 결과가 있으면 내용을 비움
+
+메시지 id를 유지한 채 내용만 바꾸므로 (add_messages 리듀서가 같은 id를 교체)
+AI 도구 호출과 ToolMessage 쌍은 그대로 유지됩니다. 토큰 수는 로컬 추정치로 판단합니다.
+"""
+
+import json
+import re
+from collections.abc import Callable
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware, AgentState
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langgraph.runtime import Runtime
+
+COMPACTED_PREFIX = "[compacted"
+SUPERSEDED_CONTENT = "[compacted] 이후 같은 호출의 최신 결과로 대체됨"
+
+# 인자와 무관하게 최신 결과만 의미 있는 도구
+LATEST_ONLY_TOOLS = frozenset({"expert"})
+
+# 스텁에 남길 필드
+_STUB_FIELDS = ("id", "title", "score", "similarity", "relevance_score", "href")
+_FIELD_PATTERN = re.compile(r"\b(" + "|".join(_STUB_FIELDS) + r")=('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|-?[\d.]+)")
+_MAX_STUB_RECORDS = 10
+_MAX_TITLE_CHARS = 60
+
+
+def _records_from_json(data: Any) -> list[dict[str, Any]]:
+    """JSON 결과에서 스텁 필드를 가진 레코드 추출"""
+    records = []
+    if isinstance(data, dict):
+        record = {key: data[key] for key in _STUB_FIELDS if key in data}
+        if "title" in record:
+            records.append(record)
+        for value in data.values():
+            if isinstance(value, (dict, list)):
+                records.extend(_records_from_json(value))
+    elif isinstance(data, list):
+        for item in data:
+            records.extend(_records_from_json(item))
+    return records
+
+
+def _records_from_repr(content: str) -> list[dict[str, Any]]:
+    """pydantic repr (HybridCase(id='...', title='...', score=0.03) ...)에서 레코드 추출"""
+    records: list[dict[str, Any]] = []
+    current: dict[str, Any] = {}
+    for key, raw in _FIELD_PATTERN.findall(content):
+        if key in current:
+            records.append(current)
+            current = {}
+        current[key] = raw[1:-1] if raw[:1] in ("'", '"') else raw
+    if current:
+        records.append(current)
+    return [record for record in records if "title" in record]
+
+
+def build_stub(tool_name: str, content: str) -> str:
+    """도구 결과 → 한 줄 스텁 (id, 제목, 점수)"""
+    try:
+        records = _records_from_json(json.loads(content))
+    except (json.JSONDecodeError, TypeError):
+        records = _records_from_repr(content)
+
+    if not records:
+        first_line = next((line.strip() for line in content.splitlines() if line.strip()), "")
+        return f"{COMPACTED_PREFIX} {tool_name}] {first_line[: _MAX_TITLE_CHARS * 2]} ({len(content):,}자 생략)"
+
+    items = []
+    for record in records[:_MAX_STUB_RECORDS]:
+        title = str(record["title"])[:_MAX_TITLE_CHARS]
+        ref = record.get("id") or record.get("href")
+        score = next((record[key] for key in ("score", "similarity", "relevance_score") if key in record), None)
+        item = f"{ref}: {title}" if ref else title
+        items.append(f"{item} ({score})" if score is not None else item)
+
+    more = f" 외 {len(records) - _MAX_STUB_RECORDS}건" if len(records) > _MAX_STUB_RECORDS else ""
+    return f"{COMPACTED_PREFIX} {tool_name}] " + "; ".join(items) + more
+
+
+def _call_signatures(messages: list[AnyMessage]) -> dict[str, tuple[str, str]]:
+    """tool_call_id → (도구 이름, 정규화된 인자)"""
+    signatures = {}
+    for message in messages:
+        if isinstance(message, AIMessage):
+            for call in message.tool_calls:
+                args = json.dumps(call.get("args", {}), ensure_ascii=False, sort_keys=True)
+                signatures[call["id"]] = (call["name"], args)
+    return signatures
+
+
+class ToolOutputCompactionMiddleware(AgentMiddleware):
+    """지난 턴의 큰 도구 결과를 스텁으로 줄이고 대체된 결과를 비우는 미들웨어"""
+
+    def __init__(
+        self,
+        trigger_tokens: int = 2000,
+        min_tool_tokens: int = 150,
+        token_counter: Callable[[list[AnyMessage]], int] = count_tokens_approximately,
+    ):
+        """
+        Args:
+            trigger_tokens: 전체 히스토리가 이 토큰 수를 넘을 때만 압축
+            min_tool_tokens: 이보다 작은 도구 결과는 그대로 유지
+            token_counter: 토큰 수 추정 함수
+        """
+        super().__init__()
+        self.trigger_tokens = trigger_tokens
+        self.min_tool_tokens = min_tool_tokens
+        self.token_counter = token_counter
+
+    def compact(self, messages: list[AnyMessage]) -> list[ToolMessage]:
+        """교체할 ToolMessage 목록 (같은 id, 축소된 내용)"""
+        if self.token_counter(messages) < self.trigger_tokens:
+            return []
+
+        # 현재 턴 (마지막 HumanMessage 이후)의 도구 결과는 모델이 아직 사용 중
+        current_turn = next((i for i in range(len(messages) - 1, -1, -1) if isinstance(messages[i], HumanMessage)), 0)
+
+        signatures = _call_signatures(messages)
+        latest: dict[tuple[str, str], int] = {}
+        for index, message in enumerate(messages):
+            if isinstance(message, ToolMessage):
+                name, args = signatures.get(message.tool_call_id, (message.name or "", ""))
+                latest[(name, "" if name in LATEST_ONLY_TOOLS else args)] = index
+
+        replacements = []
+        for index, message in enumerate(messages[:current_turn]):
+            if not isinstance(message, ToolMessage) or message.text.startswith(COMPACTED_PREFIX):
+                continue
+
+            name, args = signatures.get(message.tool_call_id, (message.name or "", ""))
+            if latest.get((name, "" if name in LATEST_ONLY_TOOLS else args), index) != index:
+                content = SUPERSEDED_CONTENT
+            elif self.token_counter([message]) >= self.min_tool_tokens:
+                content = build_stub(name or "tool", message.text)
+            else:
+                continue
+
+            replacements.append(message.model_copy(update={"content": content}))
+        return replacements
+
+    def before_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        replacements = self.compact(state["messages"])
+        if not replacements:
+            return None
+        print(f"🗜️ 도구 결과 압축: {len(replacements)}개")
+        return {"messages": replacements}
@@ -0,0 +1,248 @@
+"""Gemini 컨텍스트 캐시 미들웨어 (GEMINI_CONTEXT_CACHE=1 일 때만 사용).
+
+ReAct 스텝마다 같은 시스템 프롬프트(+ expert 도구가 불러온 전문가 프롬프트)와 도구 선언이
+다시 전송되므로, 이 안정적인 프리픽스를 Gemini cached content로 한 번 등록하고
+이후 호출은 핸들(cachedContents/...)만 참조합니다.
+
+- 캐시 키: (직무, 경력 단계, 프리픽스 해시) → 같은 단계/직무의 세션끼리 핸들 공유
+- 로컬 레지스트리: 서버 TTL보다 조금 짧은 TTLCache, 생성 실패는 잠시 기억하여 매 스텝 재시도하지 않음
+- 프로필 블록은 캐시에 넣지 않고 첫 HumanMessage로 전달 (프로필마다 다르므로)
+- cached content를 쓰는 요청에는 system_instruction / tools를 함께 보낼 수 없으므로 요청에서 제거
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Any
+
+from google import genai
+from google.genai import types
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, ModelResponse
+from langchain_core.messages import AnyMessage, HumanMessage, ToolMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from middleware.compaction import COMPACTED_PREFIX
+from middleware.system_prompt import PROFILE_HEADER, split_system_prompt
+from schemas import UserProfile
+from utils.cache import SingleFlight, TTLCache
+
+GEMINI_CONTEXT_CACHE = os.getenv("GEMINI_CONTEXT_CACHE", "0") == "1"
+GEMINI_CONTEXT_CACHE_TTL = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL", "3600"))
+
+EXPERT_TOOL_NAME = "expert"
+EXPERT_PLACEHOLDER = "[전문가 프롬프트는 캐시된 시스템 컨텍스트에 포함되어 있습니다]"
+
+# 서버에서 만료되기 전에 로컬 핸들을 먼저 버림
+_EXPIRY_MARGIN = 60
+# 생성 실패 (최소 토큰 수 미달 등) 후 재시도까지 대기 시간
+_FAILURE_TTL = 300
+
+
+def extract_expert_prompt(messages: list[AnyMessage]) -> tuple[str | None, list[AnyMessage]]:
+    """가장 최근 expert 도구 결과를 꺼내고, 메시지에서는 자리표시자로 대체
+
+    Returns:
+        (전문가 프롬프트 또는 None, 대체된 메시지 목록)
+    """
+    expert = None
+    for message in reversed(messages):
+        if isinstance(message, ToolMessage) and message.name == EXPERT_TOOL_NAME:
+            # 압축 미들웨어가 이미 스텁으로 줄인 결과는 캐시할 내용이 없음
+            if message.content != EXPERT_PLACEHOLDER and not message.text.startswith(COMPACTED_PREFIX):
+                expert = message.text
+            break
+
+    if expert is None:
+        return None, messages
+
+    replaced = [
+        message.model_copy(update={"content": EXPERT_PLACEHOLDER})
+        if isinstance(message, ToolMessage) and message.name == EXPERT_TOOL_NAME
+        else message
+        for message in messages
+    ]
+    return expert, replaced
+
+
+@dataclass
+class _CachePlan:
+    """한 모델 호출에 대한 캐시 적용 계획"""
+
+    key: tuple[str, str, str]
+    model: str
+    system_instruction: str
+    tool_specs: list[dict[str, Any]]
+    profile_block: str
+    messages: list[AnyMessage]
+
+
+class GeminiContextCacheMiddleware(AgentMiddleware):
+    """시스템 프롬프트 + 전문가 프롬프트 + 도구 선언을 Gemini cached content로 등록/참조"""
+
+    def __init__(self, ttl: int = GEMINI_CONTEXT_CACHE_TTL, client: Any = None):
+        """
+        Args:
+            ttl: cached content TTL (초)
+            client: google.genai Client (기본: GOOGLE_API_KEY로 생성)
+        """
+        super().__init__()
+        self.ttl = ttl
+        self._client = client
+        self._handles = TTLCache(maxsize=64, ttl=max(ttl - _EXPIRY_MARGIN, 1))
+        self._failures = TTLCache(maxsize=64, ttl=_FAILURE_TTL)
+        self._inflight = SingleFlight()
+        self._tool_specs: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            self._client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
+        return self._client
+
+    def _get_tool_specs(self, tools: list) -> list[dict[str, Any]]:
+        """도구 선언 (도구 세트는 Agent마다 고정이므로 이름 목록 기준으로 재사용)"""
+        names = tuple(getattr(tool, "name", None) or json.dumps(tool, sort_keys=True, default=str) for tool in tools)
+        specs = self._tool_specs.get(names)
+        if specs is None:
+            specs = [convert_to_openai_tool(tool)["function"] for tool in tools]
+            self._tool_specs[names] = specs
+        return specs
+
+    def _plan(self, request: ModelRequest) -> _CachePlan | None:
+        """캐시를 적용할 수 있는 요청이면 계획 반환"""
+        profile = request.runtime.context
+        if (
+            not isinstance(request.model, ChatGoogleGenerativeAI)
+            or not isinstance(profile, UserProfile)
+            or not request.system_prompt
+            or request.tool_choice is not None
+            or request.response_format is not None
+        ):
+            return None
+
+        if PROFILE_HEADER in request.system_prompt:
+            prefix, profile_block = split_system_prompt(request.system_prompt)
+        else:
+            prefix, profile_block = request.system_prompt, ""
+
+        expert, messages = extract_expert_prompt(request.messages)
+        system_instruction = prefix if expert is None else f"{prefix}\n## 전문가 가이드\n{expert}\n"
+
+        model = request.model.model
+        if not model.startswith("models/"):
+            model = f"models/{model}"
+
+        tool_specs = self._get_tool_specs(request.tools)
+        payload = json.dumps([model, system_instruction, tool_specs], ensure_ascii=False, sort_keys=True)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+        return _CachePlan(
+            key=(profile.job_role.value, profile.career_level.value, digest),
+            model=model,
+            system_instruction=system_instruction,
+            tool_specs=tool_specs,
+            profile_block=profile_block,
+            messages=messages,
+        )
+
+    def _create_handle(self, plan: _CachePlan) -> str:
+        # 같은 키를 기다리던 호출이 방금 등록했을 수 있음
+        name = self._handles.get(plan.key)
+        if name is not None:
+            return name
+
+        tools = None
+        if plan.tool_specs:
+            declarations = [
+                types.FunctionDeclaration(
+                    name=spec["name"],
+                    description=spec.get("description", ""),
+                    parameters_json_schema=spec.get("parameters"),
+                )
+                for spec in plan.tool_specs
+            ]
+            tools = [types.Tool(function_declarations=declarations)]
+
+        cache = self.client.caches.create(
+            model=plan.model,
+            config=types.CreateCachedContentConfig(
+                display_name=f"mid-level-helper:{':'.join(plan.key)}",
+                system_instruction=plan.system_instruction,
+                tools=tools,
+                ttl=f"{self.ttl}s",
+            ),
+        )
+        self._handles.set(plan.key, cache.name)
+        print(f"🗄️ Gemini 컨텍스트 캐시 등록: {plan.key[0]}/{plan.key[1]} → {cache.name}")
+        return cache.name
+
+    def get_handle(self, plan: _CachePlan) -> str | None:
+        """캐시 핸들 조회 (없으면 등록, 실패하면 None)"""
+        name = self._handles.get(plan.key)
+        if name is not None:
+            return name
+        if self._failures.get(plan.key) is not None:
+            return None
+
+        try:
+            name, _ = self._inflight.do(repr(plan.key), lambda: self._create_handle(plan))
+            return name
+        except Exception as e:
+            print(f"⚠️ Gemini 컨텍스트 캐시 등록 실패 ({plan.key[0]}/{plan.key[1]}): {e}")
+            self._failures.set(plan.key, True)
+            return None
+
+    @staticmethod
+    def _apply(request: ModelRequest, plan: _CachePlan, name: str) -> ModelRequest:
+        leading = [HumanMessage(plan.profile_block)] if plan.profile_block else []
+        return request.override(
+            system_prompt=None,
+            tools=[],
+            messages=[*leading, *plan.messages],
+            model_settings={**request.model_settings, "cached_content": name},
+        )
+
+    def _invalidate(self, plan: _CachePlan, error: Exception) -> bool:
+        """서버에서 핸들이 사라진 경우 (만료/삭제) 로컬 핸들을 버리고 True"""
+        message = str(error)
+        if "CachedContent" not in message and "cached content" not in message.lower():
+            return False
+        print(f"⚠️ Gemini 컨텍스트 캐시 무효화: {plan.key[0]}/{plan.key[1]} - {message[:200]}")
+        self._handles.pop(plan.key)
+        self._failures.set(plan.key, True)
+        return True
+
+    def wrap_model_call(self, request: ModelRequest, handler: Any) -> ModelResponse:
+        plan = self._plan(request)
+        name = self.get_handle(plan) if plan else None
+        if plan is None or name is None:
+            return handler(request)
+
+        try:
+            return handler(self._apply(request, plan, name))
+        except Exception as e:
+            if not self._invalidate(plan, e):
+                raise
+            return handler(request)
+
+    async def awrap_model_call(self, request: ModelRequest, handler: Any) -> ModelResponse:
+        plan = self._plan(request)
+        if plan is None:
+            return await handler(request)
+
+        name = self._handles.get(plan.key)
+        if name is None:
+            # 등록은 동기 네트워크 호출이므로 스레드에서 실행
+            name = await asyncio.to_thread(self.get_handle, plan)
+        if name is None:
+            return await handler(request)
+
+        try:
+            return await handler(self._apply(request, plan, name))
+        except Exception as e:
+            if not self._invalidate(plan, e):
+                raise
+            return await handler(request)
@@ -1,18 +1,17 @@
-from typing import Any
-
 from langchain.agents.middleware import (
-    AgentMiddleware,
-    AgentState,
     ModelRequest,
-    SummarizationMiddleware,
     ToolCallLimitMiddleware,
     ToolRetryMiddleware,
     dynamic_prompt,
 )
-from langgraph.runtime import Runtime
 
 from main import get_gemini
-from schemas import CommonCompetencies, UserProfile
+from middleware.compaction import ToolOutputCompactionMiddleware
+from middleware.context_cache import GEMINI_CONTEXT_CACHE, GeminiContextCacheMiddleware
+from middleware.step_logging import StepLoggingMiddleware
+from middleware.summarization import BackgroundSummarizationMiddleware
+from middleware.system_prompt import build_system_prompt
+from schemas import UserProfile
 
 
 # 동적 시스템 프롬프트: Context[UserProfile]
@@ -20,48 +19,11 @@ from schemas import CommonCompetencies, UserProfile
 def dynamic_system_prompt(request: ModelRequest) -> str:
     """
     경력에 따라 프롬프트를 동적으로 구성합니다.
+
+    정적 프리픽스(경력 단계별) + 프로필 블록 순서이며, 프로필 fingerprint 단위로 캐시됩니다.
     """
     profile: UserProfile = request.runtime.context  # type: ignore
-
-    common = CommonCompetencies()
-    common_compet: list[str] = common.get_common_comps(profile.career_level)  # type: ignore
-    common_appro: str = common.get_coaching_approach(profile.career_level)  # type: ignore
-
-    base_prompt = f"""당신은 개발자 프로필 분석을 담당합니다.
-## 역할 목표
-- 주어진 정보를 토대로 공통된 정보를 조회해야합니다.
-- 기술 역량 개발 로드맵 및 정신 건강 상담
-- 실무 프로덕션 기준으로 구체적인 가이드 상담
-
-## 개발자 프로필 정보:
-{profile.to_context_string()}
-
-## 공통 역량
-{common_compet}
-
-## 접근 방식
-{common_appro}
-
-## 가이드라인
-1. 사용자가 물어본 언어로 최종 답변하세요. 한국어로 물어보면 한국어로 답변할 것.
-2. 개발자의 현재 상황과 고민을 먼저 파악하세요.
-3. 공감과 함께 다양한 사례를 들어 설명하세요.
-4. 단순히 어떤 것을 하세요 보다, '왜?' 해야하는지에 더 설명을 추가하세요.
-
-상담자의 질문에 공감하며 경청하고, 실질적인 도움이 되는 조언을 제공해주세요.
-"""
-    return base_prompt
-
-
-# 로깅 미들웨어
-class LoggingMiddleware(AgentMiddleware):
-    def before_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
-        print(f"About to call model with {len(state['messages'])} messages")
-        return None
-
-    def after_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
-        print(f"Model returned: {state['messages'][-1].content}")
-        return None
+    return build_system_prompt(profile)
 
 
 # 요약 처리 모델 - get_gemini()를 호출하여 실제 LLM 인스턴스 가져오기
@@ -84,11 +46,19 @@ tool_retry_limiter = ToolRetryMiddleware(max_retries=3, backoff_factor=2.0, init
 
 common_middlewares = [
     # fallbacks,
-    SummarizationMiddleware(
+    # 지난 턴의 큰 도구 결과를 스텁으로 축소 (LLM 호출 없음, 요약보다 먼저)
+    ToolOutputCompactionMiddleware(),
+    # 턴 종료 후 백그라운드에서 롤링 요약 갱신 (사용자 턴은 요약을 기다리지 않음)
+    BackgroundSummarizationMiddleware(
         model=common_model,
         max_tokens_before_summary=4000,
     ),
     websearch_limiter,
     tool_retry_limiter,
-    LoggingMiddleware(),
+    # 스텝별 지연 시간 / 토큰 / 도구 호출 구조화 로깅 (큐 기반, 샘플링)
+    StepLoggingMiddleware(),
 ]
+
+# Gemini 컨텍스트 캐시 (opt-in): 모델 호출 직전 단계여야 하므로 가장 안쪽(마지막)에 배치
+if GEMINI_CONTEXT_CACHE:
+    common_middlewares.append(GeminiContextCacheMiddleware())
@@ -0,0 +1,181 @@
+"""에이전트 스텝 구조화 로깅 (큐 기반 비동기 핸들러 + 샘플링).
+
+모델 호출마다 한 줄의 JSON 레코드를 남깁니다:
+    {"event": "model_step", "thread_id", "step", "messages", "latency_ms",
+     "input_tokens", "output_tokens", "total_tokens", "tool_calls"}
+
+- 로그 출력은 QueueHandler → QueueListener 스레드에서 처리되므로 모델 호출 경로는 I/O를 기다리지 않음
+- AGENT_LOG_SAMPLE_RATE (0~1)로 INFO 레코드를 샘플링 (WARNING 이상은 항상 기록)
+- 모델 출력 전체 내용은 AGENT_LOG_LEVEL=DEBUG 일 때만 기록
+- 로그 샘플링과 무관하게 스텝 지연 시간 / 토큰 수는 utils.metrics 에 항상 집계
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import threading
+import time
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, ModelResponse
+from langchain_core.messages import AIMessage, AnyMessage, HumanMessage
+
+from middleware.summarization import current_thread_id
+from utils.metrics import BACKEND_ERRORS, BACKEND_LATENCY, MODEL_TOKENS
+
+LOGGER_NAME = "mid_level_helper.agent"
+AGENT_LOG_LEVEL = os.getenv("AGENT_LOG_LEVEL", "INFO").upper()
+AGENT_LOG_SAMPLE_RATE = float(os.getenv("AGENT_LOG_SAMPLE_RATE", "1.0"))
+
+_setup_lock = threading.Lock()
+_listener: logging.handlers.QueueListener | None = None
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 → 한 줄 JSON (extra={"fields": {...}} 의 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "event": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 레코드를 버리는 QueueHandler (호출 스레드를 절대 막지 않음)"""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class SamplingFilter(logging.Filter):
+    """INFO 이하 레코드를 rate 비율로만 통과 (WARNING 이상은 항상 통과)"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+def get_step_logger() -> logging.Logger:
+    """큐 기반 비동기 핸들러가 연결된 에이전트 로거 (최초 호출 시 한 번 구성)"""
+    global _listener
+
+    logger = logging.getLogger(LOGGER_NAME)
+    if _listener is not None:
+        return logger
+
+    with _setup_lock:
+        if _listener is None:
+            log_queue: queue.Queue = queue.Queue(maxsize=10_000)
+
+            queue_handler = DroppingQueueHandler(log_queue)
+            queue_handler.addFilter(SamplingFilter(AGENT_LOG_SAMPLE_RATE))
+
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(JsonFormatter())
+
+            logger.addHandler(queue_handler)
+            logger.setLevel(AGENT_LOG_LEVEL)
+            logger.propagate = False
+
+            _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+            _listener.start()
+            # 종료 시 큐에 남은 레코드 출력
+            atexit.register(_listener.stop)
+    return logger
+
+
+def _step_index(messages: list[AnyMessage]) -> int:
+    """현재 사용자 턴에서 몇 번째 모델 호출인지 (마지막 HumanMessage 이후 AIMessage 수 + 1)"""
+    step = 1
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            break
+        if isinstance(message, AIMessage):
+            step += 1
+    return step
+
+
+class StepLoggingMiddleware(AgentMiddleware):
+    """모델 스텝별 지연 시간 / 토큰 사용량 / 도구 호출 구조화 로깅"""
+
+    def __init__(self, logger: logging.Logger | None = None):
+        super().__init__()
+        self.logger = logger or get_step_logger()
+
+    def _log(self, request: ModelRequest, response: ModelResponse | AIMessage, latency: float) -> None:
+        messages = response.result if isinstance(response, ModelResponse) else [response]
+        message = next((m for m in messages if isinstance(m, AIMessage)), None)
+        usage = (message.usage_metadata if message else None) or {}
+
+        BACKEND_LATENCY.observe(latency, backend="gemini", operation="model_step")
+        MODEL_TOKENS.inc(usage.get("input_tokens") or 0, kind="input")
+        MODEL_TOKENS.inc(usage.get("output_tokens") or 0, kind="output")
+
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        fields = {
+            "thread_id": current_thread_id(),
+            "step": _step_index(request.messages),
+            "messages": len(request.messages),
+            "latency_ms": round(latency * 1000, 1),
+            "input_tokens": usage.get("input_tokens"),
+            "output_tokens": usage.get("output_tokens"),
+            "total_tokens": usage.get("total_tokens"),
+            "tool_calls": [call["name"] for call in message.tool_calls] if message else [],
+        }
+        self.logger.info("model_step", extra={"fields": fields})
+
+        if message is not None and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("model_output", extra={"fields": {**fields, "content": message.content}})
+
+    def _log_error(self, request: ModelRequest, error: Exception, latency: float) -> None:
+        BACKEND_LATENCY.observe(latency, backend="gemini", operation="model_step")
+        BACKEND_ERRORS.inc(backend="gemini", operation="model_step")
+
+        fields = {
+            "thread_id": current_thread_id(),
+            "step": _step_index(request.messages),
+            "messages": len(request.messages),
+            "latency_ms": round(latency * 1000, 1),
+            "error": repr(error),
+        }
+        self.logger.warning("model_step_failed", extra={"fields": fields})
+
+    def wrap_model_call(self, request: ModelRequest, handler: Any) -> ModelResponse:
+        start = time.perf_counter()
+        try:
+            response = handler(request)
+        except Exception as e:
+            self._log_error(request, e, time.perf_counter() - start)
+            raise
+        self._log(request, response, time.perf_counter() - start)
+        return response
+
+    async def awrap_model_call(self, request: ModelRequest, handler: Any) -> ModelResponse:
+        start = time.perf_counter()
+        try:
+            response = await handler(request)
+        except Exception as e:
+            self._log_error(request, e, time.perf_counter() - start)
+            raise
+        self._log(request, response, time.perf_counter() - start)
+        return response
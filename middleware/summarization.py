@@ -0,0 +1,194 @@
+"""백그라운드 롤링 요약 미들웨어 (사용자 턴을 막지 않는 대화 요약).
+
+기본 SummarizationMiddleware는 임계값을 넘은 턴의 before_model에서 동기로 LLM을 호출하므로
+그 턴의 사용자는 요약 한 번을 더 기다려야 합니다. 이 미들웨어는
+
+1. 턴이 끝난 뒤(after_agent) 요약 대상이 임계값을 넘으면 백그라운드 스레드에서 요약을 갱신하고
+   (이전 요약 + 새로 밀려난 메시지 → 새 요약, thread_id별 롤링)
+2. 모델 호출(wrap_model_call) 때는 준비된 최신 요약으로 요약 구간의 메시지를 대체만 합니다.
+
+체크포인터 상태의 메시지는 그대로 두고 모델 요청만 줄이므로, 요약이 아직 없거나
+진행 중이면 전체 히스토리로 응답합니다. 잘라내는 위치는 항상 HumanMessage 앞이라
+AI 도구 호출과 ToolMessage 쌍이 분리되지 않습니다.
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware, AgentState, ModelRequest, ModelResponse
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AnyMessage, HumanMessage, get_buffer_string
+from langchain_core.messages.utils import count_tokens_approximately
+from langgraph.config import get_config
+from langgraph.runtime import Runtime
+
+from utils.cache import TTLCache
+from utils.metrics import BACKEND_LATENCY, SUMMARIES_PENDING
+
+SUMMARY_PREFIX = "## 이전 대화 요약:"
+
+SUMMARY_PROMPT = """당신은 개발자 커리어 상담 대화를 요약합니다.
+이전 요약과 이어지는 대화를 합쳐, 이후 상담에 필요한 정보만 남긴 하나의 요약을 작성하세요.
+
+반드시 유지할 것:
+- 사용자의 상황, 고민, 목표와 이미 답한 질문
+- 추천한 사례 / 자료 (제목, 출처)와 제시한 액션 아이템
+- 이미 사용한 검색 (반복하지 않도록)
+
+요약만 출력하고 다른 설명은 덧붙이지 마세요.
+
+<previous_summary>
+{summary}
+</previous_summary>
+
+<messages>
+{messages}
+</messages>"""
+
+
+@dataclass(frozen=True)
+class RollingSummary:
+    """thread_id별 롤링 요약"""
+
+    text: str
+    last_message_id: str  # 요약에 포함된 마지막 메시지 id
+    covered: int  # 요약에 포함된 메시지 수 (상태 메시지 앞에서부터)
+
+
+def current_thread_id() -> str | None:
+    """현재 그래프 실행의 thread_id (config.configurable)"""
+    try:
+        return get_config().get("configurable", {}).get("thread_id")
+    except RuntimeError:
+        # 그래프 실행 컨텍스트 밖
+        return None
+
+
+def find_turn_cutoff(messages: list[AnyMessage], turns_to_keep: int) -> int:
+    """최근 turns_to_keep개 사용자 턴의 시작 인덱스 (HumanMessage 경계, 없으면 0)"""
+    seen = 0
+    for index in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[index], HumanMessage):
+            seen += 1
+            if seen == turns_to_keep:
+                return index
+    return 0
+
+
+class BackgroundSummarizationMiddleware(AgentMiddleware):
+    """턴 종료 후 백그라운드에서 요약을 갱신하고, 모델 호출 시 최신 요약을 읽기만 하는 미들웨어"""
+
+    def __init__(
+        self,
+        model: BaseChatModel,
+        max_tokens_before_summary: int = 4000,
+        turns_to_keep: int = 2,
+        token_counter: Callable[[list[AnyMessage]], int] = count_tokens_approximately,
+        max_workers: int = 2,
+    ):
+        """
+        Args:
+            model: 요약 모델
+            max_tokens_before_summary: 요약되지 않은 구간이 이 토큰 수를 넘으면 요약 갱신
+            turns_to_keep: 요약하지 않고 원문으로 유지할 최근 사용자 턴 수
+            token_counter: 토큰 수 추정 함수
+            max_workers: 백그라운드 요약 스레드 수
+        """
+        super().__init__()
+        self.model = model
+        self.max_tokens_before_summary = max_tokens_before_summary
+        self.turns_to_keep = turns_to_keep
+        self.token_counter = token_counter
+
+        self._summaries = TTLCache(maxsize=1024, ttl=24 * 3600)
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="summarizer")
+
+    # ---------- 읽기 (모델 호출 경로) ----------
+
+    def get_summary(self, thread_id: str) -> RollingSummary | None:
+        return self._summaries.get(thread_id)
+
+    def _apply(self, request: ModelRequest) -> ModelRequest:
+        thread_id = current_thread_id()
+        summary = self.get_summary(thread_id) if thread_id else None
+        if summary is None:
+            return request
+
+        messages = request.messages
+        # 다른 미들웨어가 메시지를 바꿨을 수 있으므로 위치를 id로 확인
+        index = summary.covered - 1
+        if index >= len(messages) or messages[index].id != summary.last_message_id:
+            index = next((i for i, m in enumerate(messages) if m.id == summary.last_message_id), -1)
+            if index < 0:
+                return request
+
+        return request.override(messages=[HumanMessage(f"{SUMMARY_PREFIX}\n{summary.text}"), *messages[index + 1 :]])
+
+    def wrap_model_call(self, request: ModelRequest, handler: Any) -> ModelResponse:
+        return handler(self._apply(request))
+
+    async def awrap_model_call(self, request: ModelRequest, handler: Any) -> ModelResponse:
+        return await handler(self._apply(request))
+
+    # ---------- 갱신 (턴 종료 후 백그라운드) ----------
+
+    def after_agent(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        thread_id = current_thread_id()
+        if thread_id:
+            self.schedule(thread_id, list(state["messages"]))
+        return None
+
+    def schedule(self, thread_id: str, messages: list[AnyMessage]) -> bool:
+        """요약 갱신이 필요하면 백그라운드 작업 등록 (이미 진행 중이면 건너뜀)
+
+        Returns:
+            작업을 등록했는지 여부
+        """
+        previous = self.get_summary(thread_id)
+        covered = previous.covered if previous else 0
+        cutoff = find_turn_cutoff(messages, self.turns_to_keep)
+        if cutoff <= covered:
+            return False
+
+        if self.token_counter(messages[covered:]) < self.max_tokens_before_summary:
+            return False
+
+        with self._lock:
+            if thread_id in self._pending:
+                return False
+            self._pending.add(thread_id)
+            SUMMARIES_PENDING.set(len(self._pending))
+
+        self._executor.submit(self._refresh, thread_id, previous, messages[covered:cutoff], cutoff)
+        return True
+
+    def _refresh(
+        self,
+        thread_id: str,
+        previous: RollingSummary | None,
+        new_messages: list[AnyMessage],
+        cutoff: int,
+    ) -> None:
+        try:
+            prompt = SUMMARY_PROMPT.format(
+                summary=previous.text if previous else "(없음)",
+                messages=get_buffer_string(new_messages),
+            )
+            with BACKEND_LATENCY.time(backend="gemini", operation="summarize"):
+                response = self.model.invoke(prompt)
+            text = response.text.strip()
+            if text:
+                self._summaries.set(thread_id, RollingSummary(text, new_messages[-1].id, cutoff))
+                print(f"📝 대화 요약 갱신: thread={thread_id}, 메시지 {cutoff}개 요약됨")
+        except Exception as e:
+            # 실패해도 다음 턴에 다시 시도 (그동안은 전체 히스토리 사용)
+            print(f"⚠️ 백그라운드 요약 실패: thread={thread_id} - {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(thread_id)
+                SUMMARIES_PENDING.set(len(self._pending))
@@ -0,0 +1,77 @@
+"""시스템 프롬프트 렌더링 (프로필 fingerprint 기준 메모이제이션).
+
+프롬프트 = 정적 프리픽스 (지시사항 + 경력 단계별 공통 역량/접근 방식) + 프로필 블록 (마지막)
+
+- 같은 경력 단계의 프리픽스는 바이트 단위로 동일 → 프로바이더 프롬프트 캐시 적중
+- 모델 호출마다 실행되는 dynamic_prompt는 fingerprint로 캐시를 조회만 하므로
+  스텝 간 Python 작업이 없고, 토큰 수도 스텝마다 동일합니다.
+"""
+
+from functools import lru_cache
+
+from schemas import CareerLevel, CommonCompetencies, UserProfile
+from utils.cache import TTLCache
+
+PROFILE_HEADER = "## 개발자 프로필 정보:"
+
+# 세션 수만큼의 프로필 → 렌더링된 프롬프트 (만료 없음, LRU로 크기만 제한)
+_prompt_cache = TTLCache(maxsize=256, ttl=None)
+
+_INSTRUCTIONS = """당신은 개발자 프로필 분석을 담당합니다.
+## 역할 목표
+- 주어진 정보를 토대로 공통된 정보를 조회해야합니다.
+- 기술 역량 개발 로드맵 및 정신 건강 상담
+- 실무 프로덕션 기준으로 구체적인 가이드 상담
+
+## 가이드라인
+1. 사용자가 물어본 언어로 최종 답변하세요. 한국어로 물어보면 한국어로 답변할 것.
+2. 개발자의 현재 상황과 고민을 먼저 파악하세요.
+3. 공감과 함께 다양한 사례를 들어 설명하세요.
+4. 단순히 어떤 것을 하세요 보다, '왜?' 해야하는지에 더 설명을 추가하세요.
+
+상담자의 질문에 공감하며 경청하고, 실질적인 도움이 되는 조언을 제공해주세요.
+"""
+
+
+@lru_cache(maxsize=len(CareerLevel))
+def build_static_prefix(career_level: CareerLevel) -> str:
+    """경력 단계별 정적 프리픽스 (지시사항 + 공통 역량 + 접근 방식)"""
+    common = CommonCompetencies()
+    competencies = "\n".join(f"- {item}" for item in common.get_common_comps(career_level))
+    approach = common.get_coaching_approach(career_level).strip()
+
+    return f"""{_INSTRUCTIONS}
+## 공통 역량
+{competencies}
+
+## 접근 방식
+{approach}
+"""
+
+
+def profile_fingerprint(profile: UserProfile) -> tuple:
+    """프롬프트에 영향을 주는 필드만 모은 해시 가능한 키 (name, created_at 제외)"""
+    return (
+        profile.career_level,
+        profile.years_of_experience,
+        profile.job_role,
+        tuple(profile.tech_stack),
+        profile.company_size,
+        profile.work_style,
+    )
+
+
+def build_system_prompt(profile: UserProfile) -> str:
+    """프로필별 시스템 프롬프트 (fingerprint 단위로 캐시된 같은 문자열 반환)"""
+    fingerprint = profile_fingerprint(profile)
+    prompt = _prompt_cache.get(fingerprint)
+    if prompt is None:
+        prompt = f"{build_static_prefix(profile.career_level)}\n{PROFILE_HEADER}\n{profile.to_context_string()}\n"
+        _prompt_cache.set(fingerprint, prompt)
+    return prompt
+
+
+def split_system_prompt(prompt: str) -> tuple[str, str]:
+    """렌더링된 프롬프트 → (정적 프리픽스, 프로필 블록)"""
+    prefix, _, profile_block = prompt.partition(f"\n{PROFILE_HEADER}\n")
+    return prefix, f"{PROFILE_HEADER}\n{profile_block}"
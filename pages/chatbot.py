@@ -4,28 +4,76 @@ Streamlit 채팅 UI
 스트리밍 기반 ReAct Agent 챗봇 인터페이스
 - 실시간 토큰 단위 스트리밍 (LangChain stream_mode="messages")
 - 중간 과정 상태 표시 (stream_mode="updates")
+- 툴 진행 로그 실시간 표시 (stream_mode="custom", runtime.stream_writer)
 - 도구 호출 및 결과 시각화
-- 채팅 히스토리 관리
+- 비동기 실행 (agent.astream): 한 스텝의 여러 도구 호출을 동시에 실행
+- 채팅 히스토리 관리 (SQLite 체크포인터, ?thread=<id> 로 재시작 후에도 이어서 대화)
 """
 
+import re
+import time
+import uuid
+
 import streamlit as st
-from langchain.agents import create_agent
-from langgraph.checkpoint.memory import InMemorySaver
 
+from agents import AGENT_RECURSION_LIMIT, get_agent, get_checkpointer, load_thread
 from main import get_gemini
 from middleware.middleware import common_middlewares, dynamic_system_prompt
 from schemas import UserProfile
-from tools import ddgs_search, expert_search, sementic_search
-from tools.graph_search import graph_keyword_search, graph_related_keywords
-
-# 툴 등록
-tools = [
-    sementic_search,
-    graph_keyword_search,
-    graph_related_keywords,
-    ddgs_search,
-    expert_search,
-]
+from tools import chat_tools
+from utils.aio import iterate_in_background
+
+# 툴 등록 (tools.chat_tools)
+tools = chat_tools
+
+THREAD_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+def _message_text(message) -> str:
+    """AIMessage(Chunk) content에서 텍스트만 추출 (Gemini는 str 또는 part 리스트)"""
+    content = getattr(message, "content", "")
+    if isinstance(content, str):
+        return content
+
+    parts = []
+    for part in content or []:
+        if isinstance(part, str):
+            parts.append(part)
+        elif isinstance(part, dict) and part.get("type") == "text":
+            parts.append(part.get("text", ""))
+    return "".join(parts)
+
+
+def _restore_thread(thread_id: str) -> None:
+    """체크포인터에 저장된 대화로 화면 히스토리 / 프로필 복원 (모델 호출 없음)"""
+    messages, metadata = load_thread(get_checkpointer(), thread_id)
+
+    history = []
+    for message in messages:
+        if message.type == "human":
+            history.append({"role": "user", "content": _message_text(message)})
+        elif message.type == "ai":
+            for tool_call in message.tool_calls:
+                history.append(
+                    {
+                        "role": "tool",
+                        "type": "call",
+                        "content": f"🔧 {tool_call['name']} 호출",
+                        "tool_name": tool_call["name"],
+                        "tool_args": tool_call.get("args", {}),
+                    }
+                )
+            if text := _message_text(message):
+                history.append({"role": "assistant", "content": text})
+        elif message.type == "tool":
+            history.append({"role": "tool_result", "content": message.content, "tool_name": message.name})
+    st.session_state.chat_messages = history
+
+    if st.session_state.get("user_profile") is None and metadata.get("profile"):
+        st.session_state.user_profile = UserProfile.model_validate_json(metadata["profile"])
+        st.session_state.profile_completed = True
+
+
 # ========================================
 # Page Configuration
 # ========================================
@@ -46,7 +94,22 @@ st.caption("AI가 당신의 고민을 함께 해결합니다")
 if "chat_messages" not in st.session_state:
     st.session_state.chat_messages = []
 
-if "user_profile" not in st.session_state:
+# 세션별 대화 스레드 ID (체크포인터가 대화 상태를 보관)
+# URL의 ?thread=<id>로 유지되므로 새로고침 / 프로세스 재시작 후에도 같은 대화를 이어감
+if "thread_id" not in st.session_state:
+    thread_id = st.query_params.get("thread", "")
+    if THREAD_ID_PATTERN.fullmatch(thread_id):
+        st.session_state.thread_id = thread_id
+        _restore_thread(thread_id)
+    else:
+        st.session_state.thread_id = uuid.uuid4().hex
+
+st.query_params["thread"] = st.session_state.thread_id
+
+if "debug_mode" not in st.session_state:
+    st.session_state.debug_mode = False
+
+if st.session_state.get("user_profile") is None:
     st.error("❌ 사용자 프로필이 없습니다. 먼저 메인 페이지에서 프로필을 등록하세요.")
     st.stop()
 
@@ -71,9 +134,13 @@ with st.sidebar:
 
     st.divider()
 
+    # 디버그 모드: 응답 지연(TTFT) 표시
+    st.toggle("🐛 디버그 모드", key="debug_mode")
+
     # 채팅 히스토리 초기화 버튼
     if st.button("🗑️ 대화 내역 삭제", use_container_width=True):
         st.session_state.chat_messages = []
+        st.session_state.thread_id = uuid.uuid4().hex  # 새 스레드로 시작
         st.rerun()
 
 # ========================================
@@ -121,138 +188,149 @@ if prompt := st.chat_input("고민을 입력하세요..."):
 
     # Agent 스트리밍 실행
     with st.chat_message("assistant"):
-        response_placeholder = st.empty()
         status_container = st.container()
+        response_placeholder = st.empty()
+        debug_placeholder = st.empty()
 
         full_response = ""
-        tool_statuses = {}  # 도구별 상태 추적: {tool_name: status_placeholder}
+        step_text = ""  # 현재 모델 스텝에서 스트리밍 중인 텍스트
+        tool_statuses = {}  # 도구 호출별 상태 추적: {tool_call_id: status_placeholder}
+        running_status = None  # 진행 로그(custom)를 표시할 최근 도구 상태
+
+        started_at = time.perf_counter()
+        first_token_at: float | None = None
 
         try:
-            # Agent 가져오기 (Streamlit 캐싱)
+            # Agent 가져오기 (조합별로 한 번만 컴파일, rerun/세션 간 공유)
             llm = get_gemini() if callable(get_gemini) else get_gemini
 
-            agent = create_agent(
+            agent = get_agent(
                 model=llm,
                 tools=tools,
                 middleware=[
                     dynamic_system_prompt,  # type:ignore
                     *common_middlewares,
                 ],
-                checkpointer=InMemorySaver(),
                 context_schema=UserProfile,
             )
-
-            # stream_mode="updates"로 변경하여 중간 과정 추적
-            # updates 모드: 각 노드의 실행 결과를 받음
-            for update in agent.stream(
-                {"messages": st.session_state.chat_messages},
-                {"configurable": {"thread_id": "1"}},
-                context=profile,
-                stream_mode="updates",
+            # 프로필은 체크포인트 메타데이터에 남겨 재시작 후 복원 (_restore_thread)
+            config = {
+                "configurable": {"thread_id": st.session_state.thread_id},
+                "metadata": {"profile": profile.model_dump_json()},
+                "recursion_limit": AGENT_RECURSION_LIMIT,
+            }
+
+            # 이전 대화는 체크포인터에 있으므로 새 메시지만 전달
+            # messages: LLM 토큰 / updates: 노드 실행 결과 / custom: 툴 진행 로그(stream_writer)
+            # astream은 백그라운드 이벤트 루프에서 실행 → 한 스텝의 여러 도구 호출이 동시에 실행됨
+            for mode, chunk in iterate_in_background(
+                agent.astream(
+                    {"messages": [{"role": "user", "content": prompt}]},
+                    config,  # type: ignore
+                    context=profile,
+                    stream_mode=["messages", "updates", "custom"],
+                )
             ):
-                # update는 {node_name: node_output} 형태의 딕셔너리
-                for node_name, node_output in update.items():
-
-                    # Agent 노드: 도구 호출 결정
-                    if node_name == "agent":
-                        if "messages" in node_output:
-                            messages = node_output["messages"]
-                            for msg in messages:
-                                msg_class = msg.__class__.__name__
-
-                                # AIMessage with tool_calls: 도구 호출 시작
-                                if msg_class == "AIMessage" and hasattr(msg, "tool_calls") and msg.tool_calls:
-                                    for tool_call in msg.tool_calls:
-                                        tool_name = tool_call.get("name", "Unknown")
-                                        tool_args = tool_call.get("args", {})
-
-                                        # 도구 호출 상태 표시
-                                        with status_container:
-                                            status_placeholder = st.status(
-                                                f"🔧 {tool_name} 실행 중...",
-                                                expanded=True,
-                                                state="running"
-                                            )
-                                            with status_placeholder:
-                                                st.write(f"**도구**: {tool_name}")
-                                                if tool_args:
-                                                    st.json(tool_args, expanded=False)
-
-                                        # 상태 추적
-                                        tool_statuses[tool_name] = status_placeholder
-
-                                        # 히스토리 저장
-                                        st.session_state.chat_messages.append({
-                                            "role": "tool",
-                                            "type": "call",
-                                            "content": f"🔧 {tool_name} 호출",
-                                            "tool_name": tool_name,
-                                            "tool_args": tool_args
-                                        })
-
-                    # Tools 노드: 도구 실행 결과
-                    elif node_name == "tools":
-                        if "messages" in node_output:
-                            messages = node_output["messages"]
-                            for msg in messages:
-                                msg_class = msg.__class__.__name__
-
-                                # ToolMessage: 도구 실행 완료
-                                if msg_class == "ToolMessage":
-                                    tool_name = getattr(msg, "name", "Unknown")
-                                    tool_result = getattr(msg, "content", "")
-
-                                    # 도구 상태 업데이트
-                                    if tool_name in tool_statuses:
-                                        status_placeholder = tool_statuses[tool_name]
-                                        status_placeholder.update(
-                                            label=f"✅ {tool_name} 완료",
-                                            state="complete",
-                                            expanded=False
+                # 1. LLM 토큰 스트리밍 (요약 등 미들웨어 내부 모델 호출은 제외)
+                if mode == "messages":
+                    token, metadata = chunk
+                    if metadata.get("langgraph_node") not in ("model", "agent"):
+                        continue
+
+                    text = _message_text(token)
+                    if not text:
+                        continue
+
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    step_text += text
+                    response_placeholder.markdown(step_text + "▌")
+
+                # 2. 툴 진행 로그
+                elif mode == "custom":
+                    with running_status or status_container:
+                        st.caption(str(chunk))
+
+                # 3. 노드 실행 결과: 도구 호출 / 도구 결과 / 최종 응답
+                elif mode == "updates":
+                    for node_name, node_output in chunk.items():
+                        if not node_output or "messages" not in node_output:
+                            continue
+
+                        # Model 노드: 도구 호출 결정 또는 최종 응답
+                        if node_name in ("model", "agent"):
+                            for msg in node_output["messages"]:
+                                if msg.__class__.__name__ != "AIMessage":
+                                    continue
+
+                                if not getattr(msg, "tool_calls", None):
+                                    full_response = _message_text(msg) or step_text
+                                    continue
+
+                                # 도구 호출 스텝의 중간 텍스트는 최종 답변이 아니므로 지움
+                                step_text = ""
+                                response_placeholder.empty()
+
+                                for tool_call in msg.tool_calls:
+                                    tool_name = tool_call.get("name", "Unknown")
+                                    tool_args = tool_call.get("args", {})
+
+                                    # 도구 호출 상태 표시
+                                    with status_container:
+                                        status_placeholder = st.status(
+                                            f"🔧 {tool_name} 실행 중...", expanded=True, state="running"
                                         )
                                         with status_placeholder:
                                             st.write(f"**도구**: {tool_name}")
-                                            st.write(f"**결과**:")
-                                            result_preview = str(tool_result)[:1000]
-                                            if len(str(tool_result)) > 1000:
-                                                result_preview += "..."
-                                            st.text(result_preview)
+                                            if tool_args:
+                                                st.json(tool_args, expanded=False)
+
+                                    # 상태 추적
+                                    tool_statuses[tool_call.get("id") or tool_name] = status_placeholder
+                                    running_status = status_placeholder
 
                                     # 히스토리 저장
-                                    st.session_state.chat_messages.append({
-                                        "role": "tool_result",
-                                        "content": tool_result,
-                                        "tool_name": tool_name
-                                    })
-
-            # 최종 응답 추출 및 타이핑 효과
-            import time
-
-            final_state = agent.get_state({"configurable": {"thread_id": "1"}})
-            if final_state and "messages" in final_state.values:
-                messages = final_state.values["messages"]
-                # 마지막 AIMessage 찾기
-                for msg in reversed(messages):
-                    if msg.__class__.__name__ == "AIMessage":
-                        content = getattr(msg, "content", "")
-                        # Tool calls가 없는 최종 응답만
-                        has_tool_calls = hasattr(msg, "tool_calls") and msg.tool_calls
-                        if content and not has_tool_calls:
-                            full_response = content
-                            break
-
-            # 응답 표시 (타이핑 효과)
+                                    st.session_state.chat_messages.append(
+                                        {
+                                            "role": "tool",
+                                            "type": "call",
+                                            "content": f"🔧 {tool_name} 호출",
+                                            "tool_name": tool_name,
+                                            "tool_args": tool_args,
+                                        }
+                                    )
+
+                        # Tools 노드: 도구 실행 결과
+                        elif node_name == "tools":
+                            for msg in node_output["messages"]:
+                                if msg.__class__.__name__ != "ToolMessage":
+                                    continue
+
+                                tool_name = getattr(msg, "name", "Unknown")
+                                tool_result = getattr(msg, "content", "")
+
+                                # 도구 상태 업데이트
+                                status_placeholder = tool_statuses.pop(getattr(msg, "tool_call_id", None) or tool_name, None)
+                                if status_placeholder is not None:
+                                    status_placeholder.update(label=f"✅ {tool_name} 완료", state="complete", expanded=False)
+                                    with status_placeholder:
+                                        st.write("**결과**:")
+                                        result_preview = str(tool_result)[:1000]
+                                        if len(str(tool_result)) > 1000:
+                                            result_preview += "..."
+                                        st.text(result_preview)
+                                    if status_placeholder is running_status:
+                                        running_status = None
+
+                                # 히스토리 저장
+                                st.session_state.chat_messages.append(
+                                    {"role": "tool_result", "content": tool_result, "tool_name": tool_name}
+                                )
+
+            full_response = full_response or step_text
+
+            # 응답 표시 (커서 제거)
             if full_response:
-                # 타이핑 효과: 단어 단위로 표시
-                words = full_response.split()
-                displayed_text = ""
-
-                for i, word in enumerate(words):
-                    displayed_text += word + " "
-                    response_placeholder.markdown(displayed_text + "▌")
-                    time.sleep(0.02)  # 단어당 20ms 지연
-
-                # 최종 표시 (커서 제거)
                 response_placeholder.markdown(full_response)
                 st.session_state.chat_messages.append({"role": "assistant", "content": full_response})
             else:
@@ -260,6 +338,12 @@ if prompt := st.chat_input("고민을 입력하세요..."):
                 response_placeholder.error(error_msg)
                 st.session_state.chat_messages.append({"role": "assistant", "content": error_msg})
 
+            # 디버그 모드: 첫 토큰까지 걸린 시간(TTFT) 및 전체 소요 시간
+            if st.session_state.debug_mode:
+                total = time.perf_counter() - started_at
+                ttft = f"{first_token_at - started_at:.2f}s" if first_token_at else "N/A"
+                debug_placeholder.caption(f"⏱️ TTFT: {ttft} · 전체: {total:.2f}s")
+
         except Exception as e:
             error_msg = f"❌ 오류 발생: {str(e)}"
             response_placeholder.error(error_msg)
@@ -58,7 +58,10 @@ class CommonCompetencies:
     def __init__(self) -> None:
         pass
 
-    def _get_level(self, _level: str) -> CareerLevel:
+    def _get_level(self, _level: CareerLevel | str) -> CareerLevel:
+        # UserProfile.career_level은 Enum, 기존 호출부는 문자열
+        if isinstance(_level, CareerLevel):
+            return _level
         if _level == "주니어":
             return CareerLevel.JUNIOR
         elif _level == "중니어":
@@ -67,12 +70,12 @@ class CommonCompetencies:
             return CareerLevel.SENIOR
 
     # 공통 역량 조회
-    def get_common_comps(self, _level: str) -> list[str]:
+    def get_common_comps(self, _level: CareerLevel | str) -> list[str]:
         level = self._get_level(_level)
 
         return self.COMMON_COMPETENCIES.get(level, [])
 
-    def get_coaching_approach(self, _level: str) -> str:
+    def get_coaching_approach(self, _level: CareerLevel | str) -> str:
         level = self._get_level(_level)
 
         return self.APPROACHES.get(level, "")
@@ -1,5 +1,7 @@
 from pydantic import BaseModel, Field
 
+from schemas.tool_input import ToolInput
+
 
 class WebSearchSchemas(BaseModel):
     title: str = Field(description="제목")
@@ -12,7 +14,7 @@ class WebSearchToolResponseSchemas(BaseModel):
     articles: list[WebSearchSchemas] = Field(description="결과 데이터")
 
 
-class DDGSSearchInput(BaseModel):
+class DDGSSearchInput(ToolInput):
     """DuckDuckGo 검색 입력 스키마"""
 
     query: str = Field(description="사용자 질문에 대한 웹 검색 쿼리")
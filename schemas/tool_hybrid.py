@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+
+from schemas.tool_input import ToolInput
+
+
+class HybridSearchInput(ToolInput):
+    """하이브리드 검색 입력 스키마"""
+
+    query: str = Field(description="검색할 고민이나 상황 (예: '성장 슬럼프', '이직 고민')")
+    keywords: str = Field(
+        default="",
+        description="그래프 검색용 핵심 키워드 (쉼표로 구분, 예: '성장통, 재택근무'). 비우면 벡터 검색만 수행",
+    )
+
+
+class HybridCase(BaseModel):
+    id: str = Field(description="문서 ID")
+    title: str = Field(description="제목")
+    category: str = Field(description="카테고리")
+    summary: str = Field(description="요약")
+    keywords: str = Field(description="키워드 (그래프 검색은 매칭된 키워드)")
+    source: str = Field(description="출처")
+    score: float = Field(description="RRF 융합 점수")
+    found_by: list[str] = Field(description="문서를 찾은 검색기 (vector, graph)")
+
+
+class HybridSearchResponse(BaseModel):
+    count: int = Field(description="결과 수")
+    cases: list[HybridCase] = Field(description="융합 순위 결과")
@@ -0,0 +1,15 @@
+from langchain.tools import ToolRuntime
+from pydantic import BaseModel, ConfigDict
+
+
+class ToolInput(BaseModel):
+    """args_schema를 지정하는 도구의 입력 스키마 베이스
+
+    ToolNode는 도구 입력 스키마에 있는 runtime 필드에만 ToolRuntime을 주입합니다.
+    bare ToolRuntime 어노테이션이므로 모델에 보내는 스키마(tool_call_schema)에서는 제외되고,
+    기본값 None은 에이전트 밖에서 직접 invoke할 때를 위한 것입니다.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    runtime: ToolRuntime = None  # type: ignore[assignment]
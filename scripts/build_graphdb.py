@@ -1,8 +1,19 @@
-"""Pinecone 벡터 데이터를 FalkorDB 그래프로 마이그레이션."""
+"""Pinecone 벡터 데이터를 FalkorDB 그래프로 마이그레이션.
 
+실행:
+    python -m scripts.build_graphdb                  # 대량 적재 (UNWIND 배치, 기본)
+    python -m scripts.build_graphdb --mode row       # 문서/관계별 개별 쿼리 (기존 방식)
+    python -m scripts.build_graphdb --batch-size 1000
+    python -m scripts.build_graphdb --source local    # 로컬 벡터 스토어 메타데이터 사용 (네트워크 없음)
+
+Pinecone에서는 메타데이터만 페이지 단위로 스트리밍하며 벡터 값은 내려받지 않습니다.
+"""
+
+import argparse
 import os
 import sys
 from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from dotenv import load_dotenv
@@ -12,13 +23,17 @@ from tqdm import tqdm
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from utils.cooccurrence import CooccurrenceMatrix, count_cooccurrence, reference_edges
 from utils.data_loader import extract_keywords_list
 from utils.graph_db import (
+    bump_graph_version,
     clear_graph,
     create_graph_schema,
     get_graph,
     print_graph_stats,
 )
+from utils.graph_writer import GraphBulkWriter
+from utils.vector_store import LocalVectorStore, get_local_store_dir
 
 load_dotenv()
 
@@ -26,237 +41,385 @@ load_dotenv()
 NAMESPACE = "20251029_crawling"
 GRAPH_NAME = "mid_level_helper"
 BATCH_SIZE = 100
+BULK_BATCH_SIZE = 500
 
-print("\n" + "=" * 60)
-print("🚀 FalkorDB 그래프 구축 시작")
-print("=" * 60)
 
-# ============================================
-# 1. Pinecone 연결
-# ============================================
-print("\n📦 Pinecone 연결 중...")
-pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
-index_name = os.getenv("PINECONE_INDEX_NAME", "mid-level-helper")
-index = pc.Index(index_name)
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="FalkorDB 그래프 구축")
+    parser.add_argument(
+        "--mode",
+        choices=["bulk", "row"],
+        default="bulk",
+        help="bulk: 유형별 UNWIND 배치 적재 (기본), row: 문서/관계별 개별 쿼리",
+    )
+    parser.add_argument("--batch-size", type=int, default=BULK_BATCH_SIZE, help="bulk 모드 배치당 행 수")
+    parser.add_argument("--min-weight", type=int, default=1, help="이 값 미만 공동 출현 관계는 생략 (bulk 모드)")
+    parser.add_argument(
+        "--verify-cooccurrence",
+        action="store_true",
+        help="희소 행렬 결과를 기존 중첩 루프 계산과 비교 (bulk 모드)",
+    )
+    parser.add_argument(
+        "--source",
+        choices=["auto", "local", "pinecone", "csv"],
+        default="auto",
+        help="문서 메타데이터 출처 (auto: 로컬 사이드카 → Pinecone)",
+    )
+    return parser.parse_args()
 
-# 인덱스 통계 확인
-stats = index.describe_index_stats()
-print(f"✅ Pinecone 인덱스: {index_name}")
-print(f"   - 총 벡터 수: {stats.total_vector_count:,}")
-print(f"   - 네임스페이스: {NAMESPACE}")
 
 # ============================================
-# 2. FalkorDB 초기화
+# 문서 메타데이터 스트리밍 (벡터 값은 내려받지 않음)
 # ============================================
-print("\n🔨 FalkorDB 초기화 중...")
-graph = get_graph(GRAPH_NAME)
 
-# 기존 데이터 삭제 (선택적)
-print("⚠️  기존 그래프 데이터를 삭제하시겠습니까? (y/N): ", end="")
-response = input().strip().lower()
-if response == "y":
-    clear_graph(GRAPH_NAME)
-    print("✅ 기존 데이터 삭제 완료")
-else:
-    print("⏭️  기존 데이터 유지")
 
-# 스키마 생성
-create_graph_schema(GRAPH_NAME)
+def iter_pinecone_ids(index: Any, namespace: str, page_size: int = 100) -> Iterator[list[str]]:
+    """list_paginated의 페이지네이션 토큰을 끝까지 따라가며 ID 페이지 반환.
 
-# ============================================
-# 3. Pinecone에서 데이터 가져오기
-# ============================================
-print("\n📥 Pinecone 데이터 가져오기...")
+    Args:
+        index: Pinecone 인덱스
+        namespace: 네임스페이스
+        page_size: 페이지당 ID 수
+
+    Yields:
+        ID 리스트 (한 페이지)
+    """
+    token = None
+    while True:
+        results = index.list_paginated(namespace=namespace, limit=page_size, pagination_token=token)
+        ids = [v.id for v in results.vectors]
+        if ids:
+            yield ids
 
+        token = results.pagination.next if results.pagination else None
+        if not token:
+            return
 
-def fetch_all_vectors_from_pinecone(
-    index: Any, namespace: str, batch_size: int = 100
-) -> list[dict[str, Any]]:
-    """Pinecone에서 모든 벡터 메타데이터 가져오기.
+
+def iter_pinecone_documents(index: Any, namespace: str, page_size: int = 100) -> Iterator[dict[str, Any]]:
+    """Pinecone 문서 메타데이터를 페이지 단위로 스트리밍.
+
+    메타데이터 전용 경로: ID 페이지마다 `id $in` 필터 + include_values=False 쿼리로
+    메타데이터만 받습니다 (문서당 4096개 float 전송 없음).
+    필터에 걸리지 않은 문서(메타데이터에 id 필드가 없는 경우)만 fetch로 보완합니다.
 
     Args:
         index: Pinecone 인덱스
         namespace: 네임스페이스
-        batch_size: 배치 크기
+        page_size: 페이지당 문서 수
 
-    Returns:
-        벡터 메타데이터 리스트
+    Yields:
+        문서 메타데이터 (id 포함)
     """
-    all_vectors = []
+    stats = index.describe_index_stats()
+    namespace_stats = stats.namespaces.get(namespace, {})
+    total_count = namespace_stats.vector_count if hasattr(namespace_stats, "vector_count") else 0
+    print(f"   - 대상 벡터 수: {total_count:,}개")
+
+    # 필터로 대상을 한정하므로 쿼리 벡터는 임의의 단위 벡터면 충분
+    probe = [0.0] * stats.dimension
+    probe[0] = 1.0
+
+    for ids in iter_pinecone_ids(index, namespace, page_size):
+        results = index.query(
+            namespace=namespace,
+            vector=probe,
+            top_k=len(ids),
+            filter={"id": {"$in": ids}},
+            include_values=False,
+            include_metadata=True,
+        )
+
+        found = set()
+        for match in results.matches:
+            metadata = dict(match.metadata or {})
+            metadata["id"] = match.id
+            found.add(match.id)
+            yield metadata
+
+        missing = [vec_id for vec_id in ids if vec_id not in found]
+        if missing:
+            fetch_result = index.fetch(ids=missing, namespace=namespace)
+            for vec_id, vector_data in fetch_result.vectors.items():
+                metadata = dict(vector_data.metadata or {})
+                metadata["id"] = vec_id
+                yield metadata
 
-    # Pinecone의 list 메서드로 모든 ID 가져오기
-    try:
-        # Query 방식으로 샘플링 (Pinecone의 제한으로 인해)
-        # 더미 벡터로 쿼리하여 모든 데이터 접근
-        print("   벡터 데이터 샘플링 중...")
 
-        # stats에서 네임스페이스별 벡터 수 확인
-        namespace_stats = stats.namespaces.get(namespace, {})
-        total_count = namespace_stats.vector_count if hasattr(namespace_stats, "vector_count") else 0
+def iter_sidecar_documents() -> Iterator[dict[str, Any]]:
+    """로컬 벡터 스토어의 메타데이터 사이드카에서 스트리밍 (네트워크 없음)."""
+    store = LocalVectorStore(get_local_store_dir())
+    print(f"   - 로컬 메타데이터: {store.directory} ({len(store):,}개)")
+    yield from store.iter_metadata()
+
 
-        print(f"   - 대상 벡터 수: {total_count:,}개")
+def iter_csv_documents() -> Iterator[dict[str, Any]]:
+    """CSV에서 직접 로드 (대체 경로)."""
+    from utils.data_loader import create_metadata, load_csv_data
 
-        # 방법 1: 더미 쿼리로 top_k 방식 (제한적)
-        # 방법 2: list_paginated를 사용한 ID 가져오기
-        results = index.list_paginated(namespace=namespace, limit=10000)
+    df = load_csv_data()
+    for idx, row in df.iterrows():
+        yield create_metadata(row, idx)  # type: ignore
 
-        vector_ids = [v.id for v in results.vectors]
-        print(f"   - 가져온 ID 수: {len(vector_ids):,}개")
 
-        # fetch로 메타데이터 가져오기
-        for i in tqdm(range(0, len(vector_ids), batch_size), desc="메타데이터 가져오기"):
-            batch_ids = vector_ids[i : i + batch_size]
-            fetch_result = index.fetch(ids=batch_ids, namespace=namespace)
+def iter_documents(source: str) -> Iterator[dict[str, Any]]:
+    """문서 메타데이터 스트림 (source: auto | local | pinecone | csv).
 
-            for vec_id, vector_data in fetch_result.vectors.items():
-                metadata = vector_data.metadata
-                metadata["id"] = vec_id
-                all_vectors.append(metadata)
+    auto: 로컬 사이드카가 있으면 사용, 없으면 Pinecone.
+    Pinecone에서 첫 문서를 받기 전에 실패하면 CSV로 대체합니다.
+    """
+    if source == "auto":
+        source = "local" if (get_local_store_dir() / "manifest.json").exists() else "pinecone"
 
+    print(f"\n📥 문서 메타데이터 스트리밍 (source={source})...")
+
+    if source == "local":
+        yield from iter_sidecar_documents()
+        return
+    if source == "csv":
+        yield from iter_csv_documents()
+        return
+
+    started = False
+    try:
+        pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+        index_name = os.getenv("PINECONE_INDEX_NAME", "mid-level-helper")
+        index = pc.Index(index_name)
+        print(f"✅ Pinecone 인덱스: {index_name} / 네임스페이스: {NAMESPACE}")
+
+        for doc in iter_pinecone_documents(index, NAMESPACE, BATCH_SIZE):
+            started = True
+            yield doc
     except Exception as e:
+        if started:
+            raise
         print(f"❌ 데이터 가져오기 실패: {e}")
         print("⚠️  대안: CSV 데이터에서 직접 로드")
-        return []
+        yield from iter_csv_documents()
 
-    return all_vectors
 
+# ============================================
+# 그래프 구축
+# ============================================
 
-vectors = fetch_all_vectors_from_pinecone(index, NAMESPACE, BATCH_SIZE)
-print(f"✅ 벡터 메타데이터 가져오기 완료: {len(vectors):,}개")
 
-# CSV 대체 방법이 필요한 경우
-if len(vectors) == 0:
-    print("\n⚠️  Pinecone에서 데이터를 가져올 수 없습니다.")
-    print("   CSV 파일에서 직접 로드합니다...")
+def build_graph_rowwise(graph: Any, vectors: list[dict[str, Any]]) -> Counter:
+    """문서/관계별 개별 쿼리로 그래프 구축 (기존 방식).
 
-    from utils.data_loader import load_csv_data, prepare_documents_for_vectorstore
+    Returns:
+        키워드 출현 횟수
+    """
+    # 카테고리 노드 생성
+    categories = set()
+    for vec in vectors:
+        category = vec.get("category", "기타")
+        if category:
+            categories.add(category)
+
+    print(f"\n📂 카테고리 노드 생성: {len(categories)}개")
+    for category in tqdm(categories, desc="카테고리"):
+        query = """
+        MERGE (c:Category {name: $name})
+        """
+        graph.query(query, {"name": category})
+
+    # 키워드 노드 및 문서 노드 생성
+    print(f"\n📄 문서 및 키워드 노드 생성: {len(vectors)}개")
+
+    keyword_counter = Counter()
+    keyword_cooccurrence: dict[str, Counter] = defaultdict(Counter)
+
+    for vec in tqdm(vectors, desc="문서 처리"):
+        doc_id = vec.get("id", "")
+        title = vec.get("title", "")
+        source = vec.get("source", "")
+        problem_summary = vec.get("problem_summary", "")
+        category = vec.get("category", "기타")
+        keywords_str = vec.get("keywords", "")
+
+        # 문서 노드 생성
+        doc_query = """
+        MERGE (d:Document {id: $id})
+        SET d.title = $title,
+            d.source = $source,
+            d.problem_summary = $problem_summary,
+            d.category = $category
+        """
+        graph.query(
+            doc_query,
+            {
+                "id": doc_id,
+                "title": title,
+                "source": source,
+                "problem_summary": problem_summary,
+                "category": category,
+            },
+        )
+
+        # 카테고리 관계 생성
+        category_rel_query = """
+        MATCH (d:Document {id: $doc_id})
+        MATCH (c:Category {name: $category})
+        MERGE (d)-[:BELONGS_TO]->(c)
+        """
+        graph.query(category_rel_query, {"doc_id": doc_id, "category": category})
 
-    df = load_csv_data()
-    _, metadatas = prepare_documents_for_vectorstore(df)
-    vectors = metadatas
-    print(f"✅ CSV에서 로드 완료: {len(vectors):,}개")
+        # 키워드 처리
+        keywords = extract_keywords_list(keywords_str)
 
-# ============================================
-# 4. 그래프 구축
-# ============================================
-print("\n🔨 그래프 구축 중...")
-
-# 카테고리 노드 생성
-categories = set()
-for vec in vectors:
-    category = vec.get("category", "기타")
-    if category:
-        categories.add(category)
-
-print(f"\n📂 카테고리 노드 생성: {len(categories)}개")
-for category in tqdm(categories, desc="카테고리"):
-    query = f"""
-    MERGE (c:Category {{name: $name}})
-    """
-    graph.query(query, {"name": category})
-
-# 키워드 노드 및 문서 노드 생성
-print(f"\n📄 문서 및 키워드 노드 생성: {len(vectors)}개")
-
-keyword_counter = Counter()
-keyword_cooccurrence: dict[str, Counter] = defaultdict(Counter)
-
-for vec in tqdm(vectors, desc="문서 처리"):
-    doc_id = vec.get("id", "")
-    title = vec.get("title", "")
-    source = vec.get("source", "")
-    problem_summary = vec.get("problem_summary", "")
-    category = vec.get("category", "기타")
-    keywords_str = vec.get("keywords", "")
-
-    # 문서 노드 생성
-    doc_query = """
-    MERGE (d:Document {id: $id})
-    SET d.title = $title,
-        d.source = $source,
-        d.problem_summary = $problem_summary,
-        d.category = $category
-    """
-    graph.query(
-        doc_query,
-        {
-            "id": doc_id,
-            "title": title,
-            "source": source,
-            "problem_summary": problem_summary,
-            "category": category,
-        },
-    )
+        for keyword in keywords:
+            if not keyword:
+                continue
 
-    # 카테고리 관계 생성
-    category_rel_query = """
-    MATCH (d:Document {id: $doc_id})
-    MATCH (c:Category {name: $category})
-    MERGE (d)-[:BELONGS_TO]->(c)
-    """
-    graph.query(category_rel_query, {"doc_id": doc_id, "category": category})
+            keyword_counter[keyword] += 1
 
-    # 키워드 처리
-    keywords = extract_keywords_list(keywords_str)
+            # 키워드 노드 생성
+            keyword_query = """
+            MERGE (k:Keyword {name: $name})
+            """
+            graph.query(keyword_query, {"name": keyword})
 
-    for keyword in keywords:
-        if not keyword:
-            continue
+            # 문서-키워드 관계 생성
+            doc_keyword_query = """
+            MATCH (d:Document {id: $doc_id})
+            MATCH (k:Keyword {name: $keyword})
+            MERGE (d)-[:HAS_KEYWORD]->(k)
+            """
+            graph.query(doc_keyword_query, {"doc_id": doc_id, "keyword": keyword})
 
-        keyword_counter[keyword] += 1
+        # 키워드 공동 출현 추적
+        count_cooccurrence(keyword_cooccurrence, keywords)
 
-        # 키워드 노드 생성
-        keyword_query = """
-        MERGE (k:Keyword {name: $name})
-        """
-        graph.query(keyword_query, {"name": keyword})
+    # 키워드 공동 출현 관계 생성
+    print("\n🔗 키워드 공동 출현 관계 생성...")
 
-        # 문서-키워드 관계 생성
-        doc_keyword_query = """
-        MATCH (d:Document {id: $doc_id})
-        MATCH (k:Keyword {name: $keyword})
-        MERGE (d)-[:HAS_KEYWORD]->(k)
-        """
-        graph.query(doc_keyword_query, {"doc_id": doc_id, "keyword": keyword})
-
-    # 키워드 공동 출현 추적
-    for i, kw1 in enumerate(keywords):
-        for kw2 in keywords[i + 1 :]:
-            if kw1 and kw2 and kw1 != kw2:
-                keyword_cooccurrence[kw1][kw2] += 1
-                keyword_cooccurrence[kw2][kw1] += 1
-
-# 키워드 공동 출현 관계 생성
-print(f"\n🔗 키워드 공동 출현 관계 생성...")
-total_cooccurrences = sum(len(v) for v in keyword_cooccurrence.values()) // 2
-
-for kw1, cooccurs in tqdm(
-    keyword_cooccurrence.items(), desc="공동 출현", total=len(keyword_cooccurrence)
-):
-    for kw2, weight in cooccurs.items():
-        if kw1 < kw2:  # 중복 방지 (양방향 중 한 번만)
-            cooccur_query = """
-            MATCH (k1:Keyword {name: $kw1})
-            MATCH (k2:Keyword {name: $kw2})
-            MERGE (k1)-[r:CO_OCCURS_WITH]-(k2)
-            SET r.weight = $weight
-            """
-            graph.query(cooccur_query, {"kw1": kw1, "kw2": kw2, "weight": weight})
+    for kw1, cooccurs in tqdm(keyword_cooccurrence.items(), desc="공동 출현", total=len(keyword_cooccurrence)):
+        for kw2, weight in cooccurs.items():
+            if kw1 < kw2:  # 중복 방지 (양방향 중 한 번만)
+                cooccur_query = """
+                MATCH (k1:Keyword {name: $kw1})
+                MATCH (k2:Keyword {name: $kw2})
+                MERGE (k1)-[r:CO_OCCURS_WITH]-(k2)
+                SET r.weight = $weight
+                """
+                graph.query(cooccur_query, {"kw1": kw1, "kw2": kw2, "weight": weight})
 
-# ============================================
-# 5. 결과 확인
-# ============================================
-print("\n" + "=" * 60)
-print("✅ 그래프 구축 완료!")
-print("=" * 60)
+    return keyword_counter
 
-print_graph_stats(GRAPH_NAME)
 
-# 상위 키워드 출력
-print("\n📊 상위 10개 키워드:")
-for keyword, count in keyword_counter.most_common(10):
-    print(f"   {count:4d}회 - {keyword}")
+def build_graph_bulk(
+    graph: Any,
+    documents: Iterable[dict[str, Any]],
+    batch_size: int,
+    min_weight: int = 1,
+    verify: bool = False,
+) -> Counter:
+    """유형별 UNWIND 배치로 그래프 구축.
 
-print("\n" + "=" * 60)
-print("🎉 FalkorDB 그래프 구축 완료!")
-print("=" * 60)
+    문서 스트림을 한 건씩 소비하므로 문서 전체를 메모리에 올리지 않습니다.
+    공동 출현은 문서-키워드 희소 행렬 X로 Xᵀ·X 를 계산합니다.
+
+    Args:
+        min_weight: 이 값 미만의 공동 출현 관계는 적재하지 않음
+        verify: 기존 중첩 루프 결과와 가중치가 정확히 같은지 확인
+
+    Returns:
+        키워드 출현 횟수
+    """
+    writer = GraphBulkWriter(graph, batch_size=batch_size)
+
+    keyword_counter = Counter()
+    cooccurrence = CooccurrenceMatrix()
+    documents_keywords: list[list[str]] = []
+
+    print(f"\n📄 문서/카테고리/키워드 배치 적재 (배치 {batch_size}행)")
+    for vec in tqdm(documents, desc="문서 처리", unit="doc"):
+        keywords = writer.add_document(vec)
+        keyword_counter.update(keywords)
+        cooccurrence.add_document(keywords)
+        if verify:
+            documents_keywords.append(keywords)
+    writer.flush()
+
+    print("\n🔗 키워드 공동 출현 계산 (희소 행렬 Xᵀ·X)...")
+    edges = cooccurrence.edges(min_weight=min_weight)
+    print(f"   - 문서 {cooccurrence.n_documents:,}개 x 키워드 {len(cooccurrence.vocabulary):,}개 → 관계 {len(edges):,}개")
+
+    if verify:
+        expected = {pair: w for pair, w in reference_edges(documents_keywords).items() if w >= min_weight}
+        if edges.to_dict() != expected:
+            raise RuntimeError("희소 행렬 공동 출현 결과가 기존 계산과 다릅니다.")
+        print("   ✅ 기존 중첩 루프 결과와 일치")
+
+    for row in tqdm(edges.iter_rows(), desc="공동 출현", total=len(edges)):
+        writer.add_cooccurrence(row["kw1"], row["kw2"], row["weight"])
+    writer.close()
+
+    writer.print_report()
+    return keyword_counter
+
+
+def main() -> None:
+    args = parse_args()
+
+    print("\n" + "=" * 60)
+    print("🚀 FalkorDB 그래프 구축 시작")
+    print("=" * 60)
+
+    # ============================================
+    # 1. FalkorDB 초기화
+    # ============================================
+    print("\n🔨 FalkorDB 초기화 중...")
+    graph = get_graph(GRAPH_NAME)
+
+    # 기존 데이터 삭제 (선택적)
+    print("⚠️  기존 그래프 데이터를 삭제하시겠습니까? (y/N): ", end="")
+    response = input().strip().lower()
+    if response == "y":
+        clear_graph(GRAPH_NAME)
+        print("✅ 기존 데이터 삭제 완료")
+    else:
+        print("⏭️  기존 데이터 유지")
+
+    # 스키마 생성 (MERGE 대상 인덱스가 있어야 배치 적재가 빠름)
+    create_graph_schema(GRAPH_NAME)
+
+    # ============================================
+    # 2. 문서 스트림 → 그래프 구축
+    # ============================================
+    print(f"\n🔨 그래프 구축 중... (mode={args.mode})")
+    documents = iter_documents(args.source)
+
+    if args.mode == "bulk":
+        keyword_counter = build_graph_bulk(
+            graph, documents, args.batch_size, min_weight=args.min_weight, verify=args.verify_cooccurrence
+        )
+    else:
+        # row 모드는 카테고리 선처리를 위해 전체 목록이 필요
+        keyword_counter = build_graph_rowwise(graph, list(documents))
+
+    # ============================================
+    # 3. 결과 확인
+    # ============================================
+    print("\n" + "=" * 60)
+    print("✅ 그래프 구축 완료!")
+    print("=" * 60)
+
+    print_graph_stats(GRAPH_NAME)
+
+    # 그래프 쿼리 캐시 무효화 (실행 중인 앱은 버전 스탬프 변경을 보고 새로 조회)
+    version = bump_graph_version(GRAPH_NAME)
+    print(f"🔖 그래프 버전 갱신: v{version}")
+
+    # 상위 키워드 출력
+    print("\n📊 상위 10개 키워드:")
+    for keyword, count in keyword_counter.most_common(10):
+        print(f"   {count:4d}회 - {keyword}")
+
+    print("\n" + "=" * 60)
+    print("🎉 FalkorDB 그래프 구축 완료!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
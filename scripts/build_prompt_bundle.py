@@ -0,0 +1,60 @@
+"""prompts/*.md를 검증하여 단일 번들(prompts/bundle.json)로 컴파일.
+
+실행:
+    python -m scripts.build_prompt_bundle
+    python -m scripts.build_prompt_bundle --check    # 검증만 (번들 저장 안 함)
+
+frontmatter 오류가 있거나 ROLE_TO_PROMPT_MAP이 없는 프롬프트를 가리키면 종료 코드 1로 실패합니다.
+런타임 PromptLoader는 시작 시 번들을 한 번 로드하며, 번들이 원본과 다르면 원본에서 다시 컴파일합니다.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from utils.prompt_loader import BUNDLE_FILENAME, DEFAULT_PROMPTS_DIR, PromptLoader, compile_prompts, write_bundle
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="전문가 프롬프트 번들 빌드")
+    parser.add_argument("--prompts-dir", type=Path, default=DEFAULT_PROMPTS_DIR, help="프롬프트 디렉토리")
+    parser.add_argument("--output", type=Path, default=None, help="번들 경로 (기본: <prompts-dir>/bundle.json)")
+    parser.add_argument("--check", action="store_true", help="검증만 하고 번들은 저장하지 않음")
+    return parser.parse_args()
+
+
+def validate(prompts_dir: Path) -> tuple[dict, dict, list[str]]:
+    """컴파일 + 역할 매핑 검증"""
+    prompts, signatures, errors = compile_prompts(prompts_dir)
+
+    for role, prompt_name in PromptLoader.ROLE_TO_PROMPT_MAP.items():
+        if prompt_name not in prompts:
+            errors.append(f"역할 매핑 대상 없음: {role.value} → {prompt_name}")
+
+    return prompts, signatures, errors
+
+
+def main() -> int:
+    args = parse_args()
+    output = args.output or args.prompts_dir / BUNDLE_FILENAME
+
+    print(f"📂 프롬프트 컴파일: {args.prompts_dir}")
+    prompts, signatures, errors = validate(args.prompts_dir)
+
+    for error in errors:
+        print(f"❌ {error}")
+    if errors:
+        print(f"❌ 검증 실패: 오류 {len(errors)}개")
+        return 1
+
+    print(f"✅ 검증 완료: 프롬프트 {len(prompts)}개")
+    if args.check:
+        return 0
+
+    write_bundle(output, prompts, signatures)
+    print(f"💾 번들 저장: {output} ({output.stat().st_size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
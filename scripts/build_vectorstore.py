@@ -1,4 +1,20 @@
+"""CSV 데이터를 임베딩하여 벡터 스토어(Pinecone / 로컬) 구축.
+
+실행:
+    python -m scripts.build_vectorstore
+    python -m scripts.build_vectorstore --concurrency 8 --rps 10 --upsert-workers 4
+    python -m scripts.build_vectorstore --full       # 매니페스트 무시하고 전체 재빌드
+
+임베딩 요청은 토큰 버킷 레이트 리미터 아래에서 동시에 실행되고,
+업서트는 별도 워커 풀이 bounded queue를 통해 받아 처리합니다.
+
+증분 빌드: 문서 id → 임베딩 텍스트 해시 매니페스트를 비교하여
+신규/변경 문서만 임베딩·업서트하고, 사라진 문서는 벡터를 삭제합니다.
+"""
+
+import argparse
 import os
+import threading
 from typing import Any
 
 from dotenv import load_dotenv
@@ -7,54 +23,63 @@ from pinecone import Pinecone, ServerlessSpec
 from tqdm import tqdm
 
 from utils.data_loader import load_csv_data, prepare_documents_for_vectorstore
+from utils.ingestion import Batch, IngestionPipeline
+from utils.manifest import content_hash, diff_manifest, get_manifest_path, load_manifest, save_manifest
+from utils.vector_store import LocalVectorStore, PineconeVectorStore, get_backend_name, get_local_store_dir
 
 load_dotenv()
 
-# ============================================
-# 1. Pinecone 초기화
-# ============================================
-pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+NAMESPACE = "20251029_crawling"
+EMBEDDING_MODEL = "embedding-query"
 
-index_name = os.getenv("PINECONE_INDEX_NAME", "mid-level-helper")
+# Pinecone 배치 사이즈
+BATCH_SIZE = 100
 
-if index_name not in pc.list_indexes().names():
-    print(f"📦 인덱스 생성 중: {index_name}")
-    pc.create_index(
-        name=index_name,
-        dimension=4096,
-        metric="cosine",
-        spec=ServerlessSpec(cloud="aws", region="us-east-1"),
-    )
-    print("✅ 인덱스 생성 완료")
-else:
-    print(f"✅ 인덱스 존재 확인: {index_name}")
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="벡터 스토어 구축")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="임베딩/업서트 배치당 문서 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 임베딩 요청 수")
+    parser.add_argument("--rps", type=float, default=5.0, help="임베딩 API 초당 요청 한도")
+    parser.add_argument("--upsert-workers", type=int, default=2, help="업서트 워커 수")
+    parser.add_argument("--queue-size", type=int, default=8, help="임베딩 → 업서트 큐 크기 (배치 단위)")
+    parser.add_argument("--retries", type=int, default=5, help="단계별 최대 재시도 횟수")
+    parser.add_argument("--full", action="store_true", help="매니페스트를 무시하고 전체 재임베딩")
+    return parser.parse_args()
 
-# Pinecone 인덱스 로드
-index = pc.Index(index_name)
 
-# ============================================
-# 2. Upstage 임베딩 클라이언트 (OpenAI Wrapper)
-# ============================================
-client = OpenAI(api_key=os.getenv("UPSTAGE_API_KEY"), base_url="https://api.upstage.ai/v1/solar")
+def get_pinecone_index() -> Any:
+    """Pinecone 인덱스 로드 (없으면 생성)"""
+    pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
 
-print("\n" + "=" * 60)
-print("📂 데이터 로드 중...")
-print("=" * 60)
+    index_name = os.getenv("PINECONE_INDEX_NAME", "mid-level-helper")
 
-# 데이터 로드
-df = load_csv_data()
-texts, metadatas = prepare_documents_for_vectorstore(df)
-print(f"✅ 데이터 준비 완료: {len(texts)}개 문서")
+    if index_name not in pc.list_indexes().names():
+        print(f"📦 인덱스 생성 중: {index_name}")
+        pc.create_index(
+            name=index_name,
+            dimension=4096,
+            metric="cosine",
+            spec=ServerlessSpec(cloud="aws", region="us-east-1"),
+        )
+        print("✅ 인덱스 생성 완료")
+    else:
+        print(f"✅ 인덱스 존재 확인: {index_name}")
 
-# Pinecone 배치 사이즈
-BATCH_SIZE = 100
+    # Pinecone 인덱스 로드
+    return pc.Index(index_name)
+
+
+# ============================================
+# Upstage 임베딩 클라이언트 (OpenAI Wrapper)
+# ============================================
+client = OpenAI(api_key=os.getenv("UPSTAGE_API_KEY"), base_url="https://api.upstage.ai/v1/solar")
 
 
 def create_embeddings_batch(texts: list[str]) -> list[list[float]]:
     """텍스트 배치 -> 임베딩 변환"""
     try:
-        res = client.embeddings.create(input=texts, model="embedding-query")
+        res = client.embeddings.create(input=texts, model=EMBEDDING_MODEL)
         return [emb.embedding for emb in res.data]
     except Exception as e:
         print(f"☠️ 임베딩 실패: {e}")
@@ -72,57 +97,154 @@ def pinecone_batch(
     ]
 
 
-print("\n" + "=" * 60)
-print("🔄 임베딩 생성 및 업로드 중...")
-print("=" * 60)
-
-total_batches = (len(texts) + BATCH_SIZE - 1) // BATCH_SIZE
-uploaded_count = 0
-
-for i in tqdm(range(0, len(texts), BATCH_SIZE), desc="배치 처리"):
-    batch_texts = texts[i : i + BATCH_SIZE]
-    batch_metadatas = metadatas[i : i + BATCH_SIZE]
-    batch_ids = [metadata["id"] for metadata in batch_metadatas]
-
-    # 임베딩 생성
-    embeddings = create_embeddings_batch(batch_texts)
-
-    # Pinecone 포맷 변환
-    vectors = pinecone_batch(batch_ids, embeddings, batch_metadatas)
-
-    # Pinecone에 업로드
-    try:
-        index.upsert(vectors=vectors, namespace="20251029_crawling")  # type: ignore
-        uploaded_count += len(vectors)
-    except Exception as e:
-        print(f"❌ 업로드 실패 (배치 {i // BATCH_SIZE + 1}): {e}")
-        raise
-
-print(f"\n✅ 업로드 완료: {uploaded_count}개 벡터")
-
-# ============================================
-# 5. 검증
-# ============================================
-print("\n" + "=" * 60)
-print("🔍 검증 중...")
-print("=" * 60)
-
-stats = index.describe_index_stats()
-print(f"총 벡터 수: {stats.total_vector_count}")
-print(f"차원: {stats.dimension}")
-
-# 샘플 검색 테스트
-print("\n샘플 검색 테스트:")
-test_query = "재택근무하면서 동기부여가 떨어져요"
-test_embedding = create_embeddings_batch([test_query])[0]
-
-results = index.query(vector=test_embedding, top_k=3, include_metadata=True, namespace="20251029_crawling")
-
-for i, match in enumerate(results.matches, 1):  # type: ignore
-    print(f"\n[{i}] 유사도: {match.score:.4f}")
-    print(f"제목: {match.metadata.get('title', 'N/A')}")
-    print(f"카테고리: {match.metadata.get('category', 'N/A')}")
-
-print("\n" + "=" * 60)
-print("✅ 벡터 스토어 구축 완료!")
-print("=" * 60)
+def iter_batches(texts: list[str], metadatas: list[dict[str, Any]], batch_size: int):
+    """문서를 파이프라인 배치 단위로 분할"""
+    for i in range(0, len(texts), batch_size):
+        batch_metadatas = metadatas[i : i + batch_size]
+        yield Batch(
+            ids=[metadata["id"] for metadata in batch_metadatas],
+            texts=texts[i : i + batch_size],
+            metadatas=batch_metadatas,
+        )
+
+
+def delete_removed(index: Any, ids: list[str], batch_size: int = 1000) -> None:
+    """Pinecone에서 사라진 문서의 벡터 삭제"""
+    for i in range(0, len(ids), batch_size):
+        index.delete(ids=ids[i : i + batch_size], namespace=NAMESPACE)
+    print(f"🗑️ 삭제 완료: {len(ids)}개 벡터")
+
+
+def main() -> None:
+    args = parse_args()
+
+    # 벡터 스토어 백엔드: pinecone (원격 업로드) | local (NumPy 파일 생성)
+    backend = get_backend_name()
+    print(f"🗄️ 벡터 스토어 백엔드: {backend}")
+
+    # ============================================
+    # 1. Pinecone 초기화
+    # ============================================
+    index: Any = get_pinecone_index() if backend == "pinecone" else None
+
+    print("\n" + "=" * 60)
+    print("📂 데이터 로드 중...")
+    print("=" * 60)
+
+    # 데이터 로드
+    df = load_csv_data()
+    texts, metadatas = prepare_documents_for_vectorstore(df)
+    print(f"✅ 데이터 준비 완료: {len(texts)}개 문서")
+
+    # ============================================
+    # 2. 매니페스트 비교 (증분 빌드)
+    # ============================================
+    target = f"pinecone:{NAMESPACE}" if backend == "pinecone" else f"local:{get_local_store_dir()}"
+    manifest_path = get_manifest_path(backend)
+    current_hashes = {metadata["id"]: content_hash(text) for text, metadata in zip(texts, metadatas)}
+
+    previous_hashes = {} if args.full else load_manifest(manifest_path, EMBEDDING_MODEL, target)
+
+    # 로컬 백엔드: 변경 없는 문서는 기존 스토어의 벡터를 재사용
+    local_embeddings: dict[str, Any] = {}
+    local_lock = threading.Lock()
+    if backend == "local" and previous_hashes:
+        try:
+            local_embeddings.update(LocalVectorStore(get_local_store_dir()).get_vectors(list(previous_hashes)))
+        except FileNotFoundError:
+            print("⚠️ 기존 로컬 스토어가 없어 전체 재빌드합니다.")
+        # 스토어에 벡터가 없는 문서는 다시 임베딩
+        previous_hashes = {doc_id: h for doc_id, h in previous_hashes.items() if doc_id in local_embeddings}
+
+    diff = diff_manifest(previous_hashes, current_hashes)
+    print(f"📋 매니페스트 비교: {diff.summary()}")
+
+    if not diff.has_changes:
+        print("\n✅ 변경 사항 없음 - 임베딩/업서트를 건너뜁니다.")
+        return
+
+    # ============================================
+    # 3. 임베딩 생성 및 업로드 (파이프라인)
+    # ============================================
+    print("\n" + "=" * 60)
+    print("🔄 임베딩 생성 및 업로드 중...")
+    print(f"   동시 임베딩 {args.concurrency} · {args.rps} req/s · 업서트 워커 {args.upsert_workers}")
+    print("=" * 60)
+
+    to_embed = set(diff.to_embed)
+    pending = [(text, metadata) for text, metadata in zip(texts, metadatas) if metadata["id"] in to_embed]
+    pending_texts = [text for text, _ in pending]
+    pending_metadatas = [metadata for _, metadata in pending]
+
+    def upsert(batch: Batch, embeddings: list[list[float]]) -> None:
+        if backend == "local":
+            with local_lock:
+                local_embeddings.update(zip(batch.ids, embeddings))
+            return
+
+        # Pinecone 포맷 변환 및 업로드
+        vectors = pinecone_batch(batch.ids, embeddings, batch.metadatas)
+        index.upsert(vectors=vectors, namespace=NAMESPACE)  # type: ignore
+
+    with tqdm(total=len(pending_texts), desc="업로드", unit="doc") as progress:
+        pipeline = IngestionPipeline(
+            embed_fn=create_embeddings_batch,
+            upsert_fn=upsert,
+            embed_concurrency=args.concurrency,
+            upsert_workers=args.upsert_workers,
+            requests_per_second=args.rps,
+            queue_size=args.queue_size,
+            retries=args.retries,
+            on_progress=progress.update,
+        )
+        report = pipeline.run(iter_batches(pending_texts, pending_metadatas, args.batch_size))
+
+    if backend == "local":
+        # 삭제된 문서는 현재 데이터에 없으므로 다시 쓰는 것만으로 제거됨
+        ids = [metadata["id"] for metadata in metadatas]
+        LocalVectorStore.write(get_local_store_dir(), ids, [local_embeddings[i] for i in ids], metadatas)
+    elif diff.removed:
+        delete_removed(index, diff.removed)
+
+    # 모든 업로드가 성공한 뒤에만 매니페스트 갱신
+    save_manifest(manifest_path, EMBEDDING_MODEL, target, current_hashes)
+
+    print(f"\n✅ 업로드 완료: {report.documents}개 벡터 ({diff.summary()})")
+    report.print()
+
+    # ============================================
+    # 4. 검증
+    # ============================================
+    print("\n" + "=" * 60)
+    print("🔍 검증 중...")
+    print("=" * 60)
+
+    if backend == "local":
+        store: Any = LocalVectorStore(get_local_store_dir())
+        print(f"총 벡터 수: {len(store)}")
+        print(f"차원: {store.dim}")
+    else:
+        store = PineconeVectorStore(index, namespace=NAMESPACE)
+        stats = index.describe_index_stats()
+        print(f"총 벡터 수: {stats.total_vector_count}")
+        print(f"차원: {stats.dimension}")
+
+    # 샘플 검색 테스트
+    print("\n샘플 검색 테스트:")
+    test_query = "재택근무하면서 동기부여가 떨어져요"
+    test_embedding = create_embeddings_batch([test_query])[0]
+
+    matches = store.query(test_embedding, top_k=3)
+
+    for i, match in enumerate(matches, 1):
+        print(f"\n[{i}] 유사도: {match.score:.4f}")
+        print(f"제목: {match.metadata.get('title', 'N/A')}")
+        print(f"카테고리: {match.metadata.get('category', 'N/A')}")
+
+    print("\n" + "=" * 60)
+    print("✅ 벡터 스토어 구축 완료!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
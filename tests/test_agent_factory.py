@@ -0,0 +1,45 @@
+"""
+Agent 팩토리 캐시 키 테스트
+"""
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+from agents.factory import build_agent_key
+
+
+class _Tool:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class _Middleware:
+    def __init__(self, limit: int):
+        self.limit = limit
+
+
+class _Model:
+    model = "gemini-test"
+
+
+class _Schema:
+    pass
+
+
+class TestAgentFactoryClass:
+    def test_tool_order_ignored(self):
+        """툴 순서가 달라도 같은 키"""
+        model, middleware = _Model(), [_Middleware(1)]
+        a = build_agent_key(model, [_Tool("a"), _Tool("b")], middleware)
+        b = build_agent_key(model, [_Tool("b"), _Tool("a")], middleware)
+        assert a == b
+
+    def test_key_covers_schema_checkpointer_and_middleware_instance(self):
+        """컨텍스트 스키마 / 체크포인터 / 같은 클래스의 다른 미들웨어 인스턴스는 다른 키"""
+        model, tools, middleware = _Model(), [_Tool("a")], [_Middleware(1)]
+        saver = InMemorySaver()
+        base = build_agent_key(model, tools, middleware, _Schema, saver)
+
+        assert base == build_agent_key(model, tools, middleware, _Schema, saver)
+        assert base != build_agent_key(model, tools, middleware, None, saver)
+        assert base != build_agent_key(model, tools, middleware, _Schema, InMemorySaver())
+        assert base != build_agent_key(model, tools, [_Middleware(2)], _Schema, saver)
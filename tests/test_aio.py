@@ -0,0 +1,61 @@
+"""
+백그라운드 이벤트 루프 유틸리티 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from utils.aio import iterate_in_background, run_sync
+
+
+class TestBackgroundLoopClass:
+    def test_concurrent_calls_take_slowest(self):
+        """동시에 실행한 코루틴 3개가 가장 느린 것만큼만 걸리는지 테스트"""
+
+        async def call(delay: float) -> float:
+            await asyncio.sleep(delay)
+            return delay
+
+        async def step() -> list[float]:
+            return await asyncio.gather(call(0.2), call(0.1), call(0.2))
+
+        start = time.perf_counter()
+        assert run_sync(step()) == [0.2, 0.1, 0.2]
+        assert time.perf_counter() - start < 0.4
+
+    def test_iterate_in_background(self):
+        """비동기 제너레이터를 순서대로 동기 순회하고 예외를 전달하는지 테스트"""
+
+        async def numbers():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield i
+            raise ValueError("끝")
+
+        seen = []
+        with pytest.raises(ValueError):
+            for item in iterate_in_background(numbers()):
+                seen.append(item)
+        assert seen == [0, 1, 2]
+
+    def test_early_stop_cancels(self):
+        """소비 측이 중간에 멈추면 비동기 작업도 취소되는지 테스트"""
+        finished = []
+
+        async def endless():
+            try:
+                while True:
+                    await asyncio.sleep(0.01)
+                    yield 1
+            finally:
+                finished.append(True)
+
+        for _ in iterate_in_background(endless()):
+            break
+
+        deadline = time.time() + 1
+        while not finished and time.time() < deadline:
+            time.sleep(0.01)
+        assert finished
@@ -0,0 +1,99 @@
+"""
+오프라인 벤치마크 리포트 / 대역 테스트
+"""
+
+import json
+
+import pytest
+
+from benchmarks.report import compare_reports, percentile, summarize, write_report
+
+
+class TestBenchmarkReportClass:
+    def test_summarize(self):
+        """초 단위 표본 → 밀리초 통계"""
+        stats = summarize([0.001, 0.002, 0.003, 0.004, 0.005])
+
+        assert stats["count"] == 5
+        assert stats["p50_ms"] == 3.0
+        assert stats["min_ms"] == 1.0
+        assert stats["max_ms"] == 5.0
+        assert summarize([]) == {"count": 0}
+
+    def test_percentile_interpolation(self):
+        """표본 사이 선형 보간"""
+        assert percentile([1.0, 2.0], 0.5) == pytest.approx(1.5)
+        assert percentile([1.0, 2.0, 3.0], 0.95) == pytest.approx(2.9)
+
+    def test_compare_reports(self, tmp_path):
+        """p50 / p95 비교, 임계값 이상 느려지면 회귀"""
+        baseline = {"tools": {"hybrid_search": {"args": {}, "sync_cold": {"p50_ms": 10.0, "p95_ms": 20.0}}}}
+        current = {"tools": {"hybrid_search": {"args": {}, "sync_cold": {"p50_ms": 12.0, "p95_ms": 20.5}}}}
+
+        rows = {row["key"]: row for row in compare_reports(baseline, current, threshold=0.1)}
+
+        assert rows["tools.hybrid_search.sync_cold.p50_ms"]["regression"]
+        assert not rows["tools.hybrid_search.sync_cold.p95_ms"]["regression"]
+
+        path = write_report(current, tmp_path / "nested" / "report.json")
+        assert json.loads(path.read_text(encoding="utf-8")) == current
+
+
+class TestBenchmarkFakesClass:
+    def test_deterministic_embedding(self):
+        """같은 텍스트는 같은 정규화 벡터"""
+        import numpy as np
+
+        from benchmarks.fakes import deterministic_embedding
+
+        a = deterministic_embedding("성장통", 64)
+        assert np.allclose(a, deterministic_embedding("성장통", 64))
+        assert np.linalg.norm(a) == pytest.approx(1.0, abs=1e-5)
+        assert not np.allclose(a, deterministic_embedding("이직", 64))
+
+    def test_fake_index_and_graph(self):
+        """Pinecone 대역은 코사인 상위 문서, 그래프 대역은 키워드 매칭 문서 반환"""
+        from benchmarks.fakes import FakeGraph, FakePineconeIndex, build_corpus
+        from utils.graph_queries import SEARCH_DOCUMENTS_QUERY
+
+        corpus = build_corpus(size=200, dimension=64)
+        matches = FakePineconeIndex(corpus).query(vector=corpus.vectors[7].tolist(), top_k=3).matches
+        assert matches[0].id == "doc-00007"
+        assert len(matches) == 3
+
+        graph = FakeGraph(corpus)
+        keyword = corpus.documents[0]["keywords"].split(", ")[0]
+        rows = graph.query(SEARCH_DOCUMENTS_QUERY, {"keywords": [keyword], "limit": 5}).result_set
+        assert rows and all(keyword in row[5] for row in rows)
+        assert graph.query("MATCH (n) RETURN n").result_set == []
+
+    def test_scripted_model(self):
+        """스크립트 스텝대로 도구 호출 후 최종 답변"""
+        from langchain_core.messages import HumanMessage, ToolMessage
+
+        from benchmarks.fakes import ScriptedChatModel
+
+        model = ScriptedChatModel(script=[[{"name": "websearch", "args": {"query": "q"}}]], final_text="끝")
+
+        first = model.invoke([HumanMessage("질문")])
+        assert [call["name"] for call in first.tool_calls] == ["websearch"]
+
+        second = model.invoke([HumanMessage("질문"), first, ToolMessage("결과", tool_call_id=first.tool_calls[0]["id"])])
+        assert second.content == "끝"
+        assert second.usage_metadata["output_tokens"] >= 0
+
+
+class TestBenchmarkRunnerClass:
+    def test_turn_scenarios(self):
+        """모든 턴 시나리오가 recursion limit 안에서 최종 답변까지 실행"""
+        from benchmarks.environment import install
+
+        env = install(corpus_size=200, dimension=64)
+
+        from benchmarks import runner
+        from benchmarks.scenarios import TURN_SCENARIOS
+        from utils.aio import run_sync
+
+        for scenario in TURN_SCENARIOS:
+            agent = runner.build_agent(env, scenario, runner.StepTimer())
+            assert run_sync(runner._run_turn(agent, scenario.message)) > 0, scenario.name
@@ -0,0 +1,99 @@
+"""
+utils.cache 2단 캐시 테스트
+"""
+
+import json
+import threading
+import time
+
+from utils.cache import SingleFlight, SQLiteCache, TTLCache, TwoTierCache, make_cache_key, normalize_text
+
+
+class TestCacheClass:
+    def test_normalize_text(self):
+        """사소하게 다른 질문은 같은 키로 정규화"""
+        assert normalize_text("  재택근무   동기부여?  ") == normalize_text("재택근무 동기부여")
+        assert normalize_text("Python 백엔드") == normalize_text("python 백엔드")
+        assert make_cache_key("m", "a") != make_cache_key("n", "a")
+
+    def test_ttl_cache_lru_and_expiry(self):
+        """LRU 제거 및 TTL 만료"""
+        cache = TTLCache(maxsize=2, ttl=0.05)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a를 최근 사용으로
+        cache.set("c", 3)  # b 제거
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+        time.sleep(0.06)
+        assert cache.get("a") is None
+
+    def test_two_tier_cache_disk_hit(self, tmp_path):
+        """메모리 미스 시 디스크에서 복원, compute는 한 번만 호출"""
+        calls = []
+
+        def make_cache() -> TwoTierCache:
+            return TwoTierCache(
+                name="test",
+                dumps=lambda v: json.dumps(v).encode(),
+                loads=lambda raw: json.loads(raw),
+                disk_path=tmp_path / "cache.sqlite3",
+            )
+
+        cache = make_cache()
+        compute = lambda: calls.append(1) or [0.1, 0.2]  # noqa: E731
+
+        assert cache.get_or_compute("k", compute) == [0.1, 0.2]
+        assert cache.get_or_compute("k", compute) == [0.1, 0.2]
+        assert cache.stats.misses == 1
+        assert cache.stats.memory_hits == 1
+
+        # 새 프로세스 흉내: 메모리 계층이 비어 있는 새 인스턴스
+        restarted = make_cache()
+        assert restarted.get_or_compute("k", compute) == [0.1, 0.2]
+        assert restarted.stats.disk_hits == 1
+        assert len(calls) == 1
+
+    def test_sqlite_cache_bounded_and_lazy(self, tmp_path):
+        """파일은 첫 사용 시 생성, maxsize 초과 / TTL 만료 항목은 정리"""
+        path = tmp_path / "nested" / "cache.sqlite3"
+        cache = SQLiteCache(path, maxsize=3, prune_every=1)
+        assert not path.exists()
+
+        for i in range(5):
+            cache.set(f"k{i}", b"v")
+            time.sleep(0.001)
+
+        assert path.exists()
+        assert len(cache) == 3
+        assert cache.get("k0") is None
+        assert cache.get("k4") == b"v"
+
+        expiring = SQLiteCache(path, table="expiring", ttl=0.05)
+        expiring.set("a", b"1")
+        time.sleep(0.06)
+        assert expiring.get("a") is None
+
+    def test_single_flight_shares_concurrent_calls(self):
+        """같은 키의 동시 호출은 한 번만 실행되고 결과를 공유"""
+        flight = SingleFlight()
+        calls = []
+        results = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return ["결과"]
+
+        threads = [threading.Thread(target=lambda: results.append(flight.do("q", fetch))) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert [value for value, _ in results] == [["결과"]] * 5
+        assert sum(shared for _, shared in results) == 4
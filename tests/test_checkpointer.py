@@ -0,0 +1,90 @@
+"""
+SQLite 영속 체크포인터 테스트
+"""
+
+import asyncio
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.base import empty_checkpoint
+
+from agents.checkpointer import COMPRESSED_SUFFIX, CompressedSerializer, SqliteCheckpointer, load_thread
+
+
+def _put(saver: SqliteCheckpointer, thread_id: str, messages: list, metadata: dict | None = None) -> dict:
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"messages": messages}
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    return saver.put(config, checkpoint, metadata or {}, {})
+
+
+class TestCompressedSerializerClass:
+    def test_round_trip(self):
+        """작은 값은 그대로, 큰 값은 zlib 압축 후 복원"""
+        serde = CompressedSerializer(min_size=256)
+
+        small = {"text": "짧은 값"}
+        type_, _ = serde.dumps_typed(small)
+        assert not type_.endswith(COMPRESSED_SUFFIX)
+        assert serde.loads_typed(serde.dumps_typed(small)) == small
+
+        large = {"text": "반복되는 상담 내용 " * 200}
+        type_, data = serde.dumps_typed(large)
+        assert type_.endswith(COMPRESSED_SUFFIX)
+        assert len(data) < len(CompressedSerializer(min_size=10**9).dumps_typed(large)[1])
+        assert serde.loads_typed((type_, data)) == large
+
+
+class TestSqliteCheckpointerClass:
+    def test_persists_across_connections(self, tmp_path):
+        """파일에 저장된 대화는 새 연결(프로세스 재시작)에서도 조회"""
+        path = tmp_path / "checkpoints.sqlite3"
+        saver = SqliteCheckpointer.from_path(path, prune_every=0)
+        _put(saver, "t1", [HumanMessage("안녕하세요"), AIMessage("반갑습니다")], {"profile": '{"name": "홍길동"}'})
+
+        restarted = SqliteCheckpointer.from_path(path, prune_every=0)
+        messages, metadata = load_thread(restarted, "t1")
+        assert [m.content for m in messages] == ["안녕하세요", "반갑습니다"]
+        assert metadata["profile"] == '{"name": "홍길동"}'
+
+        config = {"configurable": {"thread_id": "t1"}}
+        assert asyncio.run(restarted.aget_tuple(config)).checkpoint["channel_values"]["messages"][0].content == "안녕하세요"
+        assert load_thread(restarted, "missing") == ([], {})
+
+    def test_trim_history(self, tmp_path):
+        """스레드별 최근 keep_per_thread 개 체크포인트만 유지"""
+        saver = SqliteCheckpointer.from_path(tmp_path / "c.sqlite3", keep_per_thread=2, prune_every=0)
+        for i in range(5):
+            _put(saver, "t1", [HumanMessage(f"메시지 {i}")])
+        _put(saver, "t2", [HumanMessage("다른 스레드")])
+
+        result = saver.prune()
+
+        assert result["checkpoints"] == 3
+        assert len(list(saver.list({"configurable": {"thread_id": "t1"}}))) == 2
+        assert load_thread(saver, "t1")[0][0].content == "메시지 4"
+        assert load_thread(saver, "t2")[0][0].content == "다른 스레드"
+
+    def test_prune_expired_threads(self, tmp_path):
+        """max_age_days 동안 갱신되지 않은 스레드 삭제"""
+        saver = SqliteCheckpointer.from_path(tmp_path / "c.sqlite3", max_age_days=1, prune_every=0)
+        _put(saver, "old", [HumanMessage("오래된 대화")])
+        _put(saver, "new", [HumanMessage("최근 대화")])
+        with saver.cursor() as cur:
+            cur.execute("UPDATE thread_activity SET updated_at = ? WHERE thread_id = 'old'", (time.time() - 3 * 86400,))
+
+        result = saver.prune()
+
+        assert result["threads"] == 1
+        assert load_thread(saver, "old") == ([], {})
+        assert load_thread(saver, "new")[0][0].content == "최근 대화"
+
+    def test_prune_over_budget(self, tmp_path):
+        """크기 상한을 넘으면 오래된 스레드부터 삭제"""
+        saver = SqliteCheckpointer.from_path(tmp_path / "c.sqlite3", max_bytes=1, prune_every=0)
+        _put(saver, "t1", [HumanMessage("첫 번째")])
+
+        saver.prune()
+
+        assert load_thread(saver, "t1") == ([], {})
+        assert saver.size_bytes() == 0
@@ -0,0 +1,84 @@
+"""
+도구 결과 압축 미들웨어 테스트
+"""
+
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from middleware.compaction import COMPACTED_PREFIX, SUPERSEDED_CONTENT, ToolOutputCompactionMiddleware, build_stub
+
+HYBRID_REPR = (
+    "count=2 cases=[HybridCase(id='101', title='이직 고민', category='커리어', summary='" + "요약 " * 100 + "', "
+    "keywords='이직', source='okky', score=0.0325, found_by=['vector', 'graph']), "
+    "HybridCase(id='202', title='성장 정체', category='커리어', summary='요약', keywords='성장', source='okky', "
+    "score=0.0161, found_by=['vector'])]"
+)
+
+
+def _turn(index: int, tool: str, args: dict, content: str) -> list:
+    call_id = f"c{index}"
+    return [
+        HumanMessage(f"질문 {index}", id=f"h{index}"),
+        AIMessage("", tool_calls=[{"name": tool, "args": args, "id": call_id}], id=f"a{index}"),
+        ToolMessage(content, tool_call_id=call_id, name=tool, id=f"t{index}"),
+        AIMessage(f"답변 {index}", id=f"r{index}"),
+    ]
+
+
+class TestCompactionClass:
+    def test_stub_from_repr(self):
+        """pydantic repr 결과에서 id / 제목 / 점수만 남김"""
+        stub = build_stub("hybrid_search", HYBRID_REPR)
+
+        assert stub == "[compacted hybrid_search] 101: 이직 고민 (0.0325); 202: 성장 정체 (0.0161)"
+
+    def test_stub_from_json(self):
+        """JSON 결과 (웹 검색 목록)에서 제목 / 출처 추출"""
+        content = json.dumps([{"title": "기사", "body": "본문 " * 50, "href": "https://example.com"}], ensure_ascii=False)
+
+        assert build_stub("websearch", content) == "[compacted websearch] https://example.com: 기사"
+
+    def test_stub_from_text(self):
+        """구조가 없는 결과는 첫 줄 + 생략된 길이"""
+        stub = build_stub("graph_related_keywords", "🔗 '성장통'와 관련된 키워드:\n\n1. 번아웃")
+
+        assert stub.startswith("[compacted graph_related_keywords] 🔗 '성장통'와 관련된 키워드:")
+
+    def test_compacts_only_previous_turns(self):
+        """지난 턴의 큰 결과만 스텁으로, 현재 턴 결과는 유지 (같은 id로 교체)"""
+        messages = _turn(0, "hybrid_search", {"query": "이직"}, HYBRID_REPR) + _turn(
+            1, "hybrid_search", {"query": "성장"}, HYBRID_REPR
+        )
+        middleware = ToolOutputCompactionMiddleware(trigger_tokens=100, min_tool_tokens=50)
+
+        replacements = middleware.compact(messages)
+
+        assert [m.id for m in replacements] == ["t0"]
+        assert replacements[0].tool_call_id == "c0"
+        assert replacements[0].content.startswith(COMPACTED_PREFIX)
+
+    def test_superseded_outputs(self):
+        """같은 인자의 재호출 / expert는 최신 결과만 유지"""
+        messages = (
+            _turn(0, "websearch", {"query": "a", "page": 1}, "짧음")
+            + _turn(1, "expert", {"job_role": "백엔드"}, "# 백엔드")
+            + _turn(2, "websearch", {"page": 1, "query": "a"}, "짧음")
+            + _turn(3, "expert", {"job_role": "프론트엔드"}, "# 프론트엔드")
+        )
+        middleware = ToolOutputCompactionMiddleware(trigger_tokens=0, min_tool_tokens=10**6)
+
+        replacements = {m.id: m.content for m in middleware.compact(messages)}
+
+        assert replacements == {"t0": SUPERSEDED_CONTENT, "t1": SUPERSEDED_CONTENT}
+
+    def test_below_trigger_and_idempotent(self):
+        """임계값 미만이면 그대로, 이미 압축된 결과는 다시 건드리지 않음"""
+        messages = _turn(0, "hybrid_search", {"query": "이직"}, HYBRID_REPR) + _turn(1, "websearch", {"query": "b"}, "x")
+
+        assert ToolOutputCompactionMiddleware(trigger_tokens=10**6).compact(messages) == []
+
+        middleware = ToolOutputCompactionMiddleware(trigger_tokens=0, min_tool_tokens=10)
+        compacted = {m.id: m for m in middleware.compact(messages)}
+        messages = [compacted.get(m.id, m) for m in messages]
+        assert middleware.compact(messages) == []
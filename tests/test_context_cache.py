@@ -0,0 +1,76 @@
+"""
+Gemini 컨텍스트 캐시 미들웨어 테스트 (가짜 google.genai 클라이언트)
+"""
+
+from types import SimpleNamespace
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from middleware.context_cache import EXPERT_PLACEHOLDER, GeminiContextCacheMiddleware, _CachePlan, extract_expert_prompt
+
+
+class _FakeCaches:
+    def __init__(self, fail: bool = False):
+        self.created = []
+        self.fail = fail
+
+    def create(self, model, config):
+        if self.fail:
+            raise ValueError("Cached content is too small")
+        self.created.append(config)
+        return SimpleNamespace(name=f"cachedContents/{len(self.created)}")
+
+
+def _plan(digest: str = "abc") -> _CachePlan:
+    return _CachePlan(
+        key=("백엔드", "중니어", digest),
+        model="models/gemini-2.5-flash-lite",
+        system_instruction="시스템 프롬프트",
+        tool_specs=[],
+        profile_block="## 개발자 프로필 정보:\n경력: 중니어",
+        messages=[],
+    )
+
+
+class TestContextCacheClass:
+    def test_extract_expert_prompt(self):
+        """최근 expert 도구 결과를 꺼내고 메시지에서는 자리표시자로 대체"""
+        messages = [
+            HumanMessage("질문"),
+            AIMessage("", tool_calls=[{"name": "expert", "args": {"job_role": "백엔드"}, "id": "1"}]),
+            ToolMessage("# backend-architect 전문가 프롬프트", tool_call_id="1", name="expert"),
+        ]
+
+        expert, replaced = extract_expert_prompt(messages)
+
+        assert expert == "# backend-architect 전문가 프롬프트"
+        assert replaced[2].content == EXPERT_PLACEHOLDER
+        assert replaced[2].tool_call_id == "1"
+        assert messages[2].content != EXPERT_PLACEHOLDER  # 원본은 그대로
+
+    def test_no_expert_prompt(self):
+        """expert 결과가 없으면 메시지를 그대로 반환"""
+        messages = [HumanMessage("질문")]
+        assert extract_expert_prompt(messages) == (None, messages)
+
+    def test_handle_registered_once(self):
+        """같은 키는 한 번만 등록하고 이후에는 로컬 레지스트리 사용"""
+        caches = _FakeCaches()
+        middleware = GeminiContextCacheMiddleware(ttl=600, client=SimpleNamespace(caches=caches))
+
+        assert middleware.get_handle(_plan()) == "cachedContents/1"
+        assert middleware.get_handle(_plan()) == "cachedContents/1"
+        assert middleware.get_handle(_plan("def")) == "cachedContents/2"
+        assert len(caches.created) == 2
+        assert caches.created[0].ttl == "600s"
+
+    def test_failure_is_remembered(self):
+        """등록 실패 시 None, 같은 키는 잠시 재시도하지 않음"""
+        caches = _FakeCaches(fail=True)
+        middleware = GeminiContextCacheMiddleware(client=SimpleNamespace(caches=caches))
+
+        assert middleware.get_handle(_plan()) is None
+
+        caches.fail = False
+        assert middleware.get_handle(_plan()) is None
+        assert caches.created == []
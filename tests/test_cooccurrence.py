@@ -0,0 +1,42 @@
+"""
+희소 행렬 키워드 공동 출현 테스트
+"""
+
+import random
+
+from utils.cooccurrence import CooccurrenceMatrix, reference_edges
+
+
+def _build(documents_keywords: list[list[str]], min_weight: int = 1) -> dict[tuple[str, str], int]:
+    matrix = CooccurrenceMatrix()
+    for keywords in documents_keywords:
+        matrix.add_document(keywords)
+    return matrix.edges(min_weight=min_weight).to_dict()
+
+
+class TestCooccurrenceMatrixClass:
+    def test_matches_reference_with_duplicates(self):
+        """중복/빈 키워드가 섞여도 기존 중첩 루프와 가중치가 같은지 테스트"""
+        docs = [
+            ["번아웃", "리더십", "번아웃", ""],
+            ["리더십", "커리어", "번아웃"],
+            ["커리어"],
+            [],
+            ["커리어", "리더십", "리더십"],
+        ]
+        assert _build(docs) == reference_edges(docs)
+        # 문서 1의 중복 번아웃 2회 + 문서 2의 1회
+        assert _build(docs)[("리더십", "번아웃")] == 3
+
+    def test_matches_reference_random(self):
+        """무작위 문서 집합에서 기존 계산과 일치하는지 테스트"""
+        rng = random.Random(7)
+        vocab = [f"키워드{i}" for i in range(40)]
+        docs = [[rng.choice(vocab) for _ in range(rng.randint(0, 8))] for _ in range(300)]
+
+        assert _build(docs) == reference_edges(docs)
+
+    def test_min_weight(self):
+        """최소 가중치 미만 엣지가 제외되는지 테스트"""
+        docs = [["a", "b"], ["a", "b"], ["a", "c"]]
+        assert _build(docs, min_weight=2) == {("a", "b"): 2}
@@ -0,0 +1,57 @@
+"""
+그래프 쿼리 결과 캐시 테스트
+"""
+
+from utils import graph_cache
+from utils.graph_cache import cached_graph_query, clear_graph_cache
+
+
+class TestCachedGraphQueryClass:
+    def _setup(self, monkeypatch, version: list[int]) -> list[tuple]:
+        monkeypatch.setattr(graph_cache, "get_graph_version", lambda graph_name: version[0])
+        monkeypatch.setattr(graph_cache, "GRAPH_VERSION_CHECK_INTERVAL", 0)
+        clear_graph_cache()
+        return []
+
+    def test_hit_with_normalized_arguments(self, monkeypatch):
+        """기본값 포함 여부와 관계없이 같은 인자는 캐시 히트인지 테스트"""
+        calls = self._setup(monkeypatch, [1])
+
+        @cached_graph_query
+        def query(keywords: list[str], graph_name: str = "g", limit: int = 10):
+            calls.append((tuple(keywords), limit))
+            return [{"keywords": keywords}]
+
+        first = query(["번아웃"])
+        first[0]["keywords"].append("오염")
+        assert query(["번아웃"], limit=10) == [{"keywords": ["번아웃"]}]
+        assert len(calls) == 1
+
+    def test_version_bump_invalidates(self, monkeypatch):
+        """그래프 버전이 바뀌면 다시 조회하는지 테스트"""
+        version = [1]
+        calls = self._setup(monkeypatch, version)
+
+        @cached_graph_query
+        def query(category: str, graph_name: str = "g"):
+            calls.append(category)
+            return [category]
+
+        query("성장통")
+        query("성장통")
+        version[0] = 2
+        query("성장통")
+        assert len(calls) == 2
+
+    def test_empty_result_not_cached(self, monkeypatch):
+        """빈 결과(쿼리 실패 포함)는 캐시하지 않는지 테스트"""
+        calls = self._setup(monkeypatch, [1])
+
+        @cached_graph_query
+        def query(graph_name: str = "g"):
+            calls.append(1)
+            return []
+
+        query()
+        query()
+        assert len(calls) == 2
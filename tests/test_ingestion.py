@@ -0,0 +1,82 @@
+"""
+임베딩 → 업서트 파이프라인 테스트 (외부 API 없이 가짜 함수 사용)
+"""
+
+import threading
+import time
+
+import pytest
+
+from utils.ingestion import Batch, IngestionPipeline, TokenBucket, retry_with_backoff
+
+
+def _batches(n: int, size: int = 10) -> list[Batch]:
+    return [
+        Batch(
+            ids=[f"{b}-{i}" for i in range(size)],
+            texts=[f"text {b}-{i}" for i in range(size)],
+            metadatas=[{} for _ in range(size)],
+        )
+        for b in range(n)
+    ]
+
+
+class TestIngestionPipelineClass:
+    def test_token_bucket_rate(self):
+        """버스트 이후에는 초당 rate 개로 제한"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        assert time.monotonic() - start >= 0.09
+
+    def test_retry_with_backoff(self):
+        """일시적 실패는 재시도 후 성공"""
+        attempts = []
+
+        def flaky() -> str:
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError("temporary")
+            return "ok"
+
+        assert retry_with_backoff(flaky, retries=3, base_delay=0.001) == "ok"
+        assert len(attempts) == 3
+
+    def test_pipeline_overlaps_and_uploads_all(self):
+        """모든 배치가 업로드되고, 임베딩이 동시에 실행됨"""
+        active = []
+        peak = [0]
+        lock = threading.Lock()
+        uploaded: dict[str, list[float]] = {}
+
+        def embed(texts: list[str]) -> list[list[float]]:
+            with lock:
+                active.append(1)
+                peak[0] = max(peak[0], len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+            return [[float(len(t))] for t in texts]
+
+        def upsert(batch: Batch, embeddings: list[list[float]]) -> None:
+            with lock:
+                uploaded.update(zip(batch.ids, embeddings))
+
+        pipeline = IngestionPipeline(embed, upsert, embed_concurrency=4, requests_per_second=1000)
+        report = pipeline.run(_batches(12))
+
+        assert report.documents == 120
+        assert len(uploaded) == 120
+        assert peak[0] > 1
+        assert report.stages["embed"].summary()["calls"] == 12
+
+    def test_pipeline_raises_on_permanent_failure(self):
+        """재시도 후에도 실패하면 예외 전파"""
+
+        def upsert(batch: Batch, embeddings: list[list[float]]) -> None:
+            raise RuntimeError("quota exceeded")
+
+        pipeline = IngestionPipeline(lambda texts: [[0.0] for _ in texts], upsert, retries=0, requests_per_second=1000)
+        with pytest.raises(RuntimeError, match="quota"):
+            pipeline.run(_batches(3))
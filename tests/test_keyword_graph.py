@@ -0,0 +1,62 @@
+"""
+인메모리 CSR 키워드 그래프 스냅샷 테스트
+"""
+
+from utils.keyword_graph import KeywordGraph, bounded_expand
+
+# a - b (5), a - c (3), b - d (2), d - e (1)
+EDGES = [("a", "b", 5), ("a", "c", 3), ("b", "d", 2), ("d", "e", 1)]
+DOC_COUNTS = {"a": 10, "b": 7, "c": 3, "d": 2, "e": 1, "f": 4}
+
+
+class TestKeywordGraphClass:
+    def test_related_sorted_by_weight(self):
+        """관련 키워드가 가중치 내림차순, 원래 결과 형식으로 반환되는지 테스트"""
+        graph = KeywordGraph.from_edges(EDGES, DOC_COUNTS)
+
+        assert graph.related("a") == [
+            {"name": "b", "weight": 5, "documents_count": 7},
+            {"name": "c", "weight": 3, "documents_count": 3},
+        ]
+        assert graph.related("b", limit=1) == [{"name": "a", "weight": 5, "documents_count": 10}]
+        assert graph.related("f") == []
+        assert graph.related("없음") == []
+
+    def test_network_matches_path_semantics(self):
+        """depth hop 이내 경로에 포함된 관계만 반환하는지 테스트"""
+        graph = KeywordGraph.from_edges(EDGES, DOC_COUNTS)
+
+        one_hop = graph.network("a", depth=1)
+        assert sorted(one_hop["nodes"]) == ["a", "b", "c"]
+        assert len(one_hop["edges"]) == 2
+
+        two_hop = graph.network("a", depth=2)
+        pairs = {(e["source"], e["target"]) for e in two_hop["edges"]}
+        assert pairs == {("a", "b"), ("a", "c"), ("b", "d")}
+        assert sorted(two_hop["nodes"]) == ["a", "b", "c", "d"]
+
+    def test_bounded_network_prunes(self):
+        """hop당 top_k / 최소 가중치로 가지치기되는지 테스트"""
+        graph = KeywordGraph.from_edges(EDGES, DOC_COUNTS)
+
+        network = graph.bounded_network("a", depth=2, top_k=1, min_weight=2)
+        pairs = {(e["source"], e["target"]) for e in network["edges"]}
+        assert pairs == {("a", "b"), ("b", "d")}
+        assert network["nodes"] == ["a", "b", "d"]
+        assert network["truncated"] is False
+
+        # 방문한 노드(a)를 제외한 뒤 top_k를 고르므로 작은 top_k에서도 다음 hop으로 진행
+        assert graph.top_neighbors("b", top_k=1) == [("a", 5)]
+        assert graph.top_neighbors("b", top_k=1, exclude={"a"}) == [("d", 2)]
+
+    def test_bounded_expand_caps_hub(self):
+        """허브 키워드에서도 max_nodes / max_edges 상한을 지키는지 테스트"""
+
+        def expand(frontier, visited):
+            # 모든 노드가 1000개의 이웃을 가진 허브
+            return {name: [(f"{name}-{i}", 1000 - i) for i in range(1000)] for name in frontier}
+
+        network = bounded_expand("hub", expand, depth=3, max_nodes=50, max_edges=60)
+        assert len(network["nodes"]) <= 50
+        assert len(network["edges"]) <= 60
+        assert network["truncated"] is True
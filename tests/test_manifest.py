@@ -0,0 +1,33 @@
+"""
+증분 빌드 매니페스트 테스트
+"""
+
+from utils.manifest import content_hash, diff_manifest, load_manifest, save_manifest
+
+
+class TestManifestClass:
+    def test_diff_manifest(self):
+        """신규/변경/삭제/유지 분류"""
+        previous = {"1": content_hash("a"), "2": content_hash("b"), "3": content_hash("c")}
+        current = {"1": content_hash("a"), "2": content_hash("b2"), "4": content_hash("d")}
+
+        diff = diff_manifest(previous, current)
+
+        assert diff.added == ["4"]
+        assert diff.changed == ["2"]
+        assert diff.removed == ["3"]
+        assert diff.unchanged == ["1"]
+        assert diff.to_embed == ["4", "2"]
+
+    def test_no_changes(self):
+        """변경 없는 재실행은 임베딩 대상이 없음"""
+        hashes = {"1": content_hash("a")}
+        assert not diff_manifest(hashes, dict(hashes)).has_changes
+
+    def test_model_change_forces_full_rebuild(self, tmp_path):
+        """모델이 바뀌면 기존 매니페스트 무시"""
+        path = tmp_path / "manifest.json"
+        save_manifest(path, "embedding-query", "pinecone:ns", {"1": "h"})
+
+        assert load_manifest(path, "embedding-query", "pinecone:ns") == {"1": "h"}
+        assert load_manifest(path, "embedding-passage", "pinecone:ns") == {}
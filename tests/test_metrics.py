@@ -0,0 +1,138 @@
+"""
+메트릭 레지스트리 / 데코레이터 / HTTP 엔드포인트 테스트
+"""
+
+import asyncio
+import json
+import urllib.request
+
+import pytest
+
+from utils.metrics import TOOL_CALLS, TOOL_LATENCY, MetricsRegistry, instrument_tool, start_metrics_server, timed
+
+
+class TestMetricsClass:
+    def test_counter_and_gauge(self):
+        """라벨 조합별 카운터 누적, 게이지 증감 / 설정"""
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "호출 수", ["tool"])
+        pending = registry.gauge("pending", "대기 수")
+
+        calls.inc(tool="a")
+        calls.inc(2, tool="a")
+        calls.inc(tool="b")
+        pending.inc()
+        pending.inc()
+        pending.dec()
+
+        assert calls.value(tool="a") == 3
+        assert calls.value(tool="b") == 1
+        assert pending.value() == 1
+        pending.set(5)
+        assert pending.value() == 5
+
+    def test_registry_returns_same_metric(self):
+        """같은 이름은 같은 인스턴스, 다른 타입으로 재등록하면 에러"""
+        registry = MetricsRegistry()
+        counter = registry.counter("x_total", "x")
+
+        assert registry.counter("x_total", "x") is counter
+        with pytest.raises(ValueError):
+            registry.histogram("x_total", "x")
+
+    def test_histogram_quantiles(self):
+        """버킷 내 선형 보간으로 분위수 추정"""
+        histogram = MetricsRegistry().histogram("latency_seconds", "지연", ["backend"], buckets=(0.1, 0.2, 0.4))
+        for _ in range(50):
+            histogram.observe(0.05, backend="pinecone")
+        for _ in range(50):
+            histogram.observe(0.3, backend="pinecone")
+
+        assert histogram.count(backend="pinecone") == 100
+        assert histogram.quantile(0.5, backend="pinecone") == pytest.approx(0.1)
+        assert histogram.quantile(0.99, backend="pinecone") == pytest.approx(0.396)
+        assert histogram.quantile(0.5, backend="falkordb") is None
+
+    def test_prometheus_render(self):
+        """누적 버킷 / _sum / _count 텍스트 포맷"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "지연", ["backend"], buckets=(0.1, 1.0))
+        histogram.observe(0.05, backend="ddgs")
+        histogram.observe(2.0, backend="ddgs")
+
+        lines = registry.render_prometheus().splitlines()
+
+        assert "# TYPE latency_seconds histogram" in lines
+        assert 'latency_seconds_bucket{backend="ddgs",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{backend="ddgs",le="1"} 1' in lines
+        assert 'latency_seconds_bucket{backend="ddgs",le="+Inf"} 2' in lines
+        assert 'latency_seconds_count{backend="ddgs"} 2' in lines
+
+    def test_snapshot(self):
+        """JSON 스냅샷에 p50 / p95 / p99 포함"""
+        registry = MetricsRegistry()
+        registry.histogram("latency_seconds", "지연", ["backend"]).observe(0.2, backend="upstage")
+
+        snapshot = json.loads(json.dumps(registry.snapshot()))
+        series = snapshot["metrics"]["latency_seconds"]["series"][0]
+
+        assert series["labels"] == {"backend": "upstage"}
+        assert series["count"] == 1
+        assert {"p50", "p95", "p99"} <= series.keys()
+
+    def test_timed_decorator(self):
+        """동기 / 비동기 함수 모두 기록, 예외는 에러 카운터 증가 후 그대로 전파"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("op_seconds", "지연", ["backend"])
+        errors = registry.counter("op_errors_total", "실패", ["backend"])
+
+        @timed(histogram, errors, backend="x")
+        def ok() -> int:
+            return 1
+
+        @timed(histogram, errors, backend="x")
+        async def aok() -> int:
+            return 2
+
+        @timed(histogram, errors, backend="x")
+        def fail() -> None:
+            raise RuntimeError("boom")
+
+        assert ok() == 1
+        assert asyncio.run(aok()) == 2
+        with pytest.raises(RuntimeError):
+            fail()
+
+        assert histogram.count(backend="x") == 3
+        assert errors.value(backend="x") == 1
+
+    def test_instrument_tool(self):
+        """도구 지연 시간 + 상태(ok / error)별 호출 수"""
+
+        @instrument_tool("test_tool")
+        def tool(fail: bool = False) -> str:
+            if fail:
+                raise ValueError("bad")
+            return "ok"
+
+        before = TOOL_LATENCY.count(tool="test_tool")
+        tool()
+        with pytest.raises(ValueError):
+            tool(fail=True)
+
+        assert TOOL_LATENCY.count(tool="test_tool") == before + 2
+        assert TOOL_CALLS.value(tool="test_tool", status="ok") >= 1
+        assert TOOL_CALLS.value(tool="test_tool", status="error") >= 1
+
+    def test_http_endpoint(self, monkeypatch):
+        """/metrics (텍스트), /metrics.json 제공, 포트 미지정이면 시작하지 않음"""
+        monkeypatch.delenv("METRICS_PORT", raising=False)
+        assert start_metrics_server() is None
+
+        server = start_metrics_server(port=0)
+        host, port = server.server_address[:2]
+
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            assert "tool_latency_seconds" in response.read().decode("utf-8")
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics.json", timeout=5) as response:
+            assert "backend_latency_seconds" in json.loads(response.read())["metrics"]
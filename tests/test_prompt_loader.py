@@ -0,0 +1,99 @@
+"""
+전문가 프롬프트 로더 (번들 / 핫 리로드) 테스트
+"""
+
+import json
+import os
+
+from schemas import JobRole
+from utils.prompt_loader import PromptLoader, compile_prompts, write_bundle
+
+
+def _write_prompt(directory, name, description="설명", body="본문"):
+    path = directory / f"{name}.md"
+    path.write_text(f"---\nname: {name}\ndescription: {description}\ncategory: engineering\n---\n\n{body}\n", encoding="utf-8")
+    return path
+
+
+def _touch(path, offset_ns):
+    """mtime을 강제로 바꿔 변경 감지 (파일 시스템 시간 해상도와 무관하게)"""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset_ns))
+
+
+class TestPromptLoaderClass:
+    def test_loads_all_prompts_at_init(self, tmp_path):
+        """시작 시 모든 프롬프트를 한 번에 로드, 잘못된 파일은 제외"""
+        _write_prompt(tmp_path, "backend-architect")
+        (tmp_path / "broken.md").write_text("frontmatter 없음", encoding="utf-8")
+
+        loader = PromptLoader(tmp_path)
+
+        assert set(loader.scan_all_prompts()) == {"backend-architect"}
+        assert loader.get_by_role(JobRole.BACKEND).content == "본문"
+        assert loader.get_by_role(JobRole.FRONTEND) is None
+
+    def test_uses_bundle_when_up_to_date(self, tmp_path):
+        """번들 시그니처가 원본과 같으면 번들 내용을 사용"""
+        _write_prompt(tmp_path, "backend-architect")
+        prompts, signatures, errors = compile_prompts(tmp_path)
+        prompts["backend-architect"].content = "번들 본문"
+        write_bundle(tmp_path / "bundle.json", prompts, signatures)
+
+        loader = PromptLoader(tmp_path)
+
+        assert not errors
+        assert loader.load_prompt("backend-architect").content == "번들 본문"
+
+    def test_stale_bundle_is_recompiled(self, tmp_path):
+        """원본이 바뀐 뒤의 번들은 무시하고 원본에서 컴파일"""
+        path = _write_prompt(tmp_path, "backend-architect")
+        prompts, signatures, _ = compile_prompts(tmp_path)
+        write_bundle(tmp_path / "bundle.json", prompts, signatures)
+
+        _write_prompt(tmp_path, "backend-architect", body="수정된 본문")
+        _touch(path, 1_000_000)
+
+        loader = PromptLoader(tmp_path)
+        assert loader.load_prompt("backend-architect").content == "수정된 본문"
+
+    def test_check_for_changes(self, tmp_path):
+        """수정/추가/삭제된 파일만 다시 로드"""
+        backend = _write_prompt(tmp_path, "backend-architect")
+        _write_prompt(tmp_path, "frontend-architect")
+        loader = PromptLoader(tmp_path)
+
+        assert loader.check_for_changes() == []
+
+        _write_prompt(tmp_path, "backend-architect", body="새 본문")
+        _touch(backend, 1_000_000)
+        _write_prompt(tmp_path, "devops-architect")
+        (tmp_path / "frontend-architect.md").unlink()
+
+        assert sorted(loader.check_for_changes()) == ["backend-architect", "devops-architect", "frontend-architect"]
+        assert loader.load_prompt("backend-architect").content == "새 본문"
+        assert loader.load_prompt("devops-architect") is not None
+        assert loader.load_prompt("frontend-architect") is None
+
+    def test_broken_edit_keeps_previous_version(self, tmp_path):
+        """저장 도중 깨진 파일은 이전 버전 유지"""
+        path = _write_prompt(tmp_path, "backend-architect")
+        loader = PromptLoader(tmp_path)
+
+        path.write_text("---\nname: [\n---\n", encoding="utf-8")
+        _touch(path, 1_000_000)
+        loader.check_for_changes()
+
+        assert loader.load_prompt("backend-architect").content == "본문"
+
+    def test_bundle_format(self, tmp_path):
+        """번들은 버전 + 파일 시그니처 + 프롬프트를 담은 JSON"""
+        _write_prompt(tmp_path, "backend-architect")
+        prompts, signatures, _ = compile_prompts(tmp_path)
+        write_bundle(tmp_path / "bundle.json", prompts, signatures)
+
+        data = json.loads((tmp_path / "bundle.json").read_text(encoding="utf-8"))
+
+        assert data["version"] == 1
+        assert set(data["files"]) == {"backend-architect"}
+        assert data["prompts"]["backend-architect"]["metadata"]["name"] == "backend-architect"
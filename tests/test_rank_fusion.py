@@ -0,0 +1,22 @@
+"""
+Reciprocal Rank Fusion 테스트
+"""
+
+from utils.rank_fusion import reciprocal_rank_fusion
+
+
+class TestReciprocalRankFusionClass:
+    def test_shared_document_ranks_first(self):
+        """두 검색기에 모두 나온 문서가 상위로 오고 중복 없이 합쳐지는지 테스트"""
+        fused = reciprocal_rank_fusion({"vector": ["a", "b", "c"], "graph": ["c", "d"]}, k=60)
+
+        ids = [doc_id for doc_id, _, _ in fused]
+        assert ids[0] == "c"
+        assert sorted(ids) == ["a", "b", "c", "d"]
+        assert fused[0][1] == 1 / 63 + 1 / 61
+        assert fused[0][2] == ["vector", "graph"]
+
+    def test_limit_and_duplicates(self):
+        """검색기 내부 중복은 최고 순위만 반영하고 limit을 지키는지 테스트"""
+        fused = reciprocal_rank_fusion({"vector": ["a", "a", "b"]}, k=60, limit=1)
+        assert fused == [("a", 1 / 61, ["vector"])]
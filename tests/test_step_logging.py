@@ -0,0 +1,93 @@
+"""
+스텝 구조화 로깅 미들웨어 테스트
+"""
+
+import json
+import logging
+from types import SimpleNamespace
+
+from langchain.agents.middleware import ModelResponse
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from middleware.step_logging import JsonFormatter, SamplingFilter, StepLoggingMiddleware
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _logger(level=logging.INFO):
+    logger = logging.getLogger(f"test_step_logging.{level}")
+    logger.handlers.clear()
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger, handler
+
+
+def _request():
+    messages = [
+        HumanMessage("질문"),
+        AIMessage("", tool_calls=[{"name": "hybrid_search", "args": {}, "id": "1"}]),
+        ToolMessage("결과", tool_call_id="1"),
+    ]
+    return SimpleNamespace(messages=messages)
+
+
+def _response():
+    message = AIMessage(
+        "답변",
+        tool_calls=[{"name": "websearch", "args": {"query": "q"}, "id": "2"}],
+        usage_metadata={"input_tokens": 120, "output_tokens": 30, "total_tokens": 150},
+    )
+    return ModelResponse(result=[message])
+
+
+class TestStepLoggingClass:
+    def test_step_record(self):
+        """스텝 번호 / 메시지 수 / 토큰 / 도구 이름 기록, 본문은 INFO에서 제외"""
+        logger, handler = _logger()
+        middleware = StepLoggingMiddleware(logger)
+
+        middleware.wrap_model_call(_request(), lambda request: _response())
+
+        assert len(handler.records) == 1
+        fields = handler.records[0].fields
+        assert fields["step"] == 2
+        assert fields["messages"] == 3
+        assert fields["total_tokens"] == 150
+        assert fields["tool_calls"] == ["websearch"]
+        assert "content" not in fields
+
+    def test_debug_includes_content(self):
+        """DEBUG 레벨에서만 모델 출력 전체 기록"""
+        logger, handler = _logger(logging.DEBUG)
+        StepLoggingMiddleware(logger).wrap_model_call(_request(), lambda request: _response())
+
+        assert [r.getMessage() for r in handler.records] == ["model_step", "model_output"]
+        assert handler.records[1].fields["content"] == "답변"
+
+    def test_json_formatter(self):
+        """한 줄 JSON으로 직렬화"""
+        record = logging.LogRecord("x", logging.INFO, __file__, 1, "model_step", None, None)
+        record.fields = {"step": 1, "tool_calls": ["expert"]}
+
+        data = json.loads(JsonFormatter().format(record))
+
+        assert data["event"] == "model_step"
+        assert data["tool_calls"] == ["expert"]
+
+    def test_sampling_filter(self):
+        """샘플링 비율 0이면 INFO는 버리고 WARNING은 항상 통과"""
+        sampling = SamplingFilter(0.0)
+        info = logging.LogRecord("x", logging.INFO, __file__, 1, "m", None, None)
+        warning = logging.LogRecord("x", logging.WARNING, __file__, 1, "m", None, None)
+
+        assert not sampling.filter(info)
+        assert sampling.filter(warning)
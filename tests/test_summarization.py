@@ -0,0 +1,87 @@
+"""
+백그라운드 롤링 요약 미들웨어 테스트 (가짜 요약 모델)
+"""
+
+import threading
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from middleware.summarization import BackgroundSummarizationMiddleware, find_turn_cutoff
+
+
+class _FakeModel:
+    def __init__(self):
+        self.prompts = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def invoke(self, prompt):
+        self.release.wait(timeout=5)
+        self.prompts.append(prompt)
+        return AIMessage(f"요약 {len(self.prompts)}")
+
+
+def _conversation(turns: int) -> list:
+    messages = []
+    for i in range(turns):
+        messages += [
+            HumanMessage(f"질문 {i} " + "내용 " * 50, id=f"h{i}"),
+            AIMessage("", tool_calls=[{"name": "websearch", "args": {"query": "q"}, "id": f"c{i}"}], id=f"a{i}"),
+            ToolMessage("검색 결과 " * 50, tool_call_id=f"c{i}", name="websearch", id=f"t{i}"),
+            AIMessage(f"답변 {i}", id=f"r{i}"),
+        ]
+    return messages
+
+
+def _wait_idle(middleware: BackgroundSummarizationMiddleware) -> None:
+    middleware._executor.submit(lambda: None).result(timeout=5)
+    middleware._executor.shutdown(wait=True)
+
+
+class TestSummarizationClass:
+    def test_find_turn_cutoff(self):
+        """최근 N개 사용자 턴의 시작 (HumanMessage 경계)"""
+        messages = _conversation(3)
+
+        assert find_turn_cutoff(messages, 2) == 4
+        assert find_turn_cutoff(messages, 1) == 8
+        assert find_turn_cutoff(messages, 5) == 0
+
+    def test_schedule_below_threshold(self):
+        """임계값 미만이면 요약하지 않음"""
+        model = _FakeModel()
+        middleware = BackgroundSummarizationMiddleware(model, max_tokens_before_summary=10**6)
+
+        assert not middleware.schedule("t", _conversation(4))
+        assert middleware.get_summary("t") is None
+
+    def test_rolling_summary(self):
+        """요약은 최근 턴을 제외한 구간만 덮고, 다음 갱신은 이전 요약에 이어서 진행"""
+        model = _FakeModel()
+        middleware = BackgroundSummarizationMiddleware(model, max_tokens_before_summary=10, turns_to_keep=1, max_workers=1)
+
+        assert middleware.schedule("t", _conversation(2))
+        middleware._executor.submit(lambda: None).result(timeout=5)
+        summary = middleware.get_summary("t")
+        assert summary.text == "요약 1"
+        assert summary.covered == 4
+        assert summary.last_message_id == "r0"
+
+        assert middleware.schedule("t", _conversation(3))
+        _wait_idle(middleware)
+        assert middleware.get_summary("t").covered == 8
+        assert "요약 1" in model.prompts[1]
+        assert "질문 0" not in model.prompts[1]
+
+    def test_pending_refresh_is_not_duplicated(self):
+        """같은 스레드의 요약이 진행 중이면 새 작업을 등록하지 않음"""
+        model = _FakeModel()
+        model.release.clear()
+        middleware = BackgroundSummarizationMiddleware(model, max_tokens_before_summary=10, turns_to_keep=1)
+
+        assert middleware.schedule("t", _conversation(3))
+        assert not middleware.schedule("t", _conversation(3))
+
+        model.release.set()
+        _wait_idle(middleware)
+        assert len(model.prompts) == 1
@@ -0,0 +1,51 @@
+"""
+시스템 프롬프트 메모이제이션 / 프리픽스 안정성 테스트
+"""
+
+from middleware.system_prompt import build_static_prefix, build_system_prompt, split_system_prompt
+from schemas import CareerLevel, CommonCompetencies, JobRole, UserProfile
+
+
+def _profile(**overrides) -> UserProfile:
+    data = {
+        "name": "테스터",
+        "career_level": CareerLevel.MID,
+        "years_of_experience": 4,
+        "job_role": JobRole.BACKEND,
+        "tech_stack": ["python", "aws"],
+    }
+    data.update(overrides)
+    return UserProfile(**data)
+
+
+class TestSystemPromptClass:
+    def test_memoized_per_fingerprint(self):
+        """같은 프로필 내용이면 같은 문자열 객체 반환 (이름은 fingerprint에서 제외)"""
+        first = build_system_prompt(_profile())
+        second = build_system_prompt(_profile(name="다른 이름"))
+
+        assert first is second
+
+    def test_profile_block_is_last(self):
+        """정적 프리픽스가 앞, 프로필 블록이 마지막"""
+        profile = _profile()
+        prefix, profile_block = split_system_prompt(build_system_prompt(profile))
+
+        assert prefix == build_static_prefix(CareerLevel.MID)
+        assert profile_block.rstrip().endswith(profile.to_context_string())
+
+    def test_prefix_identical_across_profiles(self):
+        """같은 경력 단계면 프로필이 달라도 프리픽스가 바이트 단위로 동일"""
+        a = build_system_prompt(_profile())
+        b = build_system_prompt(_profile(job_role=JobRole.FRONTEND, tech_stack=["react"]))
+
+        assert a != b
+        assert split_system_prompt(a)[0] == split_system_prompt(b)[0]
+
+    def test_level_specific_competencies(self):
+        """Enum 경력 단계로 해당 단계의 공통 역량 조회"""
+        common = CommonCompetencies()
+
+        assert common.get_common_comps(CareerLevel.JUNIOR) == CommonCompetencies.COMMON_COMPETENCIES[CareerLevel.JUNIOR]
+        assert "주니어 멘토링" in build_static_prefix(CareerLevel.MID)
+        assert "주니어 멘토링" not in build_static_prefix(CareerLevel.SENIOR)
@@ -0,0 +1,57 @@
+"""
+챗봇 도구 스키마 테스트 (모델에 노출되는 인자 / 함수 호출 스키마 변환)
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def chat_tools():
+    # 도구 모듈은 import 시점에 main 리소스를 가져오므로 외부 서비스 대역을 먼저 설치
+    from benchmarks.environment import install
+
+    install(corpus_size=200, dimension=64)
+
+    from tools import chat_tools
+
+    return chat_tools
+
+
+class TestToolSchemasClass:
+    def test_convert_to_openai_tool(self, chat_tools):
+        """챗봇의 모든 도구가 함수 호출 스키마로 변환되고 runtime은 모델에 노출되지 않음"""
+        from langchain_core.utils.function_calling import convert_to_openai_tool
+
+        for tool in chat_tools:
+            parameters = convert_to_openai_tool(tool)["function"]["parameters"]
+            assert "runtime" not in parameters.get("properties", {}), tool.name
+            assert "runtime" not in tool.tool_call_schema.model_fields, tool.name
+
+    def test_runtime_stream_writer(self, chat_tools):
+        """args_schema를 쓰는 도구에도 runtime이 주입되어 진행 메시지가 custom 스트림으로 전달"""
+        from langchain.agents import create_agent
+
+        from benchmarks.fakes import ScriptedChatModel
+        from tools import ddgs_search, expert_search, hybrid_search, sementic_search
+
+        calls = [
+            {"name": expert_search.name, "args": {"job_role": "백엔드 개발자"}},
+            {"name": sementic_search.name, "args": {"query": "이직 준비"}},
+            {"name": hybrid_search.name, "args": {"query": "성장 슬럼프", "keywords": "성장통"}},
+            {"name": ddgs_search.name, "args": {"query": "개발자 커리어 로드맵"}},
+        ]
+        tools = [expert_search, sementic_search, hybrid_search, ddgs_search]
+        agent = create_agent(model=ScriptedChatModel(script=[calls]), tools=tools)
+
+        async def collect() -> list[str]:
+            inputs = {"messages": [{"role": "user", "content": "상담해 주세요"}]}
+            return [chunk async for chunk in agent.astream(inputs, stream_mode="custom")]
+
+        chunks = asyncio.run(collect())
+
+        assert any("전문가 어드바이스 검색 중" in chunk for chunk in chunks), chunks
+        assert any("Search Reference Datas" in chunk for chunk in chunks), chunks
+        assert any("Hybrid Search" in chunk for chunk in chunks), chunks
+        assert any("Start Web Search" in chunk for chunk in chunks), chunks
@@ -0,0 +1,52 @@
+"""
+로컬 NumPy 벡터 스토어 테스트
+"""
+
+import numpy as np
+import pytest
+
+from utils.vector_store import LocalVectorStore
+
+
+def _make_store(tmp_path) -> tuple[LocalVectorStore, np.ndarray]:
+    rng = np.random.default_rng(42)
+    vectors = rng.normal(size=(50, 16)).astype(np.float32)
+    ids = [str(i) for i in range(50)]
+    metadatas = [{"title": f"문서 {i}", "category": "성장통" if i % 2 else "번아웃"} for i in range(50)]
+
+    LocalVectorStore.write(tmp_path, ids, vectors, metadatas)
+    return LocalVectorStore(tmp_path), vectors
+
+
+class TestLocalVectorStoreClass:
+    def test_write_rejects_empty(self, tmp_path):
+        """빈 입력은 AxisError 대신 명확한 ValueError, 파일도 만들지 않음"""
+        with pytest.raises(ValueError, match="벡터가 없습니다"):
+            LocalVectorStore.write(tmp_path / "store", [], [], [])
+        with pytest.raises(ValueError, match="길이가 다릅니다"):
+            LocalVectorStore.write(tmp_path / "store", ["a"], np.ones((2, 4)), [{}])
+        assert not (tmp_path / "store").exists()
+
+    def test_exact_top_k(self, tmp_path):
+        """코사인 유사도 정확 검색 결과가 brute-force 정렬과 일치"""
+        store, vectors = _make_store(tmp_path)
+        query = vectors[7] + 0.01
+
+        matches = store.query(query.tolist(), top_k=5)
+
+        normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        expected = np.argsort(-(normed @ (query / np.linalg.norm(query))))[:5]
+
+        assert [m.id for m in matches] == [str(i) for i in expected]
+        assert matches[0].id == "7"
+        assert matches[0].metadata["title"] == "문서 7"
+        assert all(a.score >= b.score for a, b in zip(matches, matches[1:]))
+
+    def test_filtered_search(self, tmp_path):
+        """메타데이터 필터 ($eq) 적용"""
+        store, vectors = _make_store(tmp_path)
+
+        matches = store.query(vectors[0].tolist(), top_k=3, filter={"category": {"$eq": "성장통"}})
+
+        assert len(matches) == 3
+        assert all(m.metadata["category"] == "성장통" for m in matches)
@@ -4,11 +4,24 @@ Tools for LangChain Agent
 """
 
 from tools.expert_advice import expert_search
+from tools.graph_search import graph_related_keywords
+from tools.hybrid_search import hybrid_search
 from tools.pinecone_search import sementic_search
 from tools.web_search import ddgs_search
 
+# 챗봇 에이전트에 등록하는 도구 (pages/chatbot.py, 벤치마크 공용)
+# hybrid_search: 벡터 검색 + 그래프 키워드 검색을 한 번에 (pinecone_search / graph_keyword_search 대체)
+chat_tools = [
+    hybrid_search,
+    graph_related_keywords,
+    ddgs_search,
+    expert_search,
+]
+
 __all__ = [
+    "chat_tools",
     "ddgs_search",
     "sementic_search",
     "expert_search",
+    "hybrid_search",
 ]
@@ -1,15 +1,64 @@
-"""그래프 데이터베이스 검색 도구 (LangChain Tool)."""
+"""그래프 데이터베이스 검색 도구 (LangChain Tool).
 
-from langchain.tools import tool
+각 도구는 동기(invoke)와 비동기(ainvoke / agent.astream) 구현을 모두 가집니다.
+
+runtime은 `ToolRuntime` 그대로 어노테이션해야 ToolNode가 주입하고 모델용 스키마에서 제외합니다.
+(`ToolRuntime | None`은 주입 대상으로 인식되지 않아 모델에 노출되고 스키마 변환이 실패함)
+기본값 None은 에이전트 밖에서 직접 invoke할 때를 위한 것입니다.
+"""
+
+from langchain.tools import ToolRuntime
+from langchain_core.tools import StructuredTool
 
 from utils.graph_queries import (
+    aget_related_keywords,
+    asearch_documents_by_keywords,
     get_related_keywords,
     search_documents_by_keywords,
 )
+from utils.metrics import instrument_tool
+
+
+def _parse_keywords(keywords: str) -> list[str]:
+    return [kw.strip() for kw in keywords.split(",") if kw.strip()]
+
+
+def _format_documents(keywords: str, documents: list[dict]) -> str:
+    if not documents:
+        return f"키워드 '{keywords}'와 관련된 문서를 찾을 수 없습니다."
+
+    # 결과 포매팅
+    result_lines = [f"🔍 키워드 '{keywords}' 검색 결과: {len(documents)}개 문서 발견\n"]
+
+    for i, doc in enumerate(documents, 1):
+        matched_kw = ", ".join(doc["matched_keywords"])
+        result_lines.append(f"[{i}] {doc['title']}")
+        result_lines.append(f"    카테고리: {doc['category']}")
+        result_lines.append(f"    매칭 키워드: {matched_kw}")
+        result_lines.append(f"    관련도: {doc['relevance_score']}점")
+        result_lines.append(f"    문제: {doc['problem_summary'][:100]}...")
+        result_lines.append("")
+
+    return "\n".join(result_lines)
+
+
+def _format_related(keyword: str, related: list[dict]) -> str:
+    if not related:
+        return f"키워드 '{keyword}'와 관련된 키워드를 찾을 수 없습니다."
 
+    # 결과 포매팅
+    result_lines = [f"🔗 '{keyword}'와 관련된 키워드:\n"]
 
-@tool
-def graph_keyword_search(keywords: str) -> str:
+    for i, kw in enumerate(related, 1):
+        result_lines.append(f"{i}. {kw['name']}")
+        result_lines.append(f"   - 공동 출현: {kw['weight']}회")
+        result_lines.append(f"   - 관련 문서: {kw['documents_count']}개")
+
+    return "\n".join(result_lines)
+
+
+@instrument_tool("graph_keyword_search")
+def _graph_keyword_search(keywords: str, runtime: ToolRuntime = None) -> str:  # type: ignore[assignment]
     """키워드 기반 그래프 검색으로 관련 개발자 사례를 찾습니다.
 
     이 도구는 FalkorDB 그래프 데이터베이스를 사용하여 키워드와 연결된 문서를 검색합니다.
@@ -17,43 +66,60 @@ def graph_keyword_search(keywords: str) -> str:
 
     Args:
         keywords: 검색할 키워드들 (쉼표로 구분, 예: "성장통, 재택근무, 동기부여")
+        runtime: LangGraph 런타임 컨텍스트 (optional)
 
     Returns:
         검색된 문서 정보 (제목, 카테고리, 문제 요약, 매칭 키워드)
     """
     # 키워드 파싱
-    keyword_list = [kw.strip() for kw in keywords.split(",") if kw.strip()]
+    keyword_list = _parse_keywords(keywords)
 
     if not keyword_list:
         return "검색할 키워드를 입력해주세요."
 
+    writer = runtime.stream_writer if runtime else None
+    if writer:
+        writer(f"🕸️ Graph Search: {keyword_list}")
+
     try:
         # 그래프 검색 실행
         documents = search_documents_by_keywords(keyword_list, limit=5)
 
-        if not documents:
-            return f"키워드 '{keywords}'와 관련된 문서를 찾을 수 없습니다."
+        if writer:
+            writer(f"🕸️ Find Documents: {len(documents)}")
+
+        return _format_documents(keywords, documents)
+
+    except Exception as e:
+        return f"❌ 그래프 검색 중 오류 발생: {str(e)}"
 
-        # 결과 포매팅
-        result_lines = [f"🔍 키워드 '{keywords}' 검색 결과: {len(documents)}개 문서 발견\n"]
 
-        for i, doc in enumerate(documents, 1):
-            matched_kw = ", ".join(doc["matched_keywords"])
-            result_lines.append(f"[{i}] {doc['title']}")
-            result_lines.append(f"    카테고리: {doc['category']}")
-            result_lines.append(f"    매칭 키워드: {matched_kw}")
-            result_lines.append(f"    관련도: {doc['relevance_score']}점")
-            result_lines.append(f"    문제: {doc['problem_summary'][:100]}...")
-            result_lines.append("")
+@instrument_tool("graph_keyword_search")
+async def _agraph_keyword_search(keywords: str, runtime: ToolRuntime = None) -> str:  # type: ignore[assignment]
+    """graph_keyword_search 비동기 버전"""
+    keyword_list = _parse_keywords(keywords)
 
-        return "\n".join(result_lines)
+    if not keyword_list:
+        return "검색할 키워드를 입력해주세요."
+
+    writer = runtime.stream_writer if runtime else None
+    if writer:
+        writer(f"🕸️ Graph Search: {keyword_list}")
+
+    try:
+        documents = await asearch_documents_by_keywords(keyword_list, limit=5)
+
+        if writer:
+            writer(f"🕸️ Find Documents: {len(documents)}")
+
+        return _format_documents(keywords, documents)
 
     except Exception as e:
         return f"❌ 그래프 검색 중 오류 발생: {str(e)}"
 
 
-@tool
-def graph_related_keywords(keyword: str) -> str:
+@instrument_tool("graph_related_keywords")
+def _graph_related_keywords(keyword: str, runtime: ToolRuntime = None) -> str:  # type: ignore[assignment]
     """특정 키워드와 관련된 다른 키워드들을 찾습니다.
 
     이 도구는 그래프 데이터베이스에서 키워드 간의 공동 출현 관계를 분석하여
@@ -61,6 +127,7 @@ def graph_related_keywords(keyword: str) -> str:
 
     Args:
         keyword: 기준 키워드 (예: "성장통")
+        runtime: LangGraph 런타임 컨텍스트 (optional)
 
     Returns:
         관련 키워드 목록 (공동 출현 빈도 순)
@@ -68,27 +135,57 @@ def graph_related_keywords(keyword: str) -> str:
     if not keyword:
         return "검색할 키워드를 입력해주세요."
 
+    writer = runtime.stream_writer if runtime else None
+    if writer:
+        writer(f"🔗 Related Keywords: [{keyword}]")
+
     try:
         # 관련 키워드 검색
         related = get_related_keywords(keyword, limit=10)
 
-        if not related:
-            return f"키워드 '{keyword}'와 관련된 키워드를 찾을 수 없습니다."
+        if writer:
+            writer(f"🔗 Find Keywords: {len(related)}")
+
+        return _format_related(keyword, related)
+
+    except Exception as e:
+        return f"❌ 관련 키워드 검색 중 오류 발생: {str(e)}"
+
+
+@instrument_tool("graph_related_keywords")
+async def _agraph_related_keywords(keyword: str, runtime: ToolRuntime = None) -> str:  # type: ignore[assignment]
+    """graph_related_keywords 비동기 버전"""
+    if not keyword:
+        return "검색할 키워드를 입력해주세요."
+
+    writer = runtime.stream_writer if runtime else None
+    if writer:
+        writer(f"🔗 Related Keywords: [{keyword}]")
 
-        # 결과 포매팅
-        result_lines = [f"🔗 '{keyword}'와 관련된 키워드:\n"]
+    try:
+        related = await aget_related_keywords(keyword, limit=10)
 
-        for i, kw in enumerate(related, 1):
-            result_lines.append(f"{i}. {kw['name']}")
-            result_lines.append(f"   - 공동 출현: {kw['weight']}회")
-            result_lines.append(f"   - 관련 문서: {kw['documents_count']}개")
+        if writer:
+            writer(f"🔗 Find Keywords: {len(related)}")
 
-        return "\n".join(result_lines)
+        return _format_related(keyword, related)
 
     except Exception as e:
         return f"❌ 관련 키워드 검색 중 오류 발생: {str(e)}"
 
 
+graph_keyword_search = StructuredTool.from_function(
+    func=_graph_keyword_search,
+    coroutine=_agraph_keyword_search,
+    name="graph_keyword_search",
+)
+
+graph_related_keywords = StructuredTool.from_function(
+    func=_graph_related_keywords,
+    coroutine=_agraph_related_keywords,
+    name="graph_related_keywords",
+)
+
 # 도구 목록 (export)
 graph_tools = [graph_keyword_search, graph_related_keywords]
 
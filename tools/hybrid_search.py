@@ -0,0 +1,158 @@
+"""하이브리드 검색 도구: 벡터 검색 + 키워드 그래프 검색을 동시에 실행하고 RRF로 융합.
+
+pinecone_search / graph_keyword_search를 각각 호출하면 ReAct 스텝이 늘고
+같은 문서가 컨텍스트에 두 번 들어가므로, 한 번의 호출로 중복 없는 순위 리스트를 반환합니다.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from langchain.tools import ToolRuntime
+from langchain_core.tools import StructuredTool
+
+from schemas.tool_hybrid import HybridCase, HybridSearchInput, HybridSearchResponse
+from tools.pinecone_search import _acreate_query_embedding, _create_query_embedding, _get_store
+from utils.graph_queries import asearch_documents_by_keywords, search_documents_by_keywords
+from utils.metrics import instrument_tool
+from utils.rank_fusion import reciprocal_rank_fusion
+
+# 검색기별 후보 수 / 최종 반환 수
+CANDIDATES_PER_RETRIEVER = 10
+HYBRID_TOP_K = 6
+
+
+def _parse_keywords(keywords: str) -> list[str]:
+    return [kw.strip() for kw in keywords.split(",") if kw.strip()]
+
+
+def _vector_candidates(matches: list) -> list[dict[str, Any]]:
+    """VectorMatch → 공통 문서 포맷 (id는 그래프 Document.id와 같은 메타데이터 id)"""
+    return [
+        {
+            "id": str(match.metadata.get("id", match.id)),
+            "title": match.metadata.get("title", "N/A"),
+            "category": match.metadata.get("category", "N/A"),
+            "summary": match.metadata.get("problem_summary", "N/A"),
+            "keywords": match.metadata.get("keywords", ""),
+            "source": match.metadata.get("source", "N/A"),
+        }
+        for match in matches
+    ]
+
+
+def _graph_candidates(documents: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """그래프 검색 결과 → 공통 문서 포맷"""
+    return [
+        {
+            "id": str(doc["id"]),
+            "title": doc.get("title") or "N/A",
+            "category": doc.get("category") or "N/A",
+            "summary": doc.get("problem_summary") or "N/A",
+            "keywords": ", ".join(doc.get("matched_keywords") or []),
+            "source": doc.get("source") or "N/A",
+        }
+        for doc in documents
+    ]
+
+
+def _fuse(results: dict[str, list[dict[str, Any]]]) -> HybridSearchResponse:
+    """검색기별 결과를 RRF로 융합하고 문서 id로 중복 제거"""
+    documents: dict[str, dict[str, Any]] = {}
+    for candidates in results.values():
+        for doc in candidates:
+            # 벡터 결과(전체 키워드 포함)를 우선 보관
+            documents.setdefault(doc["id"], doc)
+
+    rankings = {name: [doc["id"] for doc in candidates] for name, candidates in results.items()}
+    fused = reciprocal_rank_fusion(rankings, limit=HYBRID_TOP_K)
+
+    cases = [HybridCase(**documents[doc_id], score=round(score, 4), found_by=found_by) for doc_id, score, found_by in fused]
+    return HybridSearchResponse(count=len(cases), cases=cases)
+
+
+@instrument_tool("hybrid_search")
+def _hybrid_search(query: str, keywords: str = "", runtime: ToolRuntime = None) -> HybridSearchResponse:  # type: ignore[assignment]
+    """Search similar developer cases with vector search and keyword-graph search at once,
+    fused into one deduplicated ranked list (reciprocal rank fusion).
+
+    Use this instead of calling pinecone_search and graph_keyword_search separately.
+
+    Args:
+        query(str): the concern or situation to search for
+        keywords(str): comma-separated core keywords for the graph search (optional)
+
+    Returns:
+        HybridSearchResponse: count, cases (id, title, category, summary, keywords, source, score, found_by)
+    """
+    keyword_list = _parse_keywords(keywords)
+    writer = runtime.stream_writer if runtime else None
+    if writer:
+        writer(f"🧬 Hybrid Search: [{query}] + {keyword_list}")
+
+    def vector() -> list[dict[str, Any]]:
+        embedding = _create_query_embedding(query)
+        return _vector_candidates(_get_store().query(embedding, top_k=CANDIDATES_PER_RETRIEVER))
+
+    def graph() -> list[dict[str, Any]]:
+        return _graph_candidates(search_documents_by_keywords(keyword_list, limit=CANDIDATES_PER_RETRIEVER))
+
+    # 두 검색기를 동시에 실행, 한쪽이 실패해도 다른 쪽 결과는 사용
+    results: dict[str, list[dict[str, Any]]] = {}
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="hybrid") as executor:
+        futures = {"vector": executor.submit(vector)}
+        if keyword_list:
+            futures["graph"] = executor.submit(graph)
+
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"⚠️ {name} 검색 실패: {e}")
+                results[name] = []
+
+    response = _fuse(results)
+    if writer:
+        writer(f"🧬 Fused: {response.count} ({', '.join(f'{k} {len(v)}' for k, v in results.items())})")
+    return response
+
+
+@instrument_tool("hybrid_search")
+async def _ahybrid_search(query: str, keywords: str = "", runtime: ToolRuntime = None) -> HybridSearchResponse:  # type: ignore[assignment]
+    """hybrid_search 비동기 버전 (asyncio.gather로 동시 실행)"""
+    keyword_list = _parse_keywords(keywords)
+    writer = runtime.stream_writer if runtime else None
+    if writer:
+        writer(f"🧬 Hybrid Search: [{query}] + {keyword_list}")
+
+    async def vector() -> list[dict[str, Any]]:
+        embedding = await _acreate_query_embedding(query)
+        return _vector_candidates(await _get_store().aquery(embedding, top_k=CANDIDATES_PER_RETRIEVER))
+
+    async def graph() -> list[dict[str, Any]]:
+        if not keyword_list:
+            return []
+        return _graph_candidates(await asearch_documents_by_keywords(keyword_list, limit=CANDIDATES_PER_RETRIEVER))
+
+    names = ["vector", "graph"]
+    outcomes = await asyncio.gather(vector(), graph(), return_exceptions=True)
+
+    results: dict[str, list[dict[str, Any]]] = {}
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"⚠️ {name} 검색 실패: {outcome}")
+            outcome = []
+        results[name] = outcome
+
+    response = _fuse(results)
+    if writer:
+        writer(f"🧬 Fused: {response.count} ({', '.join(f'{k} {len(v)}' for k, v in results.items())})")
+    return response
+
+
+hybrid_search = StructuredTool.from_function(
+    func=_hybrid_search,
+    coroutine=_ahybrid_search,
+    name="hybrid_search",
+    args_schema=HybridSearchInput,
+)
@@ -6,16 +6,35 @@ main.py 에서 구현한 캐시 리소스 사용 권장
 """
 
 import os
+from array import array
 
-from langchain.tools import ToolRuntime, tool
+from langchain.tools import ToolRuntime
+from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
-from main import get_pinecone, get_upstage
+from main import get_async_upstage, get_pinecone, get_upstage, get_vector_store
+from schemas.tool_input import ToolInput
+from utils.cache import DEFAULT_CACHE_DIR, TwoTierCache, make_cache_key, normalize_text
+from utils.metrics import instrument_tool, timed_backend
 
 UPSTAGE_API_KEY = os.getenv("UPSTAGE_API_KEY")
 PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
 index_name = os.getenv("PINECONE_INDEX_NAME", "mid-level-helper")
 namespace = "20251029_crawling"
+EMBEDDING_MODEL = "embedding-query"
+
+# 쿼리 임베딩 캐시: 메모리 LRU + 디스크(SQLite)
+# 임베딩은 float32로 직렬화하여 저장 (4096차원 기준 16KB)
+embedding_cache = TwoTierCache(
+    name="query_embeddings",
+    dumps=lambda vector: array("f", vector).tobytes(),
+    loads=lambda raw: array("f", raw).tolist(),
+    maxsize=int(os.getenv("EMBEDDING_CACHE_SIZE", "512")),
+    ttl=float(os.getenv("EMBEDDING_CACHE_TTL", "86400")),
+    disk_ttl=float(os.getenv("EMBEDDING_CACHE_DISK_TTL", "2592000")) or None,  # 기본 30일
+    disk_maxsize=int(os.getenv("EMBEDDING_CACHE_DISK_SIZE", "5000")) or None,  # 4096차원 기준 약 80MB
+    disk_path=os.getenv("EMBEDDING_CACHE_PATH", str(DEFAULT_CACHE_DIR / "embeddings.sqlite3")),
+)
 
 
 def _get_index():
@@ -23,6 +42,11 @@ def _get_index():
     return get_pinecone
 
 
+def _get_store():
+    """벡터 스토어 반환 (VECTOR_STORE_BACKEND 에 따라 Pinecone 또는 로컬)"""
+    return get_vector_store
+
+
 class PineconeSchemas(BaseModel):
     title: str = Field(description="제목")
     category: str = Field(description="카테고리")
@@ -37,20 +61,59 @@ class RagToolResponseSchemas(BaseModel):
     cases: list[PineconeSchemas] = Field(description="결과 데이터")
 
 
-class PineconeSearchInput(BaseModel):
+class PineconeSearchInput(ToolInput):
     """Pinecone 검색 입력 스키마"""
 
     query: str = Field(description="검색할 고민이나 상황 (예: '성장 슬럼프', '이직 고민')")
 
 
 def _create_query_embedding(query_text: str) -> list[float]:
-    """쿼리 텍스트를 Upstage 임베딩으로 변환"""
-    response = get_upstage.embeddings.create(input=[query_text], model="embedding-query")
-    return response.data[0].embedding
+    """쿼리 텍스트를 Upstage 임베딩으로 변환 (캐시 우선)
+
+    캐시 키: sha256(모델명 + 정규화된 텍스트)
+    히트/미스 통계: embedding_cache.stats
+    """
+    key = make_cache_key(EMBEDDING_MODEL, normalize_text(query_text))
+
+    @timed_backend("upstage", "embed")
+    def _embed() -> list[float]:
+        response = get_upstage.embeddings.create(input=[query_text], model=EMBEDDING_MODEL)
+        return response.data[0].embedding
+
+    return embedding_cache.get_or_compute(key, _embed)
 
 
-@tool("pinecone_search", args_schema=PineconeSearchInput)
-def sementic_search(query: str, runtime: ToolRuntime | None = None) -> RagToolResponseSchemas:
+async def _acreate_query_embedding(query_text: str) -> list[float]:
+    """_create_query_embedding 비동기 버전 (같은 캐시 공유)"""
+    key = make_cache_key(EMBEDDING_MODEL, normalize_text(query_text))
+
+    @timed_backend("upstage", "embed")
+    async def _embed() -> list[float]:
+        response = await get_async_upstage.embeddings.create(input=[query_text], model=EMBEDDING_MODEL)
+        return response.data[0].embedding
+
+    return await embedding_cache.aget_or_compute(key, _embed)
+
+
+def _to_response(matches: list) -> RagToolResponseSchemas:
+    """VectorMatch 리스트 → 도구 응답"""
+    cases = []
+    for match in matches:
+        cases.append(
+            PineconeSchemas(
+                title=match.metadata.get("title", "N/A"),
+                category=match.metadata.get("category", "N/A"),
+                summary=match.metadata.get("problem_summary", "N/A"),
+                keywords=match.metadata.get("keywords", "N/A"),
+                similarity=round(match.score, 2),
+                source=match.metadata.get("source", "N/A"),
+            )
+        )
+    return RagToolResponseSchemas(cases=cases, count=len(cases))
+
+
+@instrument_tool("pinecone_search")
+def _sementic_search(query: str, runtime: ToolRuntime = None) -> RagToolResponseSchemas:  # type: ignore[assignment]
     """Search for similar cases on concerns, reflections, emotions, and more in the Vector Store.
 
     Args:
@@ -76,27 +139,34 @@ def sementic_search(query: str, runtime: ToolRuntime | None = None) -> RagToolRe
         writer(f"✨ Search Reference Datas: [{query}]")
 
     query_embedding = _create_query_embedding(query)
-    index = _get_index()  # Pinecone Index 객체 가져오기
+    store = _get_store()  # 벡터 스토어 (Pinecone / 로컬)
 
-    results = index.query(
-        namespace=namespace,
-        vector=query_embedding,
-        top_k=5,  # 상위 5개
-        include_metadata=True,  # 메타데이터 포함
-    )
+    matches = store.query(query_embedding, top_k=5)  # 상위 5개
 
-    if results and runtime:
-        writer(f"✨ Find Datas: {len(results.matches)}")  # type: ignore
-    cases = []
-    for match in results.matches:  # type: ignore
-        cases.append(
-            PineconeSchemas(
-                title=match.metadata.get("title", "N/A"),
-                category=match.metadata.get("category", "N/A"),
-                summary=match.metadata.get("problem_summary", "N/A"),
-                keywords=match.metadata.get("keywords", "N/A"),
-                similarity=round(match.score, 2),
-                source=match.metadata.get("source", "N/A"),
-            )
-        )
-    return RagToolResponseSchemas(cases=cases, count=len(cases))
+    if matches and runtime:
+        writer(f"✨ Find Datas: {len(matches)}")
+    return _to_response(matches)
+
+
+@instrument_tool("pinecone_search")
+async def _asementic_search(query: str, runtime: ToolRuntime = None) -> RagToolResponseSchemas:  # type: ignore[assignment]
+    """sementic_search 비동기 버전 (AsyncOpenAI 임베딩 + 비동기 벡터 검색)"""
+    if runtime:
+        writer = runtime.stream_writer
+        writer(f"✨ Search Reference Datas: [{query}]")
+
+    query_embedding = await _acreate_query_embedding(query)
+    matches = await _get_store().aquery(query_embedding, top_k=5)
+
+    if matches and runtime:
+        writer(f"✨ Find Datas: {len(matches)}")
+    return _to_response(matches)
+
+
+# 동기(invoke) / 비동기(ainvoke, astream) 구현을 모두 가진 도구
+sementic_search = StructuredTool.from_function(
+    func=_sementic_search,
+    coroutine=_asementic_search,
+    name="pinecone_search",
+    args_schema=PineconeSearchInput,
+)
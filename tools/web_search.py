@@ -1,11 +1,77 @@
+import asyncio
+import json
+import os
+import time
+
 from ddgs import DDGS
-from langchain.tools import ToolRuntime, tool
+from langchain.tools import ToolRuntime
+from langchain_core.tools import StructuredTool
 
 from schemas.tool_ddgs import DDGSSearchInput, WebSearchSchemas
+from utils.cache import DEFAULT_CACHE_DIR, SingleFlight, TwoTierCache, make_cache_key, normalize_text
+from utils.metrics import instrument_tool, timed_backend
+
+REGION = "kr-kr"
+DDGS_CACHE_TTL = float(os.getenv("DDGS_CACHE_TTL", "21600"))  # 기본 6시간
+
+# 웹 검색 결과 캐시: 메모리 LRU + 디스크(SQLite), 세션/프로세스 재시작 간 공유
+web_search_cache = TwoTierCache(
+    name="web_search",
+    dumps=lambda results: json.dumps(results, ensure_ascii=False).encode("utf-8"),
+    loads=lambda raw: json.loads(raw.decode("utf-8")),
+    maxsize=int(os.getenv("DDGS_CACHE_SIZE", "256")),
+    ttl=DDGS_CACHE_TTL,
+    disk_ttl=DDGS_CACHE_TTL,
+    disk_path=os.getenv("DDGS_CACHE_PATH", str(DEFAULT_CACHE_DIR / "web_search.sqlite3")),
+)
+
+# 같은 검색이 동시에 들어오면 (다른 세션 포함) 한 번만 스크래핑
+_inflight = SingleFlight()
+
+
+@timed_backend("ddgs", "text")
+def _ddgs_text(query: str, page: int) -> list[dict[str, str]]:
+    """실제 DDGS 스크래핑 (캐시 미스일 때만 호출)"""
+    return DDGS().text(
+        query=query,
+        region=REGION,
+        max_results=10,
+        page=page,
+        backend="auto",
+    )
+
+
+def _search(query: str, page: int) -> list[dict[str, str]]:
+    """DDGS 검색 (캐시 → 진행 중인 같은 검색 공유 → 실제 스크래핑)
+
+    캐시 키: sha256(region + page + 정규화된 쿼리)
+    빈 결과는 캐시하지 않습니다 (일시적인 차단/실패일 수 있음).
+    """
+    key = make_cache_key("ddgs", REGION, str(page), normalize_text(query))
+    cached = web_search_cache.get(key)
+    if cached is not None:
+        return cached
+
+    def fetch() -> list[dict[str, str]]:
+        # 앞선 호출이 방금 채웠을 수 있으므로 한 번 더 확인
+        cached = web_search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        start = time.perf_counter()
+        results = _ddgs_text(query, page)
+        web_search_cache.record_miss(time.perf_counter() - start)
+
+        if results:
+            web_search_cache.set(key, results)
+        return results
 
+    results, _ = _inflight.do(key, fetch)
+    return results
 
-@tool("websearch", args_schema=DDGSSearchInput)
-def ddgs_search(query: str, page: int = 1, runtime: ToolRuntime | None = None) -> list[WebSearchSchemas]:
+
+@instrument_tool("websearch")
+def _ddgs_search(query: str, page: int = 1, runtime: ToolRuntime = None) -> list[WebSearchSchemas]:  # type: ignore[assignment]
     """Perform a web search for the user's question.
     You need to understand the user's intent and find the information and answer they're looking for.
 
@@ -16,14 +82,29 @@ def ddgs_search(query: str, page: int = 1, runtime: ToolRuntime | None = None) -
     if runtime:
         writer = runtime.stream_writer
         writer("🌐 Start Web Search")
-    results = DDGS().text(
-        query=query,
-        region="kr-kr",
-        max_results=10,
-        page=page,
-        backend="auto",
-    )
+    results = _search(query, page)
 
     if results and runtime:
         writer(f"🌐 Finish Web Search: {len(results)} 문서 찾음, Page: {page}")
     return [WebSearchSchemas(**data) for data in results]
+
+
+@instrument_tool("websearch")
+async def _addgs_search(query: str, page: int = 1, runtime: ToolRuntime = None) -> list[WebSearchSchemas]:  # type: ignore[assignment]
+    """ddgs_search 비동기 버전 (DDGS는 동기 클라이언트이므로 스레드에서 실행)"""
+    if runtime:
+        writer = runtime.stream_writer
+        writer("🌐 Start Web Search")
+    results = await asyncio.to_thread(_search, query, page)
+
+    if results and runtime:
+        writer(f"🌐 Finish Web Search: {len(results)} 문서 찾음, Page: {page}")
+    return [WebSearchSchemas(**data) for data in results]
+
+
+ddgs_search = StructuredTool.from_function(
+    func=_ddgs_search,
+    coroutine=_addgs_search,
+    name="websearch",
+    args_schema=DDGSSearchInput,
+)
@@ -0,0 +1,83 @@
+"""백그라운드 이벤트 루프 유틸리티.
+
+Streamlit 스크립트는 동기 코드로 실행되므로, 비동기 에이전트(`astream`)와 비동기 클라이언트
+(AsyncOpenAI, PineconeAsyncio, FalkorDB asyncio)는 프로세스 전역 이벤트 루프 하나에서 실행합니다.
+
+- 루프가 하나뿐이므로 비동기 클라이언트/커넥션 풀을 프로세스 전역으로 공유할 수 있습니다.
+  (rerun마다 asyncio.run()으로 새 루프를 만들면 루프에 묶인 커넥션을 재사용할 수 없음)
+- UI 갱신은 스크립트 스레드에서 해야 하므로, 비동기 제너레이터는 큐를 통해 동기 이터레이터로 넘깁니다.
+"""
+
+import asyncio
+import queue
+import threading
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from typing import Any
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+_DONE = object()
+
+
+class _Raised:
+    """비동기 제너레이터에서 발생한 예외 전달용"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """프로세스 전역 이벤트 루프 반환 (최초 호출 시 데몬 스레드에서 시작)"""
+    global _loop
+
+    if _loop is not None:
+        return _loop
+
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="async-loop", daemon=True)
+            thread.start()
+            _loop = loop
+    return _loop
+
+
+def run_sync[T](coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """코루틴을 백그라운드 루프에서 실행하고 결과를 기다림 (동기 코드용)"""
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    try:
+        return future.result(timeout)
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def iterate_in_background[T](agen: AsyncIterator[T]) -> Iterator[T]:
+    """비동기 제너레이터를 백그라운드 루프에서 실행하며 동기적으로 순회.
+
+    소비 측이 중간에 멈추면 (break, 예외, Streamlit rerun) 비동기 작업도 취소됩니다.
+    """
+    items: queue.Queue[Any] = queue.Queue()
+
+    async def pump() -> None:
+        try:
+            async for item in agen:
+                items.put(item)
+        except BaseException as e:
+            items.put(_Raised(e))
+        finally:
+            items.put(_DONE)
+
+    future = asyncio.run_coroutine_threadsafe(pump(), get_background_loop())
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Raised):
+                raise item.error
+            yield item
+    finally:
+        if not future.done():
+            future.cancel()
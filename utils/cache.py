@@ -0,0 +1,389 @@
+"""프로세스 내 LRU + 디스크(SQLite) 2단 캐시 유틸리티.
+
+- TTLCache: 크기/TTL 제한이 있는 스레드 안전 LRU 캐시
+- SQLiteCache: 프로세스 재시작 후에도 유지되는 디스크 KV 저장소 (TTL / 최대 행 수 제한)
+- TwoTierCache: 메모리 → 디스크 → 원격 호출 순으로 조회하는 캐시
+- SingleFlight: 같은 키의 동시 요청을 한 번의 호출로 합치는 중복 제거기
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+# 기본 캐시 디렉토리 (프로젝트 루트/.cache)
+DEFAULT_CACHE_DIR = Path(os.getenv("CACHE_DIR", Path(__file__).resolve().parent.parent / ".cache"))
+
+_MISSING = object()
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화.
+
+    유니코드 NFKC 정규화, 대소문자 통일, 공백 축약, 양끝 공백/문장부호 제거를 적용하여
+    사소하게 다른 질문이 같은 키를 갖도록 합니다.
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        정규화된 텍스트
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = re.sub(r"\s+", " ", text)
+    return text.strip(" .?!,~")
+
+
+def make_cache_key(*parts: str) -> str:
+    """여러 문자열을 결합한 SHA-256 캐시 키 생성."""
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """캐시 히트/미스 통계"""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    # 미스 시 원격 호출에 소요된 누적 시간 (초)
+    miss_seconds: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """히트로 절약한 원격 호출 시간 추정치 (평균 미스 지연 x 히트 수)"""
+        if not self.misses:
+            return 0.0
+        return self.hits * (self.miss_seconds / self.misses)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.update(hits=self.hits, hit_rate=round(self.hit_rate, 4), saved_seconds=round(self.saved_seconds, 4))
+        return data
+
+
+class TTLCache:
+    """크기 및 TTL 제한이 있는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = 3600):
+        """
+        Args:
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            ttl: 항목 유효 시간 (초, None이면 만료 없음)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+
+            expires_at, value = item  # type: ignore
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """SQLite 기반 디스크 KV 캐시 (프로세스 재시작 후에도 유지)
+
+    파일은 처음 조회/저장할 때 열리며, 만료 항목과 maxsize를 넘는 오래된 항목은
+    연결 시 그리고 prune_every번 저장할 때마다 삭제됩니다.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        table: str = "cache",
+        ttl: float | None = None,
+        maxsize: int | None = None,
+        prune_every: int = 256,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            table: 테이블 이름 (하나의 파일에 여러 캐시 공존 가능)
+            ttl: 항목 유효 시간 (초, None이면 만료 없음)
+            maxsize: 최대 행 수 (초과 시 오래 저장된 항목부터 삭제, None이면 제한 없음)
+            prune_every: 저장 N번마다 만료 / 초과 항목 정리
+        """
+        self.path = Path(path)
+        self.table = table
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.prune_every = max(1, prune_every)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._sets = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """SQLite 연결 (최초 사용 시 생성, self._lock을 잡은 상태에서 호출)"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} (key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_created_at ON {self.table} (created_at)")
+            self._conn = conn
+            self._prune(conn)
+        return self._conn
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """만료 항목 및 maxsize 초과분 (오래 저장된 순) 삭제"""
+        if self.ttl:
+            conn.execute(f"DELETE FROM {self.table} WHERE created_at < ?", (time.time() - self.ttl,))
+        if self.maxsize is not None:
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN "
+                f"(SELECT key FROM {self.table} ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+        conn.commit()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if self.ttl and created_at + self.ttl < time.time():
+                conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, created_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            conn.commit()
+
+            self._sets += 1
+            if self._sets % self.prune_every == 0:
+                self._prune(conn)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class TwoTierCache:
+    """메모리 LRU → 디스크(SQLite) → compute 순으로 조회하는 2단 캐시
+
+    디스크에는 bytes만 저장하므로 dumps/loads 직렬화 함수를 주입받습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[bytes], Any],
+        maxsize: int = 1024,
+        ttl: float | None = 3600,
+        disk_ttl: float | None = None,
+        disk_maxsize: int | None = 100_000,
+        disk_path: str | Path | None = None,
+    ):
+        """
+        Args:
+            name: 캐시 이름 (SQLite 테이블 이름)
+            dumps: 값 → bytes 직렬화 함수
+            loads: bytes → 값 역직렬화 함수
+            maxsize: 메모리 LRU 최대 항목 수
+            ttl: 메모리 항목 유효 시간 (초)
+            disk_ttl: 디스크 항목 유효 시간 (초, None이면 만료 없음)
+            disk_maxsize: 디스크 최대 항목 수 (초과 시 오래된 항목부터 삭제, None이면 제한 없음)
+            disk_path: SQLite 파일 경로 (None이면 디스크 계층 비활성화)
+        """
+        self.name = name
+        self._dumps = dumps
+        self._loads = loads
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.disk = SQLiteCache(disk_path, table=name, ttl=disk_ttl, maxsize=disk_maxsize) if disk_path else None
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """캐시 조회 (없으면 None). 히트 통계를 갱신합니다."""
+        value = self.memory.get(key, _MISSING)
+        if value is not _MISSING:
+            with self._stats_lock:
+                self.stats.memory_hits += 1
+            return value
+
+        if self.disk is not None:
+            try:
+                raw = self.disk.get(key)
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ 디스크 캐시 조회 실패 ({self.name}): {e}")
+                raw = None
+
+            if raw is not None:
+                value = self._loads(raw)
+                self.memory.set(key, value)
+                with self._stats_lock:
+                    self.stats.disk_hits += 1
+                return value
+
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """메모리와 디스크에 모두 저장"""
+        self.memory.set(key, value)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, self._dumps(value))
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ 디스크 캐시 저장 실패 ({self.name}): {e}")
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """캐시에 없으면 compute()를 호출하고 결과를 저장"""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        start = time.perf_counter()
+        value = compute()
+        self.record_miss(time.perf_counter() - start)
+
+        self.set(key, value)
+        return value
+
+    async def aget_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """get_or_compute의 비동기 버전 (compute는 코루틴 함수)"""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        start = time.perf_counter()
+        value = await compute()
+        self.record_miss(time.perf_counter() - start)
+
+        self.set(key, value)
+        return value
+
+    def record_miss(self, seconds: float) -> None:
+        """미스 통계 기록 (get_or_compute를 쓰지 않고 직접 조회/저장하는 경우)"""
+        with self._stats_lock:
+            self.stats.misses += 1
+            self.stats.miss_seconds += seconds
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+class _Flight:
+    """진행 중인 호출 하나"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """같은 키의 동시 호출을 하나로 합치는 중복 제거기 (스레드 안전)
+
+    먼저 들어온 호출만 fn()을 실행하고, 그 사이 들어온 같은 키의 호출은 결과를 기다려 공유합니다.
+    결과는 보관하지 않으므로 캐시와 함께 사용합니다.
+    """
+
+    def __init__(self):
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """
+        Returns:
+            (결과, 다른 호출의 결과를 공유했는지 여부)
+
+        Raises:
+            fn()이 발생시킨 예외 (대기하던 호출에도 같은 예외 전달)
+        """
+        with self._lock:
+            existing = self._flights.get(key)
+            if existing is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight = existing
+
+        if existing is not None:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, True
+
+        try:
+            flight.value = fn()
+            return flight.value, False
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
@@ -0,0 +1,114 @@
+"""희소 행렬 기반 키워드 공동 출현 계산.
+
+문서-키워드 출현 행렬 X (문서 수 x 어휘 수, 값 = 문서 내 출현 횟수)를 만들고
+C = Xᵀ·X 로 공동 출현 횟수를 한 번에 계산합니다.
+
+기존 중첩 루프(문서마다 키워드 쌍을 순회하며 양방향 +1)와 결과가 정확히 같습니다:
+문서 안에서 키워드 a가 m번, b가 n번 나오면 루프는 a-b 쌍을 m·n번 세고,
+Xᵀ·X의 (a, b) 원소도 m·n 입니다. 같은 키워드끼리의 쌍(대각 원소)은 제외합니다.
+"""
+
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+
+@dataclass
+class CooccurrenceEdges:
+    """공동 출현 엣지 리스트 (kw1 < kw2, 배열 단위)"""
+
+    kw1: np.ndarray
+    kw2: np.ndarray
+    weight: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.weight)
+
+    def iter_rows(self) -> Iterator[dict[str, Any]]:
+        """UNWIND 배치 적재용 행 ({"kw1", "kw2", "weight"})"""
+        for kw1, kw2, weight in zip(self.kw1.tolist(), self.kw2.tolist(), self.weight.tolist()):
+            yield {"kw1": kw1, "kw2": kw2, "weight": weight}
+
+    def to_dict(self) -> dict[tuple[str, str], int]:
+        """{(kw1, kw2): weight} - 검증/테스트용"""
+        return {(row["kw1"], row["kw2"]): row["weight"] for row in self.iter_rows()}
+
+
+class CooccurrenceMatrix:
+    """문서 스트림을 받아 희소 출현 행렬을 누적"""
+
+    def __init__(self):
+        self.vocabulary: dict[str, int] = {}
+        self.n_documents = 0
+        # COO 좌표를 압축 배열로 누적 (파이썬 리스트 대비 메모리 1/7 수준)
+        self._rows = array("i")
+        self._cols = array("i")
+
+    def add_document(self, keywords: Iterable[str]) -> None:
+        """문서 하나의 키워드 추가 (중복 키워드는 출현 횟수로 누적)"""
+        row = self.n_documents
+        for keyword in keywords:
+            if not keyword:
+                continue
+            col = self.vocabulary.setdefault(keyword, len(self.vocabulary))
+            self._rows.append(row)
+            self._cols.append(col)
+        self.n_documents += 1
+
+    def incidence(self) -> sparse.csr_matrix:
+        """문서 x 키워드 출현 행렬 (중복 좌표는 합산됨)"""
+        rows = np.frombuffer(self._rows, dtype=np.int32)
+        cols = np.frombuffer(self._cols, dtype=np.int32)
+        data = np.ones(len(rows), dtype=np.int64)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(self.n_documents, len(self.vocabulary)))
+
+    def edges(self, min_weight: int = 1) -> CooccurrenceEdges:
+        """공동 출현 엣지 계산 (C = Xᵀ·X 의 상삼각)
+
+        Args:
+            min_weight: 이 값 미만의 가중치를 가진 엣지는 제외
+
+        Returns:
+            CooccurrenceEdges (kw1 < kw2 문자열 순서, 기존 루프의 `kw1 < kw2` 조건과 동일)
+        """
+        names = np.array(list(self.vocabulary), dtype=object)
+        if len(names) == 0:
+            empty = np.array([], dtype=object)
+            return CooccurrenceEdges(empty, empty, np.array([], dtype=np.int64))
+
+        # 어휘를 문자열 순으로 재배열하면 상삼각(row < col)이 곧 kw1 < kw2
+        order = np.array(sorted(range(len(names)), key=names.__getitem__), dtype=np.int64)
+        x = self.incidence()[:, order]
+
+        cooccurrence = sparse.triu(x.T @ x, k=1).tocoo()
+        mask = cooccurrence.data >= min_weight
+
+        sorted_names = names[order]
+        return CooccurrenceEdges(
+            kw1=sorted_names[cooccurrence.row[mask]],
+            kw2=sorted_names[cooccurrence.col[mask]],
+            weight=cooccurrence.data[mask].astype(np.int64),
+        )
+
+
+def count_cooccurrence(keyword_cooccurrence: dict[str, Counter], keywords: list[str]) -> None:
+    """문서 하나의 키워드 공동 출현 횟수 누적 (기존 중첩 루프, 검증 기준)"""
+    for i, kw1 in enumerate(keywords):
+        for kw2 in keywords[i + 1 :]:
+            if kw1 and kw2 and kw1 != kw2:
+                keyword_cooccurrence[kw1][kw2] += 1
+                keyword_cooccurrence[kw2][kw1] += 1
+
+
+def reference_edges(documents_keywords: Iterable[list[str]]) -> dict[tuple[str, str], int]:
+    """기존 중첩 루프 방식의 엣지 {(kw1, kw2): weight} (kw1 < kw2)"""
+    keyword_cooccurrence: dict[str, Counter] = defaultdict(Counter)
+    for keywords in documents_keywords:
+        count_cooccurrence(keyword_cooccurrence, keywords)
+
+    return {(kw1, kw2): weight for kw1, cooccurs in keyword_cooccurrence.items() for kw2, weight in cooccurs.items() if kw1 < kw2}
@@ -0,0 +1,147 @@
+"""그래프 쿼리 결과 캐시 (LRU + TTL + 그래프 버전 스탬프).
+
+그래프는 build_graphdb 실행 시에만 바뀌므로 같은 인자의 읽기 쿼리 결과를 재사용합니다.
+캐시 키 = (함수, 인자, 그래프 버전). build_graphdb가 끝나면서 버전을 올리면
+이전 버전의 항목은 더 이상 조회되지 않고 LRU/TTL로 자연히 밀려납니다.
+
+환경 변수:
+    GRAPH_CACHE_SIZE: 최대 항목 수 (기본 2048, 0이면 캐시 비활성화)
+    GRAPH_CACHE_TTL: 항목 유효 시간 초 (기본 3600)
+    GRAPH_VERSION_CHECK_INTERVAL: 버전 스탬프 재확인 주기 초 (기본 5)
+"""
+
+import asyncio
+import copy
+import functools
+import inspect
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from utils.cache import CacheStats, TTLCache
+from utils.graph_db import get_graph_version
+
+GRAPH_CACHE_SIZE = int(os.getenv("GRAPH_CACHE_SIZE", "2048"))
+GRAPH_CACHE_TTL = float(os.getenv("GRAPH_CACHE_TTL", "3600"))
+GRAPH_VERSION_CHECK_INTERVAL = float(os.getenv("GRAPH_VERSION_CHECK_INTERVAL", "5"))
+
+graph_cache = TTLCache(maxsize=max(GRAPH_CACHE_SIZE, 1), ttl=GRAPH_CACHE_TTL)
+graph_cache_stats = CacheStats()
+
+# {graph_name: (확인 시각, 버전)} - 매 쿼리마다 버전을 읽지 않도록 짧게 보관
+_versions: dict[str, tuple[float, int]] = {}
+_lock = threading.Lock()
+
+
+def current_graph_version(graph_name: str) -> int | None:
+    """그래프 버전 (GRAPH_VERSION_CHECK_INTERVAL 동안 재사용). 조회 실패 시 None."""
+    now = time.monotonic()
+    with _lock:
+        checked = _versions.get(graph_name)
+    if checked and now - checked[0] < GRAPH_VERSION_CHECK_INTERVAL:
+        return checked[1]
+
+    try:
+        version = get_graph_version(graph_name)
+    except Exception as e:
+        print(f"⚠️ 그래프 버전 조회 실패, 캐시 우회: {e}")
+        return None
+
+    with _lock:
+        _versions[graph_name] = (now, version)
+    return version
+
+
+def _freeze(value: Any) -> Any:
+    """캐시 키로 쓸 수 있도록 리스트/딕셔너리를 해시 가능한 형태로 변환"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, set):
+        return tuple(sorted(_freeze(v) for v in value))
+    return value
+
+
+def cached_graph_query[F: Callable[..., Any]](fn: F) -> F:
+    """그래프 읽기 함수 결과 캐시 데코레이터.
+
+    - 인자는 기본값까지 채워 정규화하므로 `f(x)`와 `f(x, limit=10)`이 같은 키를 가집니다.
+    - 빈 결과는 캐시하지 않습니다 (쿼리 실패 시에도 빈 리스트를 반환하기 때문).
+    - 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본을 반환합니다.
+    - 코루틴 함수에도 적용할 수 있습니다 (버전 확인은 스레드에서 실행).
+    """
+    signature = inspect.signature(fn)
+
+    def lookup(args: tuple, kwargs: dict) -> tuple[Any, Any]:
+        """(캐시 키, 캐시된 값) - 캐시를 쓸 수 없으면 키가 None"""
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        graph_name = bound.arguments.get("graph_name", "mid_level_helper")
+
+        version = current_graph_version(graph_name)
+        if version is None:
+            return None, None
+
+        key = (fn.__qualname__, graph_name, version, _freeze(dict(bound.arguments)))
+        cached = graph_cache.get(key)
+        if cached is not None:
+            with _lock:
+                graph_cache_stats.memory_hits += 1
+            return key, copy.deepcopy(cached)
+        return key, None
+
+    def store(key: Any, result: Any, elapsed: float) -> None:
+        with _lock:
+            graph_cache_stats.misses += 1
+            graph_cache_stats.miss_seconds += elapsed
+
+        if result:
+            graph_cache.set(key, copy.deepcopy(result))
+
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if GRAPH_CACHE_SIZE <= 0:
+                return await fn(*args, **kwargs)
+
+            key, cached = await asyncio.to_thread(lookup, args, kwargs)
+            if cached is not None:
+                return cached
+            if key is None:
+                return await fn(*args, **kwargs)
+
+            start = time.perf_counter()
+            result = await fn(*args, **kwargs)
+            store(key, result, time.perf_counter() - start)
+            return result
+
+        return async_wrapper  # type: ignore
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if GRAPH_CACHE_SIZE <= 0:
+            return fn(*args, **kwargs)
+
+        key, cached = lookup(args, kwargs)
+        if cached is not None:
+            return cached
+        if key is None:
+            return fn(*args, **kwargs)
+
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        store(key, result, time.perf_counter() - start)
+        return result
+
+    return wrapper  # type: ignore
+
+
+def clear_graph_cache() -> None:
+    """캐시 및 버전 확인 기록 초기화"""
+    graph_cache.clear()
+    with _lock:
+        _versions.clear()
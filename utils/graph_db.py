@@ -1,33 +1,140 @@
 """FalkorDB 그래프 데이터베이스 유틸리티."""
 
 import os
+import threading
 from typing import Any
 
 from dotenv import load_dotenv
 from falkordb import FalkorDB
+from falkordb.asyncio import FalkorDB as AsyncFalkorDB
+from redis import BlockingConnectionPool
+from redis.asyncio import BlockingConnectionPool as AsyncBlockingConnectionPool
+from redis.asyncio.retry import Retry as AsyncRetry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from redis.retry import Retry
 
 load_dotenv()
 
+# 프로세스 전역 클라이언트 (스레드 안전 커넥션 풀 공유)
+_client: FalkorDB | None = None
+_pool: BlockingConnectionPool | None = None
+_client_lock = threading.Lock()
+
+# 비동기 클라이언트 - 백그라운드 이벤트 루프(utils.aio) 하나에서만 사용
+_async_client: AsyncFalkorDB | None = None
+
+
+def _pool_options() -> dict[str, Any]:
+    """환경 변수 기반 FalkorDB(Redis) 커넥션 풀 설정.
+
+    환경 변수:
+        FALKORDB_POOL_SIZE: 최대 커넥션 수 (기본 10)
+        FALKORDB_POOL_TIMEOUT: 풀이 가득 찼을 때 대기 시간 초 (기본 5)
+        FALKORDB_HEALTH_CHECK_INTERVAL: 유휴 커넥션 재사용 전 PING 주기 초 (기본 30)
+        FALKORDB_SOCKET_TIMEOUT: 쿼리 소켓 타임아웃 초 (기본 10)
+    """
+    return {
+        "host": os.getenv("FALKORDB_HOST", "localhost"),
+        "port": int(os.getenv("FALKORDB_PORT", "6379")),
+        "max_connections": int(os.getenv("FALKORDB_POOL_SIZE", "10")),
+        "timeout": float(os.getenv("FALKORDB_POOL_TIMEOUT", "5")),
+        "health_check_interval": int(os.getenv("FALKORDB_HEALTH_CHECK_INTERVAL", "30")),
+        "socket_timeout": float(os.getenv("FALKORDB_SOCKET_TIMEOUT", "10")),
+        "socket_connect_timeout": 5,
+        "socket_keepalive": True,
+        "retry_on_error": [RedisConnectionError, RedisTimeoutError],
+    }
+
+
+def _create_connection_pool() -> BlockingConnectionPool:
+    """FalkorDB(Redis) 커넥션 풀 생성 (끊어진 커넥션은 재연결 후 재시도)"""
+    return BlockingConnectionPool(**_pool_options(), retry=Retry(ExponentialBackoff(cap=2, base=0.1), retries=3))
+
 
 def get_falkordb_client() -> FalkorDB:
-    """FalkorDB 클라이언트 생성.
+    """공유 FalkorDB 클라이언트 반환 (최초 호출 시 커넥션 풀 생성).
+
+    모든 호출이 하나의 스레드 안전 커넥션 풀을 공유하므로
+    쿼리마다 연결을 새로 맺지 않습니다.
 
     Returns:
         FalkorDB 클라이언트 인스턴스
     """
-    host = os.getenv("FALKORDB_HOST", "localhost")
-    port = int(os.getenv("FALKORDB_PORT", "6379"))
+    global _client, _pool
 
-    try:
-        client = FalkorDB(host=host, port=port)
-        return client
-    except Exception as e:
-        raise ConnectionError(f"FalkorDB 연결 실패: {e}")
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            try:
+                _pool = _create_connection_pool()
+                _client = FalkorDB(connection_pool=_pool)
+            except Exception as e:
+                raise ConnectionError(f"FalkorDB 연결 실패: {e}")
+    return _client
+
+
+def get_async_falkordb_client() -> AsyncFalkorDB:
+    """공유 비동기 FalkorDB 클라이언트 반환.
+
+    asyncio 커넥션 풀은 이벤트 루프에 묶이므로 백그라운드 이벤트 루프(utils.aio)에서만 호출합니다.
+    """
+    global _async_client
+
+    if _async_client is None:
+        pool = AsyncBlockingConnectionPool(**_pool_options(), retry=AsyncRetry(ExponentialBackoff(cap=2, base=0.1), retries=3))
+        _async_client = AsyncFalkorDB(connection_pool=pool)
+    return _async_client
+
+
+def reset_falkordb_client() -> None:
+    """커넥션 풀 폐기 (다음 get_falkordb_client 호출 시 재생성)."""
+    global _client, _pool
+
+    with _client_lock:
+        if _pool is not None:
+            try:
+                _pool.disconnect()
+            except Exception as e:
+                print(f"⚠️ 커넥션 풀 정리 실패: {e}")
+        _client = None
+        _pool = None
+
+
+def check_falkordb_health() -> bool:
+    """FalkorDB PING 헬스 체크. 실패 시 풀을 재생성하고 한 번 더 확인합니다.
+
+    Returns:
+        연결 정상 여부
+    """
+    for attempt in range(2):
+        try:
+            return bool(get_falkordb_client().connection.ping())
+        except Exception as e:
+            print(f"⚠️ FalkorDB 헬스 체크 실패 (시도 {attempt + 1}): {e}")
+            reset_falkordb_client()
+    return False
+
+
+def get_pool_stats() -> dict[str, int]:
+    """커넥션 풀 사용 현황 (생성된 커넥션 수, 유휴 커넥션 수, 최대 크기)."""
+    pool = _pool
+    if pool is None:
+        return {"created": 0, "idle": 0, "max": 0}
+
+    idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+    return {"created": len(pool._connections), "idle": idle, "max": pool.max_connections}
 
 
 def get_graph(graph_name: str = "mid_level_helper"):
     """그래프 인스턴스 가져오기.
 
+    공유 커넥션 풀 위의 Graph 핸들을 반환합니다. 핸들 생성 자체는 네트워크 호출이 없고,
+    각 쿼리는 풀에서 커넥션을 빌려 쓰고 반납합니다.
+
     Args:
         graph_name: 그래프 이름
 
@@ -38,6 +145,33 @@ def get_graph(graph_name: str = "mid_level_helper"):
     return client.select_graph(graph_name)
 
 
+def _version_key(graph_name: str) -> str:
+    return f"{graph_name}:version"
+
+
+def get_graph_version(graph_name: str = "mid_level_helper") -> int:
+    """그래프 버전 스탬프 조회 (한 번도 갱신되지 않았으면 0).
+
+    그래프 쿼리 결과 캐시의 키에 포함되어, 버전이 바뀌면 기존 캐시 항목이 무효화됩니다.
+    """
+    value = get_falkordb_client().connection.get(_version_key(graph_name))
+    return int(value) if value else 0
+
+
+def bump_graph_version(graph_name: str = "mid_level_helper") -> int:
+    """그래프 버전 스탬프 증가 (그래프 데이터를 변경한 뒤 호출).
+
+    Returns:
+        새 버전
+    """
+    return int(get_falkordb_client().connection.incr(_version_key(graph_name)))
+
+
+def get_async_graph(graph_name: str = "mid_level_helper"):
+    """비동기 그래프 인스턴스 가져오기 (`await graph.query(...)`)."""
+    return get_async_falkordb_client().select_graph(graph_name)
+
+
 def create_graph_schema(graph_name: str = "mid_level_helper") -> None:
     """그래프 스키마 생성 (인덱스 및 제약조건).
 
@@ -84,6 +218,7 @@ def clear_graph(graph_name: str = "mid_level_helper") -> None:
 
     try:
         result = graph.query("MATCH (n) DETACH DELETE n")
+        bump_graph_version(graph_name)
         print(f"✅ 그래프 초기화 완료")
     except Exception as e:
         print(f"❌ 그래프 초기화 실패: {e}")
@@ -164,7 +299,8 @@ if __name__ == "__main__":
     print("🔧 FalkorDB 연결 테스트...")
 
     try:
-        client = get_falkordb_client()
+        if not check_falkordb_health():
+            raise ConnectionError("PING 실패")
         print("✅ FalkorDB 연결 성공")
 
         # 그래프 스키마 생성
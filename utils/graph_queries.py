@@ -1,10 +1,86 @@
-"""FalkorDB 그래프 쿼리 함수."""
+"""FalkorDB 그래프 쿼리 함수.
 
-from typing import Any
-
-from utils.graph_db import get_graph
+읽기 함수 결과는 그래프 버전 스탬프 기반 캐시(utils.graph_cache)를 거칩니다.
+관련 키워드 / 키워드 네트워크는 인메모리 CSR 스냅샷(utils.keyword_graph)에서 조회합니다.
+"""
 
+import asyncio
+from typing import Any
 
+from utils.graph_cache import cached_graph_query
+from utils.graph_db import get_async_graph, get_graph
+from utils.keyword_graph import bounded_expand, get_keyword_graph
+from utils.metrics import timed_backend
+
+SEARCH_DOCUMENTS_QUERY = """
+UNWIND $keywords AS keyword
+MATCH (d:Document)-[:HAS_KEYWORD]->(k:Keyword)
+WHERE k.name = keyword
+WITH d, collect(DISTINCT k.name) AS matched_keywords, count(DISTINCT k) AS relevance_score
+RETURN d.id AS id,
+       d.title AS title,
+       d.category AS category,
+       d.problem_summary AS problem_summary,
+       d.source AS source,
+       matched_keywords,
+       relevance_score
+ORDER BY relevance_score DESC
+LIMIT $limit
+"""
+
+RELATED_KEYWORDS_QUERY = """
+MATCH (k1:Keyword {name: $keyword})-[r:CO_OCCURS_WITH]-(k2:Keyword)
+OPTIONAL MATCH (k2)<-[:HAS_KEYWORD]-(d:Document)
+WITH k2, r.weight AS weight, count(DISTINCT d) AS documents_count
+RETURN k2.name AS name, weight, documents_count
+ORDER BY weight DESC
+LIMIT $limit
+"""
+
+
+# 키워드 네트워크 (bounded BFS) 기본값
+NETWORK_TOP_K = 10
+NETWORK_MIN_WEIGHT = 1
+NETWORK_MAX_NODES = 100
+NETWORK_MAX_EDGES = 300
+NETWORK_MAX_FULL_DEPTH = 3
+
+# BFS 한 hop: 프런티어 노드별로 방문하지 않은 이웃 중 가중치 상위 $top_k만 반환 (파라미터화 → 플랜 캐시 재사용)
+NETWORK_HOP_QUERY = """
+UNWIND $frontier AS name
+MATCH (k:Keyword {name: name})-[r:CO_OCCURS_WITH]-(n:Keyword)
+WHERE r.weight >= $min_weight AND NOT n.name IN $visited
+WITH k, n, r.weight AS weight
+ORDER BY weight DESC, n.name
+WITH k, collect([n.name, weight])[..$top_k] AS top
+UNWIND top AS neighbor
+RETURN k.name AS source, neighbor[0] AS target, neighbor[1] AS weight
+"""
+
+
+def _parse_search_documents(result_set: list[list[Any]]) -> list[dict[str, Any]]:
+    documents = []
+    for row in result_set:
+        documents.append(
+            {
+                "id": row[0],
+                "title": row[1],
+                "category": row[2],
+                "problem_summary": row[3],
+                "source": row[4],
+                "matched_keywords": row[5],
+                "relevance_score": row[6],
+            }
+        )
+    return documents
+
+
+def _parse_related_keywords(result_set: list[list[Any]]) -> list[dict[str, Any]]:
+    return [{"name": row[0], "weight": row[1], "documents_count": row[2]} for row in result_set]
+
+
+@cached_graph_query
+@timed_backend("falkordb", "search_documents_by_keywords")
 def search_documents_by_keywords(
     keywords: list[str], graph_name: str = "mid_level_helper", limit: int = 10
 ) -> list[dict[str, Any]]:
@@ -23,51 +99,40 @@ def search_documents_by_keywords(
 
     graph = get_graph(graph_name)
 
-    # Cypher 쿼리: 키워드와 매칭되는 문서 찾기
-    query = """
-    UNWIND $keywords AS keyword
-    MATCH (d:Document)-[:HAS_KEYWORD]->(k:Keyword)
-    WHERE k.name = keyword
-    WITH d, collect(DISTINCT k.name) AS matched_keywords, count(DISTINCT k) AS relevance_score
-    RETURN d.id AS id,
-           d.title AS title,
-           d.category AS category,
-           d.problem_summary AS problem_summary,
-           d.source AS source,
-           matched_keywords,
-           relevance_score
-    ORDER BY relevance_score DESC
-    LIMIT $limit
-    """
-
     try:
-        result = graph.query(query, {"keywords": keywords, "limit": limit})
+        # Cypher 쿼리: 키워드와 매칭되는 문서 찾기
+        result = graph.query(SEARCH_DOCUMENTS_QUERY, {"keywords": keywords, "limit": limit})
+        return _parse_search_documents(result.result_set)
+    except Exception as e:
+        print(f"❌ 쿼리 실패: {e}")
+        return []
 
-        documents = []
-        for row in result.result_set:
-            documents.append(
-                {
-                    "id": row[0],
-                    "title": row[1],
-                    "category": row[2],
-                    "problem_summary": row[3],
-                    "source": row[4],
-                    "matched_keywords": row[5],
-                    "relevance_score": row[6],
-                }
-            )
 
-        return documents
+@cached_graph_query
+@timed_backend("falkordb", "search_documents_by_keywords")
+async def asearch_documents_by_keywords(
+    keywords: list[str], graph_name: str = "mid_level_helper", limit: int = 10
+) -> list[dict[str, Any]]:
+    """search_documents_by_keywords 비동기 버전 (FalkorDB asyncio 클라이언트)."""
+    if not keywords:
+        return []
+
+    graph = get_async_graph(graph_name)
+
+    try:
+        result = await graph.query(SEARCH_DOCUMENTS_QUERY, {"keywords": keywords, "limit": limit})
+        return _parse_search_documents(result.result_set)
     except Exception as e:
         print(f"❌ 쿼리 실패: {e}")
         return []
 
 
-def get_related_keywords(
-    keyword: str, graph_name: str = "mid_level_helper", limit: int = 10
-) -> list[dict[str, Any]]:
+def get_related_keywords(keyword: str, graph_name: str = "mid_level_helper", limit: int = 10) -> list[dict[str, Any]]:
     """특정 키워드와 관련된 키워드 찾기 (공동 출현 기반).
 
+    인메모리 키워드 그래프 스냅샷(utils.keyword_graph)에서 조회하고,
+    스냅샷을 쓸 수 없을 때만 FalkorDB에 쿼리합니다.
+
     Args:
         keyword: 기준 키워드
         graph_name: 그래프 이름
@@ -76,33 +141,51 @@ def get_related_keywords(
     Returns:
         관련 키워드 리스트 (name, weight, documents_count)
     """
-    graph = get_graph(graph_name)
+    snapshot = get_keyword_graph(graph_name)
+    if snapshot is not None:
+        return snapshot.related(keyword, limit)
+    return _query_related_keywords(keyword, graph_name, limit)
 
-    query = """
-    MATCH (k1:Keyword {name: $keyword})-[r:CO_OCCURS_WITH]-(k2:Keyword)
-    OPTIONAL MATCH (k2)<-[:HAS_KEYWORD]-(d:Document)
-    WITH k2, r.weight AS weight, count(DISTINCT d) AS documents_count
-    RETURN k2.name AS name, weight, documents_count
-    ORDER BY weight DESC
-    LIMIT $limit
-    """
+
+async def aget_related_keywords(keyword: str, graph_name: str = "mid_level_helper", limit: int = 10) -> list[dict[str, Any]]:
+    """get_related_keywords 비동기 버전 (스냅샷 확인/갱신은 스레드에서 실행)."""
+    snapshot = await asyncio.to_thread(get_keyword_graph, graph_name)
+    if snapshot is not None:
+        return snapshot.related(keyword, limit)
+    return await _aquery_related_keywords(keyword, graph_name, limit)
+
+
+@cached_graph_query
+@timed_backend("falkordb", "related_keywords")
+def _query_related_keywords(keyword: str, graph_name: str = "mid_level_helper", limit: int = 10) -> list[dict[str, Any]]:
+    """관련 키워드 Cypher 쿼리 (스냅샷 대체 경로)"""
+    graph = get_graph(graph_name)
 
     try:
-        result = graph.query(query, {"keyword": keyword, "limit": limit})
+        result = graph.query(RELATED_KEYWORDS_QUERY, {"keyword": keyword, "limit": limit})
+        return _parse_related_keywords(result.result_set)
+    except Exception as e:
+        print(f"❌ 쿼리 실패: {e}")
+        return []
 
-        related_keywords = []
-        for row in result.result_set:
-            related_keywords.append({"name": row[0], "weight": row[1], "documents_count": row[2]})
 
-        return related_keywords
+@cached_graph_query
+@timed_backend("falkordb", "related_keywords")
+async def _aquery_related_keywords(keyword: str, graph_name: str = "mid_level_helper", limit: int = 10) -> list[dict[str, Any]]:
+    """_query_related_keywords 비동기 버전 (FalkorDB asyncio 클라이언트)"""
+    graph = get_async_graph(graph_name)
+
+    try:
+        result = await graph.query(RELATED_KEYWORDS_QUERY, {"keyword": keyword, "limit": limit})
+        return _parse_related_keywords(result.result_set)
     except Exception as e:
         print(f"❌ 쿼리 실패: {e}")
         return []
 
 
-def get_documents_by_category(
-    category: str, graph_name: str = "mid_level_helper", limit: int = 10
-) -> list[dict[str, Any]]:
+@cached_graph_query
+@timed_backend("falkordb", "documents_by_category")
+def get_documents_by_category(category: str, graph_name: str = "mid_level_helper", limit: int = 10) -> list[dict[str, Any]]:
     """카테고리별 문서 검색.
 
     Args:
@@ -151,21 +234,79 @@ def get_documents_by_category(
 
 
 def get_keyword_network(
-    keyword: str, graph_name: str = "mid_level_helper", depth: int = 2
+    keyword: str,
+    graph_name: str = "mid_level_helper",
+    depth: int = 2,
+    mode: str = "full",
+    top_k: int = NETWORK_TOP_K,
+    min_weight: float = NETWORK_MIN_WEIGHT,
+    max_nodes: int = NETWORK_MAX_NODES,
+    max_edges: int = NETWORK_MAX_EDGES,
 ) -> dict[str, Any]:
     """키워드 네트워크 탐색 (N-hop 이웃).
 
+    mode="full" (기본): 길이 depth 이하 모든 경로의 관계 (기존 동작, 허브 키워드에서 결과가 폭증할 수 있음)
+    mode="bounded": hop마다 노드별로 방문하지 않은 이웃 중 가중치 상위 top_k만 따라가는 BFS.
+        min_weight 미만 관계는 가지치기하고, max_nodes / max_edges에서 멈추므로
+        허브 키워드에서도 결과 크기와 지연이 일정합니다. 새 호출자는 bounded를 권장합니다.
+
     Args:
         keyword: 중심 키워드
         graph_name: 그래프 이름
         depth: 탐색 깊이 (1 = 직접 연결, 2 = 2-hop 이웃)
+        mode: "bounded" | "full"
+        top_k: hop당 노드별 최대 이웃 수 (bounded)
+        min_weight: 따라갈 관계의 최소 공동 출현 가중치 (bounded)
+        max_nodes: 최대 노드 수 (bounded)
+        max_edges: 최대 엣지 수 (bounded)
 
     Returns:
-        네트워크 정보 (nodes, edges)
+        네트워크 정보 (nodes, edges[, truncated])
     """
+    if mode not in ("bounded", "full"):
+        raise ValueError(f"지원하지 않는 mode: {mode}")
+
+    snapshot = get_keyword_graph(graph_name)
+    if snapshot is not None:
+        if mode == "full":
+            return snapshot.network(keyword, depth)
+        return snapshot.bounded_network(keyword, depth, top_k, min_weight, max_nodes, max_edges)
+
+    return _query_keyword_network(keyword, graph_name, depth, mode, top_k, min_weight, max_nodes, max_edges)
+
+
+@timed_backend("falkordb", "keyword_network")
+def _query_keyword_network(
+    keyword: str,
+    graph_name: str,
+    depth: int,
+    mode: str,
+    top_k: int,
+    min_weight: float,
+    max_nodes: int,
+    max_edges: int,
+) -> dict[str, Any]:
+    """스냅샷이 없을 때 FalkorDB에서 직접 키워드 네트워크 탐색"""
     graph = get_graph(graph_name)
 
-    # 가변 깊이 경로 쿼리
+    if mode == "bounded":
+
+        def expand(frontier: list[str], visited: set[str]) -> dict[str, list[tuple[str, Any]]]:
+            params = {"frontier": frontier, "visited": sorted(visited), "top_k": top_k, "min_weight": min_weight}
+            result = graph.query(NETWORK_HOP_QUERY, params)
+            adjacency: dict[str, list[tuple[str, Any]]] = {}
+            for source, target, weight in result.result_set:
+                adjacency.setdefault(source, []).append((target, weight))
+            return adjacency
+
+        try:
+            return bounded_expand(keyword, expand, depth, max_nodes, max_edges)
+        except Exception as e:
+            print(f"❌ 쿼리 실패: {e}")
+            return {"nodes": [], "edges": [], "truncated": False}
+
+    # 가변 길이 경로의 상한은 파라미터로 넘길 수 없으므로 정수로 검증 후 삽입
+    depth = max(1, min(int(depth), NETWORK_MAX_FULL_DEPTH))
     query = f"""
     MATCH path = (k1:Keyword {{name: $keyword}})-[:CO_OCCURS_WITH*1..{depth}]-(k2:Keyword)
     WITH k1, k2, relationships(path) AS rels
@@ -192,9 +333,9 @@ def get_keyword_network(
         return {"nodes": [], "edges": []}
 
 
-def get_top_keywords_by_category(
-    category: str, graph_name: str = "mid_level_helper", limit: int = 10
-) -> list[dict[str, Any]]:
+@cached_graph_query
+@timed_backend("falkordb", "top_keywords_by_category")
+def get_top_keywords_by_category(category: str, graph_name: str = "mid_level_helper", limit: int = 10) -> list[dict[str, Any]]:
     """카테고리별 상위 키워드 조회.
 
     Args:
@@ -229,9 +370,9 @@ def get_top_keywords_by_category(
         return []
 
 
-def get_similar_documents_by_keywords(
-    doc_id: str, graph_name: str = "mid_level_helper", limit: int = 5
-) -> list[dict[str, Any]]:
+@cached_graph_query
+@timed_backend("falkordb", "similar_documents_by_keywords")
+def get_similar_documents_by_keywords(doc_id: str, graph_name: str = "mid_level_helper", limit: int = 5) -> list[dict[str, Any]]:
     """특정 문서와 유사한 문서 찾기 (공통 키워드 기반).
 
     Args:
@@ -280,6 +421,8 @@ def get_similar_documents_by_keywords(
         return []
 
 
+@cached_graph_query
+@timed_backend("falkordb", "all_categories")
 def get_all_categories(graph_name: str = "mid_level_helper") -> list[str]:
     """모든 카테고리 목록 조회.
 
@@ -0,0 +1,292 @@
+"""임베딩 → 업서트 파이프라인 수집 엔진.
+
+- 임베딩: N개 스레드가 동시 요청, 토큰 버킷으로 초당 요청 수 제한, 실패 시 지수 백오프 재시도
+- 업서트: 별도 워커 풀이 bounded queue에서 꺼내 업로드 (큐가 차면 임베딩 쪽이 대기 → 백프레셔)
+- 리포트: 전체 docs/sec 및 단계별 지연(p50/p95/max)
+"""
+
+import queue
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from utils.metrics import percentile
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 레이트 리미터"""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """
+        Args:
+            rate: 초당 토큰 보충 속도 (요청/초)
+            capacity: 버킷 크기 (순간 최대 버스트, 기본값 = max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 얻을 때까지 대기.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+
+def retry_with_backoff[T](
+    fn: Callable[[], T],
+    retries: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    jitter: bool = True,
+    retry_on: tuple[type[BaseException], ...] = (Exception,),
+    on_retry: Callable[[int, BaseException, float], None] | None = None,
+) -> T:
+    """지수 백오프 재시도.
+
+    Args:
+        fn: 실행할 함수
+        retries: 최대 재시도 횟수 (최초 시도 제외)
+        base_delay: 첫 재시도 대기 시간 (초)
+        max_delay: 최대 대기 시간 (초)
+        jitter: 대기 시간 무작위화 (동시 재시도 분산)
+        retry_on: 재시도할 예외 타입
+        on_retry: 재시도 직전 콜백 (attempt, error, delay)
+
+    Returns:
+        fn() 결과
+    """
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except retry_on as e:
+            if attempt >= retries:
+                raise
+            delay = min(max_delay, base_delay * (2**attempt))
+            if jitter:
+                delay = random.uniform(delay / 2, delay)
+            if on_retry:
+                on_retry(attempt + 1, e, delay)
+            time.sleep(delay)
+    raise RuntimeError("unreachable")
+
+
+@dataclass
+class Batch:
+    """파이프라인 처리 단위"""
+
+    ids: list[str]
+    texts: list[str]
+    metadatas: list[dict[str, Any]]
+
+
+@dataclass
+class StageStats:
+    """단계별 지연 통계"""
+
+    latencies: list[float] = field(default_factory=list)
+    retries: int = 0
+    throttled_seconds: float = 0.0
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        return percentile(sorted(self.latencies), q)
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "calls": len(self.latencies),
+            "p50": round(self.percentile(0.5), 3),
+            "p95": round(self.percentile(0.95), 3),
+            "max": round(max(self.latencies, default=0.0), 3),
+            "retries": self.retries,
+            "throttled_seconds": round(self.throttled_seconds, 3),
+        }
+
+
+@dataclass
+class PipelineReport:
+    """파이프라인 실행 결과"""
+
+    documents: int
+    seconds: float
+    stages: dict[str, StageStats]
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.documents / self.seconds if self.seconds else 0.0
+
+    def print(self) -> None:
+        print("\n" + "=" * 60)
+        print("📈 수집 파이프라인 리포트")
+        print("=" * 60)
+        print(f"문서 수: {self.documents:,}개, 소요: {self.seconds:.2f}s, 처리량: {self.docs_per_second:,.1f} docs/s")
+        for name, stats in self.stages.items():
+            s = stats.summary()
+            print(
+                f"  - {name:<7} 호출 {s['calls']:>4}회 | p50 {s['p50']:.3f}s | p95 {s['p95']:.3f}s | "
+                f"max {s['max']:.3f}s | 재시도 {s['retries']}회 | 레이트 대기 {s['throttled_seconds']:.2f}s"
+            )
+        print("=" * 60)
+
+
+_STOP = object()
+
+
+class IngestionPipeline:
+    """동시 임베딩 + 레이트 리미트 + 업서트 워커 풀 파이프라인"""
+
+    def __init__(
+        self,
+        embed_fn: Callable[[list[str]], list[list[float]]],
+        upsert_fn: Callable[[Batch, list[list[float]]], None],
+        embed_concurrency: int = 4,
+        upsert_workers: int = 2,
+        requests_per_second: float = 5.0,
+        queue_size: int = 8,
+        retries: int = 5,
+        on_progress: Callable[[int], None] | None = None,
+    ):
+        """
+        Args:
+            embed_fn: 텍스트 배치 → 임베딩 리스트
+            upsert_fn: (배치, 임베딩) 업로드
+            embed_concurrency: 동시 임베딩 요청 수
+            upsert_workers: 업서트 워커 수
+            requests_per_second: 임베딩 API 초당 요청 한도 (토큰 버킷)
+            queue_size: 임베딩 → 업서트 사이 큐 크기 (배치 단위)
+            retries: 단계별 최대 재시도 횟수
+            on_progress: 업서트 완료 시 호출 (업로드된 문서 수)
+        """
+        self.embed_fn = embed_fn
+        self.upsert_fn = upsert_fn
+        self.embed_concurrency = embed_concurrency
+        self.upsert_workers = upsert_workers
+        self.limiter = TokenBucket(requests_per_second)
+        self.queue_size = queue_size
+        self.retries = retries
+        self.on_progress = on_progress
+
+        self.stages = {"embed": StageStats(), "upsert": StageStats()}
+        self._stats_lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._failed = threading.Event()
+
+    def _record(self, stage: str, latency: float, throttled: float = 0.0) -> None:
+        with self._stats_lock:
+            self.stages[stage].latencies.append(latency)
+            self.stages[stage].throttled_seconds += throttled
+
+    def _on_retry(self, stage: str) -> Callable[[int, BaseException, float], None]:
+        def callback(attempt: int, error: BaseException, delay: float) -> None:
+            with self._stats_lock:
+                self.stages[stage].retries += 1
+            print(f"⚠️ {stage} 재시도 {attempt}/{self.retries} ({delay:.1f}s 후): {error}")
+
+        return callback
+
+    def _fail(self, error: BaseException) -> None:
+        with self._stats_lock:
+            if self._error is None:
+                self._error = error
+        self._failed.set()
+
+    def _embed(self, batch: Batch, out: "queue.Queue[Any]") -> None:
+        if self._failed.is_set():
+            return
+        try:
+
+            def call() -> list[list[float]]:
+                throttled = self.limiter.acquire()
+                start = time.perf_counter()
+                embeddings = self.embed_fn(batch.texts)
+                self._record("embed", time.perf_counter() - start, throttled)
+                return embeddings
+
+            embeddings = retry_with_backoff(call, retries=self.retries, on_retry=self._on_retry("embed"))
+            out.put((batch, embeddings))
+        except BaseException as e:
+            self._fail(e)
+
+    def _upsert_worker(self, inbox: "queue.Queue[Any]", uploaded: list[int]) -> None:
+        while True:
+            item = inbox.get()
+            if item is _STOP:
+                return
+            if self._failed.is_set():
+                continue  # 큐를 비워 임베딩 스레드가 막히지 않도록 함
+
+            batch, embeddings = item
+            try:
+
+                def call() -> None:
+                    start = time.perf_counter()
+                    self.upsert_fn(batch, embeddings)
+                    self._record("upsert", time.perf_counter() - start)
+
+                retry_with_backoff(call, retries=self.retries, on_retry=self._on_retry("upsert"))
+                with self._stats_lock:
+                    uploaded[0] += len(batch.ids)
+                if self.on_progress:
+                    self.on_progress(len(batch.ids))
+            except BaseException as e:
+                self._fail(e)
+
+    def run(self, batches: Iterable[Batch]) -> PipelineReport:
+        """파이프라인 실행 (모든 업서트가 끝날 때까지 블록)
+
+        Raises:
+            첫 번째로 실패한 단계의 예외
+        """
+        started_at = time.perf_counter()
+        inbox: queue.Queue[Any] = queue.Queue(maxsize=self.queue_size)
+        uploaded = [0]
+
+        workers = [
+            threading.Thread(target=self._upsert_worker, args=(inbox, uploaded), daemon=True) for _ in range(self.upsert_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        # 진행 중인 임베딩 작업 수 제한 (배치 전체를 한꺼번에 제출하지 않음)
+        in_flight = threading.BoundedSemaphore(self.embed_concurrency * 2)
+        with ThreadPoolExecutor(max_workers=self.embed_concurrency, thread_name_prefix="embed") as executor:
+            for batch in batches:
+                if self._failed.is_set():
+                    break
+                in_flight.acquire()
+                future = executor.submit(self._embed, batch, inbox)
+                future.add_done_callback(lambda _: in_flight.release())
+
+        for _ in workers:
+            inbox.put(_STOP)
+        for worker in workers:
+            worker.join()
+
+        if self._error is not None:
+            raise self._error
+
+        return PipelineReport(documents=uploaded[0], seconds=time.perf_counter() - started_at, stages=self.stages)
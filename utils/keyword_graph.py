@@ -0,0 +1,320 @@
+"""키워드 공동 출현 그래프의 인메모리 CSR 스냅샷.
+
+CO_OCCURS_WITH 그래프는 작고 읽기 위주이므로 FalkorDB에서 한 번 읽어 배열로 보관하고,
+관련 키워드 / k-hop 이웃 조회는 프로세스 안에서 처리합니다. FalkorDB는 갱신할 때만 사용합니다.
+
+구조 (키워드 수 V, 무방향 엣지 수 E):
+    - names: 정수 id → 키워드 이름 (정렬 순서, sys.intern)
+    - indptr: int64[V + 1], 노드 u의 이웃은 indices[indptr[u]:indptr[u + 1]]
+    - indices: int32[2E], 이웃 id (행마다 가중치 내림차순 → 상위 k개는 슬라이스 한 번)
+    - weights: float32[2E]
+    - doc_counts: int32[V], 키워드별 문서 수
+
+갱신: 그래프 버전 스탬프(build_graphdb가 증가)가 바뀌면 다음 조회 때 다시 적재합니다.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from utils.graph_cache import current_graph_version
+from utils.graph_db import get_graph
+
+KEYWORD_GRAPH_SNAPSHOT = os.getenv("KEYWORD_GRAPH_SNAPSHOT", "1") != "0"
+SNAPSHOT_PAGE_SIZE = 50_000
+
+_KEYWORD_QUERY = """
+MATCH (k:Keyword)
+OPTIONAL MATCH (k)<-[:HAS_KEYWORD]-(d:Document)
+RETURN k.name AS name, count(DISTINCT d) AS documents_count
+"""
+
+# 관계 id 기준 페이지네이션 (SKIP은 정렬 없이는 안정적이지 않음)
+_EDGE_PAGE_QUERY = """
+MATCH (a:Keyword)-[r:CO_OCCURS_WITH]->(b:Keyword)
+WHERE ID(r) > $after
+RETURN ID(r) AS rid, a.name AS source, b.name AS target, r.weight AS weight
+ORDER BY rid
+LIMIT $limit
+"""
+
+
+def _weight_value(weight: float) -> int | float:
+    """float32 가중치를 원래 타입처럼 반환 (정수 공동 출현 횟수는 int)"""
+    weight = float(weight)
+    return int(weight) if weight.is_integer() else weight
+
+
+@dataclass
+class KeywordGraph:
+    """CSR 인접 구조의 키워드 그래프 스냅샷"""
+
+    names: list[str]
+    index: dict[str, int]
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    doc_counts: np.ndarray
+    version: int = 0
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: list[tuple[str, str, float]],
+        doc_counts: dict[str, int],
+        version: int = 0,
+    ) -> "KeywordGraph":
+        """엣지 리스트 (source, target, weight) + 키워드별 문서 수로 스냅샷 생성"""
+        vocabulary = set(doc_counts)
+        for source, target, _ in edges:
+            vocabulary.add(source)
+            vocabulary.add(target)
+
+        names = [sys.intern(name) for name in sorted(vocabulary)]
+        index = {name: i for i, name in enumerate(names)}
+        n = len(names)
+
+        src = np.fromiter((index[s] for s, _, _ in edges), dtype=np.int32, count=len(edges))
+        dst = np.fromiter((index[t] for _, t, _ in edges), dtype=np.int32, count=len(edges))
+        w = np.fromiter((w or 0 for _, _, w in edges), dtype=np.float32, count=len(edges))
+
+        # 무방향: 양쪽 행에 모두 기록
+        rows = np.concatenate([src, dst])
+        cols = np.concatenate([dst, src])
+        weights = np.concatenate([w, w])
+
+        # 행 → 가중치 내림차순 → 이름 순
+        order = np.lexsort((cols, -weights, rows))
+        rows, cols, weights = rows[order], cols[order], weights[order]
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+        counts = np.array([doc_counts.get(name, 0) for name in names], dtype=np.int32)
+        return cls(names, index, indptr, cols.astype(np.int32), weights, counts, version)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices) // 2
+
+    def neighbors(self, node: int) -> tuple[np.ndarray, np.ndarray]:
+        """이웃 id / 가중치 (가중치 내림차순)"""
+        start, end = self.indptr[node], self.indptr[node + 1]
+        return self.indices[start:end], self.weights[start:end]
+
+    def related(self, keyword: str, limit: int = 10) -> list[dict[str, Any]]:
+        """관련 키워드 (get_related_keywords와 같은 형식: name, weight, documents_count)"""
+        node = self.index.get(keyword)
+        if node is None:
+            return []
+
+        ids, weights = self.neighbors(node)
+        return [
+            {"name": self.names[i], "weight": _weight_value(w), "documents_count": int(self.doc_counts[i])}
+            for i, w in zip(ids[:limit].tolist(), weights[:limit].tolist())
+        ]
+
+    def network(self, keyword: str, depth: int = 2) -> dict[str, Any]:
+        """N-hop 네트워크 (기존 `[:CO_OCCURS_WITH*1..depth]` 경로 쿼리와 같은 결과)
+
+        길이 depth 이하 경로에 포함되는 관계 = 시작점에서 depth - 1 hop 이내 노드에 붙은 모든 관계
+        """
+        start = self.index.get(keyword)
+        if start is None or depth < 1:
+            return {"nodes": [], "edges": []}
+
+        inner = {start}
+        frontier = [start]
+        for _ in range(depth - 1):
+            next_frontier = []
+            for node in frontier:
+                for neighbor in self.neighbors(node)[0].tolist():
+                    if neighbor not in inner:
+                        inner.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        nodes: set[str] = set()
+        edges = []
+        seen: set[tuple[int, int]] = set()
+        for node in inner:
+            ids, weights = self.neighbors(node)
+            for neighbor, weight in zip(ids.tolist(), weights.tolist()):
+                pair = (min(node, neighbor), max(node, neighbor))
+                if pair in seen:
+                    continue
+                seen.add(pair)
+                source, target = self.names[pair[0]], self.names[pair[1]]
+                nodes.update((source, target))
+                edges.append({"source": source, "target": target, "weight": _weight_value(weight)})
+
+        return {"nodes": list(nodes), "edges": edges}
+
+    def top_neighbors(
+        self, keyword: str, top_k: int, min_weight: float = 0, exclude: Collection[str] = ()
+    ) -> list[tuple[str, int | float]]:
+        """가중치 min_weight 이상이고 exclude에 없는 상위 top_k 이웃 (행이 내림차순이므로 앞에서부터 선택)"""
+        node = self.index.get(keyword)
+        if node is None:
+            return []
+
+        ids, weights = self.neighbors(node)
+        eligible = int(np.count_nonzero(weights >= min_weight))
+        ids, weights = ids[:eligible], weights[:eligible]
+        if exclude:
+            excluded = [self.index[name] for name in exclude if name in self.index]
+            keep = ~np.isin(ids, excluded)
+            ids, weights = ids[keep], weights[keep]
+        return [(self.names[i], _weight_value(w)) for i, w in zip(ids[:top_k].tolist(), weights[:top_k].tolist())]
+
+    def bounded_network(
+        self,
+        keyword: str,
+        depth: int = 2,
+        top_k: int = 10,
+        min_weight: float = 1,
+        max_nodes: int = 100,
+        max_edges: int = 300,
+    ) -> dict[str, Any]:
+        """hop당 상위 top_k / 최소 가중치로 가지치기한 네트워크 (bounded_expand 참고)"""
+        if keyword not in self.index:
+            return {"nodes": [], "edges": [], "truncated": False}
+
+        def expand(frontier: list[str], visited: set[str]) -> dict[str, list[tuple[str, Any]]]:
+            return {name: self.top_neighbors(name, top_k, min_weight, exclude=visited) for name in frontier}
+
+        return bounded_expand(keyword, expand, depth, max_nodes, max_edges)
+
+
+def bounded_expand(
+    start: str,
+    expand: Callable[[list[str], set[str]], dict[str, list[tuple[str, Any]]]],
+    depth: int = 2,
+    max_nodes: int = 100,
+    max_edges: int = 300,
+) -> dict[str, Any]:
+    """hop 단위 BFS로 키워드 네트워크 확장 (노드/엣지 상한으로 결과 크기 고정).
+
+    Args:
+        start: 중심 키워드
+        expand: (프런티어, 방문한 노드) → {키워드: [(이웃, 가중치), ...]}
+            방문한 노드를 먼저 제외한 뒤 hop당 상위 k개, 최소 가중치 적용, 가중치 내림차순.
+            (top_k 이후에 제외하면 이전 hop의 부모가 상위 자리를 차지해 다음 hop으로 나아가지 못함)
+        depth: 최대 hop 수
+        max_nodes: 최대 노드 수 (중심 포함)
+        max_edges: 최대 엣지 수
+
+    Returns:
+        {"nodes", "edges", "truncated"} - truncated는 상한 때문에 탐색을 멈췄는지 여부
+    """
+    nodes = [start]
+    visited = {start}
+    edges: list[dict[str, Any]] = []
+    seen_pairs: set[tuple[str, str]] = set()
+    truncated = False
+
+    frontier = [start]
+    for _ in range(depth):
+        if not frontier:
+            break
+
+        adjacency = expand(frontier, set(visited))
+        next_frontier = []
+        for source in frontier:
+            for target, weight in adjacency.get(source, []):
+                pair = (source, target) if source < target else (target, source)
+                if pair in seen_pairs:
+                    continue
+
+                if target not in visited:
+                    if len(nodes) >= max_nodes:
+                        truncated = True
+                        continue
+                    visited.add(target)
+                    nodes.append(target)
+                    next_frontier.append(target)
+
+                if len(edges) >= max_edges:
+                    truncated = True
+                    break
+                seen_pairs.add(pair)
+                edges.append({"source": pair[0], "target": pair[1], "weight": weight})
+
+            if len(edges) >= max_edges:
+                break
+        frontier = next_frontier
+
+        if truncated:
+            break
+
+    return {"nodes": nodes if edges else [], "edges": edges, "truncated": truncated}
+
+
+def load_keyword_graph(graph_name: str = "mid_level_helper", version: int = 0) -> KeywordGraph:
+    """FalkorDB에서 키워드/공동 출현 관계를 읽어 스냅샷 생성"""
+    graph = get_graph(graph_name)
+
+    doc_counts = {row[0]: row[1] for row in graph.query(_KEYWORD_QUERY).result_set}
+
+    edges: list[tuple[str, str, float]] = []
+    after = -1
+    while True:
+        rows = graph.query(_EDGE_PAGE_QUERY, {"after": after, "limit": SNAPSHOT_PAGE_SIZE}).result_set
+        edges.extend((row[1], row[2], row[3]) for row in rows)
+        if len(rows) < SNAPSHOT_PAGE_SIZE:
+            break
+        after = rows[-1][0]
+
+    return KeywordGraph.from_edges(edges, doc_counts, version=version)
+
+
+_snapshots: dict[str, KeywordGraph] = {}
+_refresh_lock = threading.Lock()
+
+
+def get_keyword_graph(graph_name: str = "mid_level_helper") -> KeywordGraph | None:
+    """현재 그래프 버전의 스냅샷 반환 (없거나 버전이 바뀌었으면 적재).
+
+    다른 스레드가 갱신 중이면 기존 스냅샷을 그대로 사용합니다.
+    스냅샷을 쓸 수 없으면 None (호출 측은 Cypher 쿼리로 대체).
+    """
+    if not KEYWORD_GRAPH_SNAPSHOT:
+        return None
+
+    snapshot = _snapshots.get(graph_name)
+    version = current_graph_version(graph_name)
+    if version is None:
+        return snapshot
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+
+    # 갱신은 한 스레드만, 나머지는 기존 스냅샷 사용 (첫 적재는 대기)
+    if not _refresh_lock.acquire(blocking=snapshot is None):
+        return snapshot
+    try:
+        snapshot = _snapshots.get(graph_name)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        start = time.perf_counter()
+        snapshot = load_keyword_graph(graph_name, version)
+        _snapshots[graph_name] = snapshot
+        print(
+            f"🧠 키워드 그래프 스냅샷 적재: v{version}, 키워드 {len(snapshot):,}개, "
+            f"관계 {snapshot.edge_count:,}개 ({time.perf_counter() - start:.2f}s)"
+        )
+        return snapshot
+    except Exception as e:
+        print(f"⚠️ 키워드 그래프 스냅샷 적재 실패: {e}")
+        return _snapshots.get(graph_name)
+    finally:
+        _refresh_lock.release()
@@ -0,0 +1,116 @@
+"""벡터 스토어 증분 빌드용 콘텐츠 해시 매니페스트.
+
+매니페스트 구조 (JSON):
+    {
+        "version": 1,
+        "model": "embedding-query",
+        "target": "pinecone:20251029_crawling",
+        "documents": {"<문서 id>": "<임베딩 텍스트 sha256>", ...}
+    }
+
+모델이나 대상(백엔드/네임스페이스)이 바뀌면 기존 해시는 무효로 보고 전체를 다시 임베딩합니다.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def get_manifest_path(backend: str) -> Path:
+    """백엔드별 매니페스트 경로 (VECTORSTORE_MANIFEST_PATH 로 재정의 가능)"""
+    path = os.getenv("VECTORSTORE_MANIFEST_PATH")
+    return Path(path) if path else DEFAULT_MANIFEST_DIR / f"vectorstore_manifest.{backend}.json"
+
+
+def content_hash(text: str) -> str:
+    """임베딩 텍스트의 SHA-256 해시"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ManifestDiff:
+    """이전 빌드 대비 변경 사항"""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+    @property
+    def to_embed(self) -> list[str]:
+        """다시 임베딩/업서트할 문서 id"""
+        return self.added + self.changed
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def summary(self) -> str:
+        return (
+            f"신규 {len(self.added)}개 · 변경 {len(self.changed)}개 · 삭제 {len(self.removed)}개 · 유지 {len(self.unchanged)}개"
+        )
+
+
+def load_manifest(path: str | Path, model: str, target: str) -> dict[str, str]:
+    """매니페스트의 문서 해시 로드.
+
+    파일이 없거나, 버전/모델/대상이 다르면 빈 딕셔너리를 반환합니다 (전체 재빌드).
+
+    Returns:
+        {문서 id: 콘텐츠 해시}
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+
+    try:
+        data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ 매니페스트 읽기 실패, 전체 재빌드: {e}")
+        return {}
+
+    if data.get("version") != MANIFEST_VERSION or data.get("model") != model or data.get("target") != target:
+        print("⚠️ 매니페스트의 모델/대상이 달라 전체 재빌드합니다.")
+        return {}
+    return dict(data.get("documents", {}))
+
+
+def save_manifest(path: str | Path, model: str, target: str, documents: dict[str, str]) -> None:
+    """매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    data = {"version": MANIFEST_VERSION, "model": model, "target": target, "documents": documents}
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def diff_manifest(previous: dict[str, str], current: dict[str, str]) -> ManifestDiff:
+    """이전/현재 해시 비교
+
+    Args:
+        previous: 이전 빌드의 {id: hash}
+        current: 현재 데이터의 {id: hash}
+
+    Returns:
+        ManifestDiff
+    """
+    diff = ManifestDiff()
+    for doc_id, digest in current.items():
+        old = previous.get(doc_id)
+        if old is None:
+            diff.added.append(doc_id)
+        elif old != digest:
+            diff.changed.append(doc_id)
+        else:
+            diff.unchanged.append(doc_id)
+
+    diff.removed = [doc_id for doc_id in previous if doc_id not in current]
+    return diff
@@ -0,0 +1,444 @@
+"""경량 메트릭 레지스트리 (Counter / Gauge / 고정 버킷 Histogram).
+
+한 턴의 시간이 어디에 쓰이는지 (Upstage 임베딩, Pinecone, FalkorDB, DDGS, Gemini 스텝, 요약)
+측정하기 위한 프로세스 전역 레지스트리입니다. 외부 의존성 없이
+
+- Prometheus 텍스트 포맷: metrics.render_prometheus() / GET /metrics
+- JSON 스냅샷 (p50/p95/p99 포함): metrics.snapshot() / GET /metrics.json
+
+으로 노출합니다. METRICS_PORT를 지정하면 start_metrics_server()가 HTTP 엔드포인트를 엽니다.
+
+사용 예:
+    with BACKEND_LATENCY.time(backend="pinecone", operation="query"):
+        ...
+
+    @timed(BACKEND_LATENCY, backend="falkordb", operation="search_documents")
+    def search(...): ...
+"""
+
+import bisect
+import functools
+import inspect
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+# 5ms ~ 60s (외부 API / DB 지연 시간 범위)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: dict[str, str] | None = None) -> str:
+    pairs = list(zip(names, values)) + list((extra or {}).items())
+    if not pairs:
+        return ""
+    escaped = ((name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for name, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """정렬된 표본의 분위수 (선형 보간, 표본이 없으면 nan)
+
+    Histogram은 버킷 경계로 근사하므로, 원본 표본이 있는 곳(벤치마크 리포트, 수집 파이프라인 통계)은 이 함수를 사용합니다.
+    """
+    if not sorted_samples:
+        return math.nan
+    position = (len(sorted_samples) - 1) * q
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+class _Metric:
+    """라벨 조합별 값을 보관하는 메트릭 공통 부분"""
+
+    type_name = ""
+
+    def __init__(self, name: str, description: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 라벨 {self.labelnames} 필요, 받은 라벨 {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.type_name}"]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, description: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, description, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counter는 감소할 수 없습니다")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [{"labels": dict(zip(self.labelnames, k)), "value": v} for k, v in items]
+
+
+class Gauge(Counter):
+    """임의로 오르내리는 값"""
+
+    type_name = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size  # 버킷별 (누적 아님), 마지막은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램 (분위수는 버킷 내 선형 보간 추정, Prometheus histogram_quantile과 동일 방식)"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets) + 1)
+            series.counts[index] += 1
+            series.sum += value
+            series.count += 1
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """블록 실행 시간 (초) 기록, 예외가 나도 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: Any) -> int:
+        series = self._series.get(self._key(labels))
+        return series.count if series else 0
+
+    def quantile(self, q: float, **labels: Any) -> float | None:
+        series = self._series.get(self._key(labels))
+        if series is None:
+            return None
+        with self._lock:
+            return self._quantile(series.counts, series.count, q)
+
+    def _quantile(self, counts: list[int], total: int, q: float) -> float | None:
+        if total == 0:
+            return None
+
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if cumulative + count >= rank and count > 0:
+                if index == len(self.buckets):
+                    # +Inf 버킷: 가장 큰 유한 경계값으로 보고
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((k, list(s.counts), s.sum, s.count) for k, s in self._series.items())
+
+        lines = self._header()
+        for key, counts, total_sum, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, {"le": _format_value(bound)})
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total_sum)}")
+            lines.append(f"{self.name}_count{labels} {total}")
+        return lines
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            items = sorted((k, list(s.counts), s.sum, s.count) for k, s in self._series.items())
+
+        return [
+            {
+                "labels": dict(zip(self.labelnames, key)),
+                "count": total,
+                "sum": round(total_sum, 6),
+                "mean": round(total_sum / total, 6) if total else None,
+                "p50": self._quantile(counts, total, 0.50),
+                "p95": self._quantile(counts, total, 0.95),
+                "p99": self._quantile(counts, total, 0.99),
+            }
+            for key, counts, total_sum, total in items
+        ]
+
+
+class MetricsRegistry:
+    """이름 → 메트릭 (같은 이름은 같은 인스턴스 반환)"""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif type(metric) is not cls:
+                raise ValueError(f"{name}: 이미 {metric.type_name}로 등록됨")
+            return metric
+
+    def counter(self, name: str, description: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, description, labelnames)
+
+    def gauge(self, name: str, description: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, description, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, description, labelnames, buckets)
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 포맷 (0.0.4)"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON 직렬화 가능한 스냅샷"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        return {
+            "timestamp": time.time(),
+            "metrics": {
+                metric.name: {"type": metric.type_name, "help": metric.description, "series": metric.snapshot()}
+                for metric in metrics
+            },
+        }
+
+
+# 프로세스 전역 레지스트리
+metrics = MetricsRegistry()
+
+TOOL_LATENCY = metrics.histogram("tool_latency_seconds", "도구 실행 시간", ["tool"])
+TOOL_CALLS = metrics.counter("tool_calls_total", "도구 호출 수", ["tool", "status"])
+BACKEND_LATENCY = metrics.histogram(
+    "backend_latency_seconds", "외부 백엔드 호출 시간 (upstage, pinecone, falkordb, ddgs, gemini)", ["backend", "operation"]
+)
+BACKEND_ERRORS = metrics.counter("backend_errors_total", "외부 백엔드 호출 실패 수", ["backend", "operation"])
+MODEL_TOKENS = metrics.counter("model_tokens_total", "모델 토큰 사용량", ["kind"])
+SUMMARIES_PENDING = metrics.gauge("summaries_pending", "진행 중인 백그라운드 요약 수")
+
+
+def timed(histogram: Histogram, errors: Counter | None = None, **labels: Any) -> Callable:
+    """함수 실행 시간을 히스토그램에 기록하는 데코레이터 (동기/비동기 모두 지원)
+
+    Args:
+        histogram: 기록할 히스토그램
+        errors: 예외 발생 시 증가시킬 카운터 (같은 라벨)
+        labels: 고정 라벨
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                except Exception:
+                    if errors is not None:
+                        errors.inc(**labels)
+                    raise
+                finally:
+                    histogram.observe(time.perf_counter() - start, **labels)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                if errors is not None:
+                    errors.inc(**labels)
+                raise
+            finally:
+                histogram.observe(time.perf_counter() - start, **labels)
+
+        return wrapper
+
+    return decorator
+
+
+def timed_backend(backend: str, operation: str) -> Callable:
+    """외부 백엔드 호출 시간 / 실패 수 기록 데코레이터"""
+    return timed(BACKEND_LATENCY, BACKEND_ERRORS, backend=backend, operation=operation)
+
+
+def instrument_tool(name: str) -> Callable:
+    """도구 함수 실행 시간 / 결과 상태(ok, error) 기록 데코레이터 (동기/비동기 모두 지원)"""
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                status = "error"
+                try:
+                    result = await func(*args, **kwargs)
+                    status = "ok"
+                    return result
+                finally:
+                    TOOL_LATENCY.observe(time.perf_counter() - start, tool=name)
+                    TOOL_CALLS.inc(tool=name, status=status)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            status = "error"
+            try:
+                result = func(*args, **kwargs)
+                status = "ok"
+                return result
+            finally:
+                TOOL_LATENCY.observe(time.perf_counter() - start, tool=name)
+                TOOL_CALLS.inc(tool=name, status=status)
+
+        return wrapper
+
+    return decorator
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = metrics
+
+    def do_GET(self) -> None:  # noqa: N802
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body = self.registry.render_prometheus().encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif path == "/metrics.json":
+            body = json.dumps(self.registry.snapshot(), ensure_ascii=False).encode("utf-8")
+            content_type = "application/json; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # 스크레이프 요청마다 stderr에 찍히지 않도록
+        return
+
+
+_server: ThreadingHTTPServer | None = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: int | None = None, host: str | None = None) -> ThreadingHTTPServer | None:
+    """메트릭 HTTP 엔드포인트 시작 (프로세스당 한 번, 포트 미지정 시 METRICS_PORT, 없으면 시작 안 함)
+
+    Returns:
+        실행 중인 서버 또는 None
+    """
+    global _server
+
+    if port is None:
+        port = int(os.getenv("METRICS_PORT") or 0) or None
+    if port is None:
+        return None
+
+    with _server_lock:
+        if _server is not None:
+            return _server
+        try:
+            _server = ThreadingHTTPServer((host or os.getenv("METRICS_HOST", "127.0.0.1"), port), _MetricsHandler)
+        except OSError as e:
+            # Streamlit 다중 프로세스 등으로 이미 사용 중인 포트
+            print(f"⚠️ 메트릭 서버 시작 실패 (port={port}): {e}")
+            return None
+
+        threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+        print(f"📈 메트릭 서버: http://{_server.server_address[0]}:{_server.server_address[1]}/metrics")
+        return _server
@@ -0,0 +1,344 @@
+"""전문가 프롬프트 로더 (컴파일된 번들 + mtime 핫 리로드).
+
+prompts/*.md (YAML frontmatter + Markdown)를 빌드 단계에서 검증된 번들 하나로 컴파일하고
+(scripts/build_prompt_bundle.py → prompts/bundle.json), 런타임에는 시작 시 번들을 한 번 로드합니다.
+
+- 번들이 없거나 원본 파일(mtime/크기)과 다르면 시작 시 원본에서 한 번에 컴파일합니다.
+- watch=True (또는 PROMPT_HOT_RELOAD=1)면 폴링 스레드가 mtime 변경을 감지해 바뀐 파일만 다시 읽습니다.
+- Streamlit에 의존하지 않으므로 CLI/테스트에서도 그대로 사용할 수 있습니다.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import yaml
+from pydantic import BaseModel, Field, ValidationError
+
+from schemas import JobRole
+
+DEFAULT_PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+BUNDLE_FILENAME = "bundle.json"
+BUNDLE_VERSION = 1
+
+
+class PromptMetadata(BaseModel):
+    """프롬프트 메타데이터 (YAML frontmatter)"""
+
+    name: str = Field(description="프롬프트 이름")
+    description: str = Field(description="프롬프트 설명")
+    category: str = Field(description="카테고리 (engineering, analysis, etc.)")
+
+
+class ExpertPrompt(BaseModel):
+    """전문가 프롬프트 전체 구조"""
+
+    metadata: PromptMetadata
+    content: str = Field(description="프롬프트 본문 (Markdown)")
+    file_path: str = Field(description="원본 파일 경로")
+
+
+class PromptParseError(ValueError):
+    """프롬프트 파일 형식 오류"""
+
+
+def file_signature(path: Path) -> list[int]:
+    """변경 감지용 파일 시그니처 [mtime_ns, size]"""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def parse_prompt_file(path: Path) -> ExpertPrompt:
+    """YAML frontmatter + Markdown 파일 파싱
+
+    Raises:
+        PromptParseError: frontmatter가 없거나 메타데이터가 유효하지 않은 경우
+    """
+    content = path.read_text(encoding="utf-8")
+
+    if not content.startswith("---"):
+        raise PromptParseError(f"Frontmatter 없음: {path.name}")
+
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        raise PromptParseError(f"Frontmatter 형식 오류: {path.name}")
+
+    try:
+        frontmatter_data = yaml.safe_load(parts[1].strip())
+        metadata = PromptMetadata(**frontmatter_data)
+    except (yaml.YAMLError, ValidationError, TypeError) as e:
+        raise PromptParseError(f"YAML 파싱 실패: {path.name} - {e}") from e
+
+    return ExpertPrompt(metadata=metadata, content=parts[2].strip(), file_path=str(path))
+
+
+def compile_prompts(prompts_dir: Path) -> tuple[dict[str, ExpertPrompt], dict[str, list[int]], list[str]]:
+    """디렉토리의 모든 프롬프트 컴파일
+
+    Returns:
+        (프롬프트, 파일 시그니처, 오류 메시지 목록)
+    """
+    prompts: dict[str, ExpertPrompt] = {}
+    signatures: dict[str, list[int]] = {}
+    errors: list[str] = []
+
+    for md_file in sorted(prompts_dir.glob("*.md")):
+        signatures[md_file.stem] = file_signature(md_file)
+        try:
+            prompts[md_file.stem] = parse_prompt_file(md_file)
+        except PromptParseError as e:
+            errors.append(str(e))
+
+    return prompts, signatures, errors
+
+
+def write_bundle(path: Path, prompts: dict[str, ExpertPrompt], signatures: dict[str, list[int]]) -> None:
+    """번들 저장 (임시 파일에 쓴 뒤 교체)"""
+    data = {
+        "version": BUNDLE_VERSION,
+        "files": signatures,
+        "prompts": {name: prompt.model_dump() for name, prompt in prompts.items()},
+    }
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+class PromptLoader:
+    """
+    전문가 프롬프트 로더
+
+    Features:
+    - 번들 로드: 시작 시 prompts/bundle.json 한 번 로드 (없거나 오래되면 원본에서 컴파일)
+    - 핫 리로드: watch=True면 mtime 폴링으로 바뀐 파일만 다시 파싱
+    - Fallback: 매칭 실패시 기본 프롬프트
+    """
+
+    # JobRole → Prompt 파일명 매핑
+    ROLE_TO_PROMPT_MAP = {
+        JobRole.BACKEND: "backend-architect",
+        JobRole.FRONTEND: "frontend-architect",
+        JobRole.DEVOPS: "devops-architect",
+        JobRole.DATA_ENGINEER: "python-expert",
+        JobRole.ML_ENGINEER: "python-expert",
+        JobRole.FULLSTACK: "system-architect",  # 풀스택은 시스템 아키텍트
+        JobRole.IOS: "frontend-architect",  # iOS도 프론트엔드 범주
+        JobRole.ANDROID: "frontend-architect",  # AOS도 프론트엔드 범주
+        JobRole.ETC: "learning-guide",  # 기타는 학습 가이드
+    }
+
+    def __init__(
+        self,
+        prompts_dir: str | Path | None = None,
+        bundle_path: str | Path | None = None,
+        watch: bool = False,
+        poll_interval: float = 2.0,
+    ):
+        """
+        Args:
+            prompts_dir: 프롬프트 디렉토리 경로 (기본: 프로젝트 루트/prompts)
+            bundle_path: 컴파일된 번들 경로 (기본: prompts_dir/bundle.json)
+            watch: mtime 폴링 핫 리로드 스레드 시작 여부
+            poll_interval: 폴링 주기 (초)
+        """
+        self.prompts_dir = Path(prompts_dir) if prompts_dir else DEFAULT_PROMPTS_DIR
+        if not self.prompts_dir.exists():
+            raise FileNotFoundError(f"Prompts directory not found: {self.prompts_dir}")
+
+        self.bundle_path = Path(bundle_path) if bundle_path else self.prompts_dir / BUNDLE_FILENAME
+        self.poll_interval = poll_interval
+
+        self._prompts: dict[str, ExpertPrompt] = {}
+        self._signatures: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: threading.Thread | None = None
+
+        self._load()
+        if watch:
+            self.start_watching()
+
+    def _load(self) -> None:
+        """번들이 원본과 일치하면 번들을, 아니면 원본을 컴파일하여 로드"""
+        current = {path.stem: file_signature(path) for path in self.prompts_dir.glob("*.md")}
+
+        bundle = self._read_bundle()
+        if bundle is not None and bundle["files"] == current:
+            prompts = {name: ExpertPrompt(**data) for name, data in bundle["prompts"].items()}
+            signatures = bundle["files"]
+        else:
+            if bundle is not None:
+                print("⚠️ 프롬프트 번들이 원본과 달라 다시 컴파일합니다 (scripts.build_prompt_bundle 실행 권장)")
+            prompts, signatures, errors = compile_prompts(self.prompts_dir)
+            for error in errors:
+                print(f"⚠️ {error}")
+
+        with self._lock:
+            self._prompts = prompts
+            self._signatures = signatures
+
+    def _read_bundle(self) -> dict[str, Any] | None:
+        if not self.bundle_path.exists():
+            return None
+        try:
+            data = json.loads(self.bundle_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ 프롬프트 번들 읽기 실패: {e}")
+            return None
+        if data.get("version") != BUNDLE_VERSION:
+            return None
+        return data
+
+    def check_for_changes(self) -> list[str]:
+        """원본 파일 변경 확인 후 바뀐 파일만 다시 로드 (추가/수정/삭제)
+
+        Returns:
+            다시 로드되거나 제거된 프롬프트 이름
+        """
+        current = {path.stem: path for path in self.prompts_dir.glob("*.md")}
+
+        with self._lock:
+            prompts = dict(self._prompts)
+            signatures = dict(self._signatures)
+
+        changed = []
+        for name in list(signatures):
+            if name not in current:
+                prompts.pop(name, None)
+                signatures.pop(name)
+                changed.append(name)
+
+        for name, path in current.items():
+            try:
+                signature = file_signature(path)
+            except FileNotFoundError:
+                continue
+            if signatures.get(name) == signature:
+                continue
+
+            signatures[name] = signature
+            changed.append(name)
+            try:
+                prompts[name] = parse_prompt_file(path)
+            except PromptParseError as e:
+                # 잘못 저장된 파일은 이전 버전을 유지
+                print(f"⚠️ {e}")
+
+        if changed:
+            with self._lock:
+                self._prompts = prompts
+                self._signatures = signatures
+            print(f"🔄 프롬프트 다시 로드: {', '.join(sorted(changed))}")
+        return changed
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check_for_changes()
+            except Exception as e:
+                print(f"⚠️ 프롬프트 변경 감지 실패: {e}")
+
+    def start_watching(self) -> None:
+        """mtime 폴링 핫 리로드 스레드 시작"""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="prompt-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=self.poll_interval + 1)
+            self._watcher = None
+
+    def load_prompt(self, prompt_name: str) -> ExpertPrompt | None:
+        """
+        단일 프롬프트 조회
+
+        Args:
+            prompt_name: 프롬프트 파일명 (확장자 제외)
+
+        Returns:
+            ExpertPrompt 또는 None (파일 없음)
+        """
+        return self._prompts.get(prompt_name)
+
+    def scan_all_prompts(self) -> dict[str, ExpertPrompt]:
+        """
+        모든 프롬프트 반환
+
+        Returns:
+            {prompt_name: ExpertPrompt} 딕셔너리
+        """
+        return dict(self._prompts)
+
+    def get_by_role(self, job_role: JobRole) -> ExpertPrompt | None:
+        """
+        JobRole에 맞는 프롬프트 반환
+
+        Args:
+            job_role: 직무 역할 (Enum)
+
+        Returns:
+            해당 역할의 ExpertPrompt 또는 None
+        """
+        # 매핑 테이블에서 프롬프트명 찾기
+        prompt_name = self.ROLE_TO_PROMPT_MAP.get(job_role)
+
+        if not prompt_name:
+            print(f"⚠️ JobRole 매핑 없음: {job_role}")
+            return None
+
+        return self.load_prompt(prompt_name)
+
+    def get_fallback_prompt(self) -> str:
+        """
+        매칭 실패시 기본 프롬프트
+
+        Returns:
+            범용 어드바이스 프롬프트
+        """
+        return """
+## 중니어 개발자를 위한 커리어 조언
+
+당신은 중급 개발자(중니어)의 커리어 성장을 돕는 전문 컨설턴트입니다.
+
+### 주요 접근 방식:
+1. **기술 역량 평가**: 현재 기술 스택과 경험 연차 분석
+2. **성장 방향 제시**: 개인 상황에 맞는 구체적이고 실행 가능한 성장 로드맵
+3. **실무 인사이트**: 실제 현장 경험과 사례 기반 조언
+4. **장기 관점**: 단기 해결책이 아닌 지속 가능한 커리어 발전 방향
+
+### 조언 원칙:
+- 구체적이고 실행 가능한 액션 아이템 제시
+- 개인의 상황과 관심사 고려
+- 업계 트렌드와 실무 경험 반영
+- 긍정적이면서도 현실적인 피드백
+"""
+
+
+_loader: PromptLoader | None = None
+_loader_lock = threading.Lock()
+
+
+def get_prompt_loader() -> PromptLoader:
+    """
+    프로세스 전역 PromptLoader 반환 (최초 호출 시 번들 로드)
+
+    PROMPT_HOT_RELOAD=1 이면 mtime 폴링 핫 리로드를 켭니다.
+
+    Returns:
+        PromptLoader 인스턴스
+    """
+    global _loader
+
+    if _loader is not None:
+        return _loader
+
+    with _loader_lock:
+        if _loader is None:
+            _loader = PromptLoader(watch=os.getenv("PROMPT_HOT_RELOAD", "0") == "1")
+    return _loader
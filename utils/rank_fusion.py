@@ -0,0 +1,42 @@
+"""Reciprocal Rank Fusion (RRF).
+
+여러 검색기의 순위 리스트를 점수 스케일과 무관하게 합칩니다.
+문서 d의 점수 = Σ 1 / (k + rank_i(d))  (rank는 1부터, 결과에 없는 검색기는 0점)
+"""
+
+from collections.abc import Mapping, Sequence
+
+RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    rankings: Mapping[str, Sequence[str]], k: int = RRF_K, limit: int | None = None
+) -> list[tuple[str, float, list[str]]]:
+    """순위 리스트들을 RRF 점수로 합치기.
+
+    Args:
+        rankings: {검색기 이름: 문서 id 리스트 (좋은 순)}
+        k: 순위 완화 상수 (클수록 하위 순위 영향이 커짐, 기본 60)
+        limit: 반환할 최대 문서 수
+
+    Returns:
+        [(문서 id, RRF 점수, 해당 문서를 찾은 검색기 이름들)] - 점수 내림차순
+        동점은 먼저 등장한 문서 우선
+    """
+    scores: dict[str, float] = {}
+    found_by: dict[str, list[str]] = {}
+
+    for name, ids in rankings.items():
+        seen: set[str] = set()
+        for rank, doc_id in enumerate(ids, 1):
+            # 한 검색기 안의 중복은 가장 높은 순위만 반영
+            if doc_id in seen:
+                continue
+            seen.add(doc_id)
+            scores[doc_id] = scores.get(doc_id, 0.0) + 1.0 / (k + rank)
+            found_by.setdefault(doc_id, []).append(name)
+
+    fused = sorted(scores, key=lambda doc_id: scores[doc_id], reverse=True)
+    if limit is not None:
+        fused = fused[:limit]
+    return [(doc_id, scores[doc_id], found_by[doc_id]) for doc_id in fused]
@@ -0,0 +1,248 @@
+"""벡터 스토어 백엔드 (Pinecone / 로컬 NumPy).
+
+백엔드 선택: 환경 변수 VECTOR_STORE_BACKEND ("pinecone" | "local", 기본 pinecone)
+
+로컬 백엔드 디렉토리 구조 (LOCAL_VECTOR_STORE_DIR, 기본 data/vectorstore):
+    - manifest.json: 차원, 문서 수, 메타데이터 필드 목록
+    - vectors.f32: L2 정규화된 float32 행렬 (memmap, shape = [count, dim])
+    - metadata.npz: 메타데이터 필드별 문자열 배열 (ids 포함)
+"""
+
+import asyncio
+import json
+import os
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+
+from utils.metrics import timed_backend
+
+DEFAULT_LOCAL_DIR = Path(__file__).resolve().parent.parent / "data" / "vectorstore"
+METADATA_FIELDS = ("title", "source", "keywords", "problem_summary", "category")
+
+
+def get_backend_name() -> str:
+    """환경 변수로 선택된 벡터 스토어 백엔드 이름"""
+    return os.getenv("VECTOR_STORE_BACKEND", "pinecone").strip().lower()
+
+
+def get_local_store_dir() -> Path:
+    return Path(os.getenv("LOCAL_VECTOR_STORE_DIR", DEFAULT_LOCAL_DIR))
+
+
+@dataclass
+class VectorMatch:
+    """벡터 검색 결과 한 건"""
+
+    id: str
+    score: float
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+class VectorStore(Protocol):
+    """sementic_search 가 의존하는 벡터 스토어 인터페이스"""
+
+    def query(self, vector: list[float], top_k: int = 5, filter: dict[str, Any] | None = None) -> list[VectorMatch]: ...
+
+    async def aquery(self, vector: list[float], top_k: int = 5, filter: dict[str, Any] | None = None) -> list[VectorMatch]: ...
+
+
+class PineconeVectorStore:
+    """Pinecone 인덱스 어댑터"""
+
+    def __init__(self, index: Any, namespace: str, async_index_factory: Callable[[], Any] | None = None):
+        """
+        Args:
+            index: Pinecone 동기 인덱스
+            namespace: 네임스페이스
+            async_index_factory: IndexAsyncio 생성 함수 (없으면 aquery는 스레드에서 동기 query 실행)
+        """
+        self.index = index
+        self.namespace = namespace
+        self._async_index_factory = async_index_factory
+        self._async_index: Any = None
+
+    @timed_backend("pinecone", "query")
+    def query(self, vector: list[float], top_k: int = 5, filter: dict[str, Any] | None = None) -> list[VectorMatch]:
+        results = self.index.query(
+            namespace=self.namespace,
+            vector=vector,
+            top_k=top_k,
+            include_metadata=True,
+            filter=filter,
+        )
+        return [VectorMatch(id=m.id, score=m.score, metadata=dict(m.metadata or {})) for m in results.matches]
+
+    async def aquery(self, vector: list[float], top_k: int = 5, filter: dict[str, Any] | None = None) -> list[VectorMatch]:
+        """비동기 검색 (PineconeAsyncio). 인덱스는 처음 호출한 이벤트 루프에서 생성되어 재사용됩니다."""
+        if self._async_index_factory is None:
+            return await asyncio.to_thread(self.query, vector, top_k, filter)
+
+        if self._async_index is None:
+            self._async_index = self._async_index_factory()
+
+        return await self._aquery_index(vector, top_k, filter)
+
+    @timed_backend("pinecone", "query")
+    async def _aquery_index(self, vector: list[float], top_k: int, filter: dict[str, Any] | None) -> list[VectorMatch]:
+        results = await self._async_index.query(
+            namespace=self.namespace,
+            vector=vector,
+            top_k=top_k,
+            include_metadata=True,
+            filter=filter,
+        )
+        return [VectorMatch(id=m.id, score=m.score, metadata=dict(m.metadata or {})) for m in results.matches]
+
+
+class LocalVectorStore:
+    """메모리 맵 float32 행렬 기반 로컬 정확 검색 (Exact Search)
+
+    - 행렬은 저장 시점에 L2 정규화 → 코사인 유사도 = 내적 한 번
+    - top-k는 argpartition으로 O(N) 선택 후 k개만 정렬
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        """
+        Args:
+            directory: 로컬 스토어 디렉토리 (기본: LOCAL_VECTOR_STORE_DIR)
+        """
+        self.directory = Path(directory) if directory else get_local_store_dir()
+        manifest_path = self.directory / "manifest.json"
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"로컬 벡터 스토어를 찾을 수 없습니다: {self.directory}")
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        self.dim: int = manifest["dim"]
+        self.count: int = manifest["count"]
+
+        self.matrix = np.memmap(self.directory / "vectors.f32", dtype=np.float32, mode="r", shape=(self.count, self.dim))
+        with np.load(self.directory / "metadata.npz") as data:
+            self.ids: np.ndarray = data["id"]
+            self.metadata: dict[str, np.ndarray] = {name: data[name] for name in manifest["fields"]}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def iter_metadata(self) -> Iterator[dict[str, str]]:
+        """문서 메타데이터를 하나씩 반환 (벡터 행렬은 읽지 않음)"""
+        for i in range(self.count):
+            yield {"id": str(self.ids[i]), **{name: str(col[i]) for name, col in self.metadata.items()}}
+
+    def get_vectors(self, ids: list[str]) -> dict[str, np.ndarray]:
+        """저장된 (정규화된) 벡터 조회 - 증분 빌드 시 변경 없는 문서 재사용
+
+        Args:
+            ids: 문서 ID 리스트
+
+        Returns:
+            {id: 벡터} (존재하지 않는 id는 제외)
+        """
+        positions = {doc_id: i for i, doc_id in enumerate(self.ids.tolist())}
+        return {doc_id: np.array(self.matrix[positions[doc_id]]) for doc_id in ids if doc_id in positions}
+
+    def _filter_mask(self, filter: dict[str, Any]) -> np.ndarray:
+        """Pinecone 스타일 메타데이터 필터 ({field: value} 또는 {field: {"$eq"|"$in": ...}})"""
+        mask = np.ones(self.count, dtype=bool)
+        for name, cond in filter.items():
+            column = self.ids if name == "id" else self.metadata.get(name)
+            if column is None:
+                return np.zeros(self.count, dtype=bool)
+
+            if isinstance(cond, dict):
+                if "$eq" in cond:
+                    mask &= column == str(cond["$eq"])
+                elif "$in" in cond:
+                    mask &= np.isin(column, [str(v) for v in cond["$in"]])
+                else:
+                    raise ValueError(f"지원하지 않는 필터 연산자: {cond}")
+            else:
+                mask &= column == str(cond)
+        return mask
+
+    @timed_backend("local_vector", "query")
+    def query(self, vector: list[float], top_k: int = 5, filter: dict[str, Any] | None = None) -> list[VectorMatch]:
+        q = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm == 0:
+            return []
+        q /= norm
+
+        scores = self.matrix @ q
+        if filter:
+            scores = np.where(self._filter_mask(filter), scores, -np.inf)
+
+        k = min(top_k, self.count)
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            VectorMatch(
+                id=str(self.ids[i]),
+                score=float(scores[i]),
+                metadata={"id": str(self.ids[i]), **{name: str(col[i]) for name, col in self.metadata.items()}},
+            )
+            for i in top
+            if np.isfinite(scores[i])
+        ]
+
+    async def aquery(self, vector: list[float], top_k: int = 5, filter: dict[str, Any] | None = None) -> list[VectorMatch]:
+        """비동기 검색 (행렬 연산을 스레드에서 실행하여 이벤트 루프를 막지 않음)"""
+        return await asyncio.to_thread(self.query, vector, top_k, filter)
+
+    @staticmethod
+    def write(
+        directory: str | Path,
+        ids: list[str],
+        vectors: list[list[float]] | np.ndarray,
+        metadatas: list[dict[str, Any]],
+    ) -> Path:
+        """로컬 벡터 스토어 파일 생성 (정규화 후 저장)
+
+        Args:
+            directory: 저장 디렉토리
+            ids: 문서 ID 리스트
+            vectors: 임베딩 행렬
+            metadatas: 문서별 메타데이터 (METADATA_FIELDS 사용)
+
+        Returns:
+            저장된 디렉토리 경로
+
+        Raises:
+            ValueError: 문서가 없거나 ids / vectors / metadatas 길이가 다른 경우
+                (차원을 알 수 없고 빈 파일은 memmap으로 열 수 없으므로 빈 스토어는 만들지 않음)
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] == 0:
+            raise ValueError(f"로컬 벡터 스토어에 저장할 벡터가 없습니다 (shape={matrix.shape})")
+        if not (len(ids) == len(metadatas) == matrix.shape[0]):
+            raise ValueError(f"ids({len(ids)}) / vectors({matrix.shape[0]}) / metadatas({len(metadatas)}) 길이가 다릅니다")
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix = matrix / norms
+
+        # 임시 파일에 쓴 뒤 교체 (읽는 중인 프로세스 보호)
+        tmp_path = directory / "vectors.f32.tmp"
+        out = np.memmap(tmp_path, dtype=np.float32, mode="w+", shape=matrix.shape)
+        out[:] = matrix
+        out.flush()
+        del out
+        os.replace(tmp_path, directory / "vectors.f32")
+
+        columns = {name: np.array([str(m.get(name, "")) for m in metadatas]) for name in METADATA_FIELDS}
+        np.savez(directory / "metadata.npz", id=np.array([str(i) for i in ids]), **columns)  # type: ignore
+
+        manifest = {"dim": int(matrix.shape[1]), "count": int(matrix.shape[0]), "fields": list(METADATA_FIELDS)}
+        (directory / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+
+        print(f"✅ 로컬 벡터 스토어 저장: {directory} ({matrix.shape[0]:,} x {matrix.shape[1]})")
+        return directory